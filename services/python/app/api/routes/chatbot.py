@@ -4,7 +4,6 @@ from typing import Any, Dict, List, Optional
 from dependency_injector.wiring import inject
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import JSONResponse
-from jinja2 import Template
 from pydantic import BaseModel
 
 from app.config.configuration_service import ConfigurationService
@@ -12,7 +11,7 @@ from app.config.utils.named_constants.arangodb_constants import (
     AccountType,
     CollectionNames,
 )
-from app.modules.qna.prompt_templates import qna_prompt
+from app.modules.qna.prompt_templates import render_qna_prompt
 from app.modules.reranker.reranker import RerankerService
 from app.modules.retrieval.retrieval_arango import ArangoService
 from app.modules.retrieval.retrieval_service import RetrievalService
@@ -220,13 +219,7 @@ async def askAI(
         else:
             user_data = ""
 
-        template = Template(qna_prompt)
-        rendered_form = template.render(
-            user_data=user_data,
-            query=query_info.query,
-            rephrased_queries=[],  # This keeps all query results for reference
-            chunks=final_results,
-        )
+        rendered_form = render_qna_prompt(user_data, query_info.query, final_results)
 
         messages = [
             {
@@ -1,4 +1,5 @@
 # src/config/configuration_service.py
+import asyncio
 import hashlib
 import json
 import os
@@ -378,3 +379,7 @@ class ConfigurationService:
             self.logger.error("❌ Failed to get config %s: %s", key, str(e))
             self.logger.exception("Detailed error:")
             return default
+
+    async def get_configs(self, *keys: str) -> list:
+        """Get several configuration values, fetching the uncached ones concurrently"""
+        return await asyncio.gather(*(self.get_config(key) for key in keys))
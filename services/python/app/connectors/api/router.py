@@ -5,10 +5,11 @@ import json
 import os
 import tempfile
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import google.oauth2.credentials
 import jwt
+import orjson
 from dependency_injector.wiring import Provide, inject
 from fastapi import (
     APIRouter,
@@ -49,6 +50,25 @@ logger = create_logger("connector_service")
 
 router = APIRouter()
 
+# Parsed service account credentials keyed by (org_id, private_key_id, scopes).
+# Parsing the private key is the expensive part; per-user credentials are
+# derived from the cached base credentials with with_subject.
+_service_account_credentials: Dict[Tuple, service_account.Credentials] = {}
+
+
+def get_base_service_account_credentials(
+    org_id: str, credentials_json: dict, scopes: list
+) -> service_account.Credentials:
+    """Return cached service account credentials for an org, parsing them once"""
+    cache_key = (org_id, credentials_json.get("private_key_id"), tuple(scopes))
+    credentials = _service_account_credentials.get(cache_key)
+    if credentials is None:
+        credentials = service_account.Credentials.from_service_account_info(
+            credentials_json, scopes=scopes
+        )
+        _service_account_credentials[cache_key] = credentials
+    return credentials
+
 
 async def get_drive_webhook_handler(request: Request) -> Optional[Any]:
     try:
@@ -289,8 +309,8 @@ async def download_file(
             SCOPES = GOOGLE_CONNECTOR_ENTERPRISE_SCOPES
 
             credentials_json = await google_token_handler.get_enterprise_token(org_id)
-            credentials = service_account.Credentials.from_service_account_info(
-                credentials_json, scopes=SCOPES
+            credentials = get_base_service_account_credentials(
+                org_id, credentials_json, SCOPES
             )
             user = await arango_service.get_user_by_user_id(user_id)
 
@@ -400,7 +420,7 @@ async def download_file(
                     result = await google_slides_parser.process_presentation(file_id)
 
                     # Convert result to JSON and return as StreamingResponse
-                    json_data = json.dumps(result).encode("utf-8")
+                    json_data = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
                     return StreamingResponse(
                         iter([json_data]), media_type="application/json"
                     )
@@ -422,7 +442,7 @@ async def download_file(
                     }
 
                     # Convert result to JSON and return as StreamingResponse
-                    json_data = json.dumps(result).encode("utf-8")
+                    json_data = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
                     return StreamingResponse(
                         iter([json_data]), media_type="application/json"
                     )
@@ -459,7 +479,7 @@ async def download_file(
                     }
 
                     # Convert result to JSON and return as StreamingResponse
-                    json_data = json.dumps(result).encode("utf-8")
+                    json_data = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
                     logger.info("Streaming Google Sheets result")
                     return StreamingResponse(
                         iter([json_data]), media_type="application/json"
@@ -757,8 +777,8 @@ async def stream_record(
             SCOPES = GOOGLE_CONNECTOR_ENTERPRISE_SCOPES
 
             credentials_json = await google_token_handler.get_enterprise_token(org_id)
-            credentials = service_account.Credentials.from_service_account_info(
-                credentials_json, scopes=SCOPES
+            credentials = get_base_service_account_credentials(
+                org_id, credentials_json, SCOPES
             )
             user = await arango_service.get_user_by_user_id(user_id)
 
@@ -165,6 +165,12 @@ class BaseArangoService:
                                 f"Failed to update schema for {collection_name}: {str(e)}"
                             )
 
+                # Records are looked up by external id in bulk during syncs;
+                # creating an index that already exists is a no-op
+                self._collections[CollectionNames.RECORDS.value].add_index(
+                    {"type": "persistent", "fields": ["externalRecordId"]}
+                )
+
                 # Create the permissions graph if it doesn't exist
                 if not self.db.has_graph(CollectionNames.FILE_ACCESS_GRAPH.value):
                     self.logger.info("🚀 Creating file access graph...")
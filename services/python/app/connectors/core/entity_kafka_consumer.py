@@ -4,6 +4,7 @@ import time
 from typing import Dict, List
 from uuid import uuid4
 
+import orjson
 from confluent_kafka import Consumer, KafkaError, Producer
 from dependency_injector.wiring import inject
 
@@ -217,13 +218,10 @@ class EntityKafkaRouteConsumer:
                 'timestamp': get_epoch_timestamp_in_ms()
             }
 
-            # Convert message to JSON string
-            message_str = json.dumps(message)
-
-            # Send the message to sync-events topic
+            # Send the message to sync-events topic, encoded straight to bytes
             self.producer.produce(
                 'sync-events',
-                value=message_str,
+                value=orjson.dumps(message),
                 callback=lambda err, msg: self.logger.error(f"Failed to deliver message: {err}") if err else None
             )
 
@@ -1,6 +1,6 @@
 import asyncio
-import json
 
+import orjson
 from confluent_kafka import Producer
 
 from app.config.configuration_service import ConfigurationService, config_node_constants
@@ -12,6 +12,7 @@ class KafkaService:
     def __init__(self, config: ConfigurationService, logger):
         self.config_service = config
         self.producer = None
+        self._producer_config = None
         self.logger = logger
 
     def delivery_report(self, err, msg):
@@ -19,73 +20,114 @@ class KafkaService:
         if err is not None:
             self.logger.error("❌ Delivery failed for record %s: %s", msg.key(), err)
         else:
-            self.logger.info(
+            self.logger.debug(
                 "✅ Record %s successfully produced to %s [%s]",
                 msg.key(),
                 msg.topic(),
                 msg.partition(),
             )
 
+    @staticmethod
+    def _format_event(event_data):
+        """Standardize event format"""
+        return {
+            "eventType": event_data.get("eventType", EventTypes.NEW_RECORD.value),
+            "timestamp": get_epoch_timestamp_in_ms(),
+            "payload": {
+                "orgId": event_data.get("orgId"),
+                "recordId": event_data.get("recordId"),
+                "virtualRecordId": event_data.get("virtualRecordId", None),
+                "recordName": event_data.get("recordName"),
+                "recordType": event_data.get("recordType"),
+                "version": event_data.get("recordVersion", 0),
+                "signedUrlRoute": event_data.get("signedUrlRoute"),
+                "connectorName": event_data.get("connectorName"),
+                "origin": event_data.get("origin"),
+                "extension": event_data.get("extension"),
+                "mimeType": event_data.get("mimeType"),
+                "body": event_data.get("body"),
+                "createdAtTimestamp": event_data.get("createdAtSourceTimestamp"),
+                "updatedAtTimestamp": event_data.get("modifiedAtSourceTimestamp"),
+                "sourceCreatedAtTimestamp": event_data.get("createdAtSourceTimestamp"),
+            },
+        }
+
+    async def _get_producer(self):
+        """Return the producer, creating it when missing or when the config changed"""
+        kafka_config = await self.config_service.get_config(
+            config_node_constants.KAFKA.value
+        )
+        if not isinstance(kafka_config, dict):
+            raise ValueError("Kafka configuration must be a dictionary")
+
+        brokers = kafka_config.get("brokers", "localhost:9092")
+        if isinstance(brokers, list):
+            brokers = ",".join(brokers)
+        elif (
+            isinstance(brokers, str)
+            and brokers.startswith("[")
+            and brokers.endswith("]")
+        ):
+            brokers = brokers.strip("[]").replace("'", "").replace('"', "").strip()
+
+        producer_config = {
+            "bootstrap.servers": brokers,
+            "client.id": kafka_config.get("client_id", "file-processor"),
+            # Give the producer a moment to coalesce events into fewer requests,
+            # and let those batches grow and be compressed; sync events repeat
+            # most of their fields
+            "linger.ms": 20,
+            "batch.size": 65536,
+            # Compression is set per producer batch, so it does not affect the
+            # Node services that also produce to record-events. The topic's
+            # only consumer is the indexing consumer, which is librdkafka and
+            # reads lz4
+            "compression.type": "lz4",
+            # Retried batches must not deliver an indexing event twice, a
+            # duplicate makes the indexer process the record again
+            "enable.idempotence": True,
+        }
+        if self.producer is None or producer_config != self._producer_config:
+            if self.producer is not None:
+                await asyncio.to_thread(self.producer.flush)
+            self.producer = Producer(producer_config)
+            self._producer_config = producer_config
+        return self.producer
+
+    async def _produce(self, producer, event_data):
+        """Queue an event on the producer without waiting for delivery"""
+        formatted_event = self._format_event(event_data)
+        kwargs = {
+            "topic": "record-events",
+            "key": str(formatted_event["payload"]["recordId"]),
+            # orjson encodes straight to bytes, which the producer sends as is
+            "value": orjson.dumps(formatted_event),
+            "callback": self.delivery_report,
+        }
+        try:
+            producer.produce(**kwargs)
+        except BufferError:
+            # Local queue is full, wait for in-flight events and retry once
+            await asyncio.to_thread(producer.flush)
+            producer.produce(**kwargs)
+
     async def send_event_to_kafka(self, event_data):
         """
         Send an event to Kafka.
         :param event_data: Dictionary containing file processing details
         """
-        try:
-            kafka_config = await self.config_service.get_config(
-                config_node_constants.KAFKA.value
-            )
-            if not isinstance(kafka_config, dict):
-                raise ValueError("Kafka configuration must be a dictionary")
-
-            # Standardize event format
-            formatted_event = {
-                "eventType": event_data.get("eventType", EventTypes.NEW_RECORD.value),
-                "timestamp": get_epoch_timestamp_in_ms(),
-                "payload": {
-                    "orgId": event_data.get("orgId"),
-                    "recordId": event_data.get("recordId"),
-                    "virtualRecordId": event_data.get("virtualRecordId", None),
-                    "recordName": event_data.get("recordName"),
-                    "recordType": event_data.get("recordType"),
-                    "version": event_data.get("recordVersion", 0),
-                    "signedUrlRoute": event_data.get("signedUrlRoute"),
-                    "connectorName": event_data.get("connectorName"),
-                    "origin": event_data.get("origin"),
-                    "extension": event_data.get("extension"),
-                    "mimeType": event_data.get("mimeType"),
-                    "body": event_data.get("body"),
-                    "createdAtTimestamp": event_data.get("createdAtSourceTimestamp"),
-                    "updatedAtTimestamp": event_data.get("modifiedAtSourceTimestamp"),
-                    "sourceCreatedAtTimestamp": event_data.get(
-                        "createdAtSourceTimestamp"
-                    ),
-                },
-            }
+        return await self.send_events_to_kafka([event_data])
 
-            brokers = kafka_config.get("brokers", "localhost:9092")
-            if isinstance(brokers, list):
-                brokers = ",".join(brokers)
-            elif (
-                isinstance(brokers, str)
-                and brokers.startswith("[")
-                and brokers.endswith("]")
-            ):
-                brokers = brokers.strip("[]").replace("'", "").replace('"', "").strip()
-
-            producer_config = {
-                "bootstrap.servers": brokers,
-                "client.id": kafka_config.get("client_id", "file-processor"),
-            }
-            self.producer = Producer(producer_config)
-            self.producer.produce(
-                topic="record-events",
-                key=str(formatted_event["payload"]["recordId"]),
-                # Properly serialize to JSON
-                value=json.dumps(formatted_event),
-                callback=self.delivery_report,
-            )
-            await asyncio.to_thread(self.producer.flush)
+    async def send_events_to_kafka(self, events):
+        """
+        Send several events to Kafka, waiting for delivery once for all of them.
+        :param events: List of dictionaries containing file processing details
+        """
+        try:
+            producer = await self._get_producer()
+            for event_data in events:
+                await self._produce(producer, event_data)
+            await asyncio.to_thread(producer.flush)
             return True
         except Exception as e:
             self.logger.error("❌ Failed to send event to Kafka: %s", str(e))
@@ -1,8 +1,8 @@
-from typing import Dict, List, Optional
+import asyncio
+from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from app.config.configuration_service import (
@@ -14,6 +14,8 @@ from app.config.utils.named_constants.arangodb_constants import CollectionNames
 from app.connectors.google.gcal.core.gcal_user_service import GCalUserService
 from app.connectors.google.gmail.core.gmail_user_service import GmailUserService
 from app.connectors.google.google_drive.core.drive_user_service import DriveUserService
+from app.connectors.google.helpers.discovery import build_service
+from app.connectors.google.helpers.request_execution import execute_in_thread
 from app.connectors.google.scopes import (
     GOOGLE_CONNECTOR_ENTERPRISE_SCOPES,
     GOOGLE_PARSER_SCOPES,
@@ -33,8 +35,41 @@ from app.exceptions.connector_google_exceptions import (
 from app.modules.parsers.google_files.parser_user_service import ParserUserService
 from app.utils.time_conversion import get_epoch_timestamp_in_ms, parse_timestamp
 
+# Constant request parameters for the Directory API list endpoints. Fields are
+# limited to what the mappers read, and page sizes are the API maximums.
+USERS_LIST_PARAMS = {
+    "customer": "my_customer",
+    "orderBy": "email",
+    "fields": "nextPageToken,users(id,primaryEmail,name,phones,suspended,creationTime)",
+    "maxResults": 500,
+}
+GROUPS_LIST_PARAMS = {
+    "customer": "my_customer",
+    "fields": "nextPageToken,groups(id,name,email,description,adminCreated)",
+    "maxResults": 200,
+}
+DOMAINS_LIST_PARAMS = {
+    "customer": "my_customer",
+    "fields": "domains(domainName,verified,isPrimary,creationTime)",
+}
+MEMBERS_LIST_PARAMS = {
+    "fields": "nextPageToken,members(email,role,type,status)",
+    "maxResults": 200,
+}
+
 
 class GoogleAdminService:
+    # Maximum number of sub-requests Google accepts in a single batch request
+    BATCH_REQUEST_LIMIT = 100
+    # Maximum number of paginated group member listings run at the same time
+    MAX_CONCURRENT_MEMBER_LISTINGS = 10
+
+    # Delegated admin credentials and clients shared by every instance in the
+    # process, keyed by (org_id, private_key_id, admin_email). The Drive, Gmail
+    # and admin-watch services each hold their own instance, and user/group
+    # lookups reconnect on every call.
+    _admin_clients: Dict[Tuple[str, str, str], Tuple] = {}
+
     def __init__(
         self,
         logger,
@@ -42,6 +77,7 @@ class GoogleAdminService:
         rate_limiter: GoogleAPIRateLimiter,
         google_token_handler,
         arango_service,
+        max_concurrent_user_services: int = 16,
     ):
         self.logger = logger
         self.config_service = config
@@ -52,6 +88,14 @@ class GoogleAdminService:
         self.admin_reports_service = None
         self.admin_directory_service = None
         self.credentials = None
+        # Bounds concurrent per-user service creation so callers can fan out
+        # with asyncio.gather without exceeding Google's connection limits
+        self._user_service_semaphore = asyncio.Semaphore(max_concurrent_user_services)
+        # Connected Gmail user services, reused across calls for the same user
+        self._gmail_user_services: Dict[str, GmailUserService] = {}
+        # Connected Drive user services, reused so repeat syncs of a user keep
+        # the same credentials and the HTTP connections bound to them
+        self._drive_user_services: Dict[str, DriveUserService] = {}
 
     async def connect_admin(self, org_id: str) -> bool:
         """Initialize admin service with domain-wide delegation"""
@@ -82,6 +126,16 @@ class GoogleAdminService:
                     details={"org_id": org_id, "error": str(e)},
                 )
 
+            cache_key = (org_id, credentials_json.get("private_key_id"), admin_email)
+            cached_clients = self._admin_clients.get(cache_key)
+            if cached_clients is not None:
+                (
+                    self.credentials,
+                    self.admin_reports_service,
+                    self.admin_directory_service,
+                ) = cached_clients
+                return True
+
             try:
                 self.credentials = (
                     service_account.Credentials.from_service_account_info(
@@ -99,17 +153,11 @@ class GoogleAdminService:
                 )
 
             try:
-                self.admin_reports_service = build(
-                    "admin",
-                    "reports_v1",
-                    credentials=self.credentials,
-                    cache_discovery=False,
-                )
-                self.admin_directory_service = build(
-                    "admin",
-                    "directory_v1",
-                    credentials=self.credentials,
-                    cache_discovery=False,
+                self.admin_reports_service = build_service(
+                    "admin", "reports_v1", self.credentials
+                )
+                self.admin_directory_service = build_service(
+                    "admin", "directory_v1", self.credentials
                 )
             except Exception as e:
                 raise AdminServiceError(
@@ -117,6 +165,12 @@ class GoogleAdminService:
                     details={"org_id": org_id, "error": str(e)},
                 )
 
+            self._admin_clients[cache_key] = (
+                self.credentials,
+                self.admin_reports_service,
+                self.admin_directory_service,
+            )
+
             return True
 
         except (AdminAuthError, AdminDelegationError, AdminServiceError):
@@ -138,17 +192,10 @@ class GoogleAdminService:
 
             while True:
                 try:
-                    async with self.google_limiter:
-                        results = (
-                            self.admin_directory_service.users()
-                            .list(
-                                customer="my_customer",
-                                orderBy="email",
-                                projection="full",
-                                pageToken=page_token,
-                            )
-                            .execute()
-                        )
+                    results = await self._execute_request(
+                        self.admin_directory_service.users()
+                        .list(pageToken=page_token, **USERS_LIST_PARAMS)
+                    )
                 except HttpError as e:
                     if e.resp.status == 403:
                         raise AdminAuthError(
@@ -170,35 +217,23 @@ class GoogleAdminService:
                 for user in current_users:
                     if not user.get("suspended", False):
                         try:
+                            name = user.get("name", {})
+                            created_at = int(parse_timestamp(user.get("creationTime")))
                             users.append(
                                 {
                                     "_key": str(uuid4()),
                                     "userId": str(uuid4()),
                                     "orgId": org_id,
                                     "email": user.get("primaryEmail"),
-                                    "fullName": user.get("name", {}).get("fullName"),
-                                    "firstName": user.get("name", {}).get(
-                                        "givenName", ""
-                                    ),
-                                    "middleName": user.get("name", {}).get(
-                                        "middleName", ""
-                                    ),
-                                    "lastName": user.get("name", {}).get(
-                                        "familyName", ""
-                                    ),
+                                    "fullName": name.get("fullName"),
+                                    "firstName": name.get("givenName", ""),
+                                    "middleName": name.get("middleName", ""),
+                                    "lastName": name.get("familyName", ""),
                                     "designation": user.get("designation", "user"),
                                     "businessPhones": user.get("phones", []),
                                     "isActive": user.get("isActive", False),
-                                    "createdAtTimestamp": int(
-                                        parse_timestamp(
-                                            user.get("creationTime")
-                                        )
-                                    ),
-                                    "updatedAtTimestamp": int(
-                                        parse_timestamp(
-                                            user.get("creationTime")
-                                        )
-                                    ),
+                                    "createdAtTimestamp": created_at,
+                                    "updatedAtTimestamp": created_at,
                                 }
                             )
                         except Exception as e:
@@ -238,12 +273,10 @@ class GoogleAdminService:
 
             while True:
                 try:
-                    async with self.google_limiter:
-                        results = (
-                            self.admin_directory_service.groups()
-                            .list(customer="my_customer", pageToken=page_token)
-                            .execute()
-                        )
+                    results = await self._execute_request(
+                        self.admin_directory_service.groups()
+                        .list(pageToken=page_token, **GROUPS_LIST_PARAMS)
+                    )
                 except Exception as e:
                     if "quota" in str(e).lower():
                         raise AdminQuotaError(
@@ -262,19 +295,17 @@ class GoogleAdminService:
                     )
 
                 groups.extend(
-                    [
-                        {
-                            "_key": group.get("id"),
-                            "groupId": group.get("id"),
-                            "orgId": org_id,
-                            "groupName": group.get("name"),
-                            "email": group.get("email"),
-                            "description": group.get("description", ""),
-                            "adminCreated": group.get("adminCreated", False),
-                            "createdAt": group.get("creationTime"),
-                        }
-                        for group in current_groups
-                    ]
+                    {
+                        "_key": group.get("id"),
+                        "groupId": group.get("id"),
+                        "orgId": org_id,
+                        "groupName": group.get("name"),
+                        "email": group.get("email"),
+                        "description": group.get("description", ""),
+                        "adminCreated": group.get("adminCreated", False),
+                        "createdAt": group.get("creationTime"),
+                    }
+                    for group in current_groups
                 )
 
                 page_token = results.get("nextPageToken")
@@ -297,37 +328,22 @@ class GoogleAdminService:
         """List all domains for the enterprise"""
         try:
             self.logger.info("🚀 Listing domains")
-            domains = []
-            page_token = None
-
-            while True:
-                async with self.google_limiter:
-                    results = (
-                        self.admin_directory_service.domains()
-                        .list(
-                            customer="my_customer",
-                        )
-                        .execute()
-                    )
-
-                    current_domains = results.get("domains", [])
-
-                    domains.extend(
-                        [
-                            {
-                                "_key": f"gdr_domain_{domain.get('domainName')}",
-                                "domainName": domain.get("domainName"),
-                                "verified": domain.get("verified", False),
-                                "isPrimary": domain.get("isPrimary", False),
-                                "createdAt": domain.get("creationTime"),
-                            }
-                            for domain in current_domains
-                        ]
-                    )
+            # domains.list is not paginated, so a single request returns them all
+            results = await self._execute_request(
+                self.admin_directory_service.domains()
+                .list(**DOMAINS_LIST_PARAMS)
+            )
 
-                    page_token = results.get("nextPageToken")
-                    if not page_token:
-                        break
+            domains = [
+                {
+                    "_key": f"gdr_domain_{domain.get('domainName')}",
+                    "domainName": domain.get("domainName"),
+                    "verified": domain.get("verified", False),
+                    "isPrimary": domain.get("isPrimary", False),
+                    "createdAt": domain.get("creationTime"),
+                }
+                for domain in results.get("domains", [])
+            ]
 
             self.logger.info("✅ Found %s domains", len(domains))
             return domains
@@ -346,12 +362,14 @@ class GoogleAdminService:
 
             while True:
                 try:
-                    async with self.google_limiter:
-                        results = (
-                            self.admin_directory_service.members()
-                            .list(groupKey=group_email, pageToken=page_token)
-                            .execute()
+                    results = await self._execute_request(
+                        self.admin_directory_service.members()
+                        .list(
+                            groupKey=group_email,
+                            pageToken=page_token,
+                            **MEMBERS_LIST_PARAMS,
                         )
+                    )
                 except Exception as e:
                     if "quota" in str(e).lower():
                         raise AdminQuotaError(
@@ -370,17 +388,7 @@ class GoogleAdminService:
                         details={"group_email": group_email, "results": results},
                     )
 
-                members.extend(
-                    [
-                        {
-                            "email": member.get("email"),
-                            "role": member.get("role", "member").lower(),
-                            "type": member.get("type"),
-                            "status": member.get("status", "active"),
-                        }
-                        for member in current_members
-                    ]
-                )
+                members.extend(map(self._format_member, current_members))
 
                 page_token = results.get("nextPageToken")
                 if not page_token:
@@ -397,6 +405,109 @@ class GoogleAdminService:
                 details={"group_email": group_email, "error": str(e)},
             )
 
+    async def _execute_request(self, request):
+        """Execute a Google API request under the shared rate limiter
+
+        Applies the adaptive backoff kept by GoogleAPIRateLimiter: 429 responses
+        raise the shared delay and successful calls gradually lower it. The
+        blocking HTTP call runs in a worker thread to keep the event loop free.
+        """
+        await self.rate_limiter.wait_for_backoff()
+        async with self.google_limiter:
+            try:
+                response = await execute_in_thread(request)
+            except HttpError as e:
+                if e.resp.status == 429:
+                    self.rate_limiter.record_rate_limited()
+                raise
+        self.rate_limiter.record_success()
+        return response
+
+    @staticmethod
+    def _format_member(member: Dict) -> Dict:
+        """Map an Admin SDK member resource to the fields stored for a group member"""
+        return {
+            "email": member.get("email"),
+            "role": member.get("role", "member").lower(),
+            "type": member.get("type"),
+            "status": member.get("status", "active"),
+        }
+
+    async def batch_list_group_members(
+        self, group_emails: List[str]
+    ) -> Dict[str, List[Dict]]:
+        """List members of many groups using Admin SDK batch requests
+
+        The first page of every group is fetched through batch requests of up to
+        100 sub-requests each. Groups whose member list spans more pages, or
+        whose batched sub-request failed, fall back to list_group_members.
+
+        Returns:
+            Dict mapping group email to its list of members. Groups that could
+            not be listed are omitted.
+        """
+        try:
+            self.logger.info(
+                "🚀 Batch listing members for %s groups", len(group_emails)
+            )
+            members_by_group = {}
+            pending_groups = []
+
+            def members_callback(request_id, response, exception):
+                if exception is not None or response.get("nextPageToken"):
+                    pending_groups.append(request_id)
+                    return
+                members_by_group[request_id] = [
+                    self._format_member(member)
+                    for member in response.get("members", [])
+                ]
+
+            for i in range(0, len(group_emails), self.BATCH_REQUEST_LIMIT):
+                batch = self.admin_directory_service.new_batch_http_request()
+                for group_email in group_emails[i : i + self.BATCH_REQUEST_LIMIT]:
+                    batch.add(
+                        self.admin_directory_service.members().list(
+                            groupKey=group_email, **MEMBERS_LIST_PARAMS
+                        ),
+                        callback=members_callback,
+                        request_id=group_email,
+                    )
+
+                await self.rate_limiter.wait_for_backoff()
+                async with self.google_limiter:
+                    await execute_in_thread(batch)
+
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_MEMBER_LISTINGS)
+
+            async def list_members(group_email):
+                async with semaphore:
+                    return await self.list_group_members(group_email)
+
+            results = await asyncio.gather(
+                *(list_members(group_email) for group_email in pending_groups),
+                return_exceptions=True,
+            )
+            for group_email, result in zip(pending_groups, results):
+                if isinstance(result, Exception):
+                    self.logger.error(
+                        "❌ Error fetching group members for group %s: %s",
+                        group_email,
+                        str(result),
+                    )
+                    continue
+                members_by_group[group_email] = result
+
+            self.logger.info(
+                "✅ Listed members for %s groups", len(members_by_group)
+            )
+            return members_by_group
+
+        except Exception as e:
+            raise AdminServiceError(
+                "Unexpected error while batch listing group members: " + str(e),
+                details={"group_count": len(group_emails), "error": str(e)},
+            )
+
     async def handle_new_user(self, org_id: str, user_email: str):
         """Handle new user creation event"""
         try:
@@ -505,12 +616,10 @@ class GoogleAdminService:
 
             # AQL query to delete group and all its associated edges
             query = f"""
-            LET group = DOCUMENT({CollectionNames.GROUPS.value}, '{group_key}')
-
             // Delete the group document and return the deleted document
             LET deleted_group = (
                 FOR doc IN {CollectionNames.GROUPS.value}
-                FILTER doc._key == '{group_key}'
+                FILTER doc._key == @group_key
                 REMOVE doc IN {CollectionNames.GROUPS.value}
                 RETURN OLD
             )
@@ -520,7 +629,9 @@ class GoogleAdminService:
             }}
             """
 
-            cursor = self.arango_service.db.aql.execute(query)
+            cursor = self.arango_service.db.aql.execute(
+                query, bind_vars={"group_key": group_key}
+            )
             cursor.next()
             self.logger.info(
                 f"Successfully deleted group {group_email} and its associated edges"
@@ -591,8 +702,8 @@ class GoogleAdminService:
 
             # Query to delete both membership and belongs_to edges
             query = f"""
-            LET user_id = CONCAT({CollectionNames.USERS.value}, '/', '{user_key}')
-            LET group_id = CONCAT({CollectionNames.GROUPS.value}, '/', '{group_key}')
+            LET user_id = CONCAT('{CollectionNames.USERS.value}', '/', @user_key)
+            LET group_id = CONCAT('{CollectionNames.GROUPS.value}', '/', @group_key)
 
             // Delete belongs_to edge
             LET deleted_belongs = (
@@ -609,7 +720,9 @@ class GoogleAdminService:
             }}
             """
 
-            cursor = self.arango_service.db.aql.execute(query)
+            cursor = self.arango_service.db.aql.execute(
+                query, bind_vars={"user_key": user_key, "group_key": group_key}
+            )
             cursor.next()
             self.logger.info(
                 f"Successfully removed {user_email} from group {group_email}"
@@ -629,32 +742,30 @@ class GoogleAdminService:
                     details={"org_id": org_id},
                 )
 
-            async with self.google_limiter:
-                user_info = (
-                    self.admin_directory_service.users()
-                    .get(userKey=user_email)
-                    .execute()
-                )
-
-                return {
-                    "_key": str(uuid4()),
-                    "userId": str(uuid4()),
-                    "orgId": org_id,
-                    "email": user_info.get("primaryEmail"),
-                    "fullName": user_info.get("name", {}).get("fullName"),
-                    "firstName": user_info.get("name", {}).get("givenName", ""),
-                    "middleName": user_info.get("name", {}).get("middleName", ""),
-                    "lastName": user_info.get("name", {}).get("familyName", ""),
-                    "designation": user_info.get("designation", ""),
-                    "businessPhones": user_info.get("phones", []),
-                    "isActive": False,  # New users start as inactive
-                    "createdAtTimestamp": int(
-                        parse_timestamp(user_info.get("creationTime"))
-                    ),
-                    "updatedAtTimestamp": int(
-                        parse_timestamp(user_info.get("creationTime"))
-                    ),
-                }
+            user_info = await self._execute_request(
+                self.admin_directory_service.users()
+                .get(userKey=user_email)
+            )
+
+            return {
+                "_key": str(uuid4()),
+                "userId": str(uuid4()),
+                "orgId": org_id,
+                "email": user_info.get("primaryEmail"),
+                "fullName": user_info.get("name", {}).get("fullName"),
+                "firstName": user_info.get("name", {}).get("givenName", ""),
+                "middleName": user_info.get("name", {}).get("middleName", ""),
+                "lastName": user_info.get("name", {}).get("familyName", ""),
+                "designation": user_info.get("designation", ""),
+                "businessPhones": user_info.get("phones", []),
+                "isActive": False,  # New users start as inactive
+                "createdAtTimestamp": int(
+                    parse_timestamp(user_info.get("creationTime"))
+                ),
+                "updatedAtTimestamp": int(
+                    parse_timestamp(user_info.get("creationTime"))
+                ),
+            }
 
         except Exception as e:
             self.logger.error(f"Failed to get user info for {user_email}: {str(e)}")
@@ -670,23 +781,21 @@ class GoogleAdminService:
                     details={"org_id": org_id},
                 )
 
-            async with self.google_limiter:
-                group_info = (
-                    self.admin_directory_service.groups()
-                    .get(groupKey=group_email)
-                    .execute()
-                )
+            group_info = await self._execute_request(
+                self.admin_directory_service.groups()
+                .get(groupKey=group_email)
+            )
 
-                return {
-                    "_key": str(uuid4()),
-                    "groupId": str(uuid4()),
-                    "orgId": org_id,
-                    "email": group_info.get("email"),
-                    "name": group_info.get("name"),
-                    "description": group_info.get("description", ""),
-                    # 'createdAtTimestamp': int(parse_timestamp(group_info.get('creationTime')).timestamp()),
-                    # 'updatedAtTimestamp': int(datetime.now(timezone.utc).timestamp())
-                }
+            return {
+                "_key": str(uuid4()),
+                "groupId": str(uuid4()),
+                "orgId": org_id,
+                "email": group_info.get("email"),
+                "name": group_info.get("name"),
+                "description": group_info.get("description", ""),
+                # 'createdAtTimestamp': int(parse_timestamp(group_info.get('creationTime')).timestamp()),
+                # 'updatedAtTimestamp': int(datetime.now(timezone.utc).timestamp())
+            }
 
         except Exception as e:
             self.logger.error(f"Failed to get group info for {group_email}: {str(e)}")
@@ -748,18 +857,16 @@ class GoogleAdminService:
             self.logger.info(f"🔍 Creating admin watch for {org_id}")
 
             try:
-                async with self.google_limiter:
-                    response = (
-                        self.admin_reports_service.activities()
-                        .watch(
-                            userKey="all", applicationName="admin", body=channel_body
-                        )
-                        .execute()
+                response = await self._execute_request(
+                    self.admin_reports_service.activities()
+                    .watch(
+                        userKey="all", applicationName="admin", body=channel_body
                     )
-                    self.logger.debug(
-                        f"🔍 Admin watch created successfully for {org_id}"
-                    )
-                    return response
+                )
+                self.logger.debug(
+                    f"🔍 Admin watch created successfully for {org_id}"
+                )
+                return response
             except HttpError as http_err:
                 # Decode the error content if needed
                 error_details = http_err.content.decode("utf-8")
@@ -780,188 +887,215 @@ class GoogleAdminService:
         self, user_email: str
     ) -> Optional[DriveUserService]:
         """Get or create a DriveUserService for a specific user"""
-        try:
-            # Create delegated credentials for the user
+        async with self._user_service_semaphore:
+            user_service = self._drive_user_services.get(user_email)
+            if user_service is not None and user_service.service is not None:
+                return user_service
+
             try:
-                user_key = await self.arango_service.get_entity_id_by_email(user_email)
-                user = await self.arango_service.get_document(user_key, CollectionNames.USERS.value,)
-                if self.credentials is None:
-                    await self.connect_admin(user.get("orgId"))
-                user_credentials = self.credentials.with_subject(user_email)
-            except Exception as e:
-                raise AdminDelegationError(
-                    "Failed to create delegated credentials for user: " + str(e),
-                    details={"user_email": user_email, "error": str(e)},
-                )
+                # Create delegated credentials for the user
+                try:
+                    user_key = await self.arango_service.get_entity_id_by_email(user_email)
+                    user = await self.arango_service.get_document(user_key, CollectionNames.USERS.value,)
+                    if self.credentials is None:
+                        await self.connect_admin(user.get("orgId"))
+                    user_credentials = self.credentials.with_subject(user_email)
+                except Exception as e:
+                    raise AdminDelegationError(
+                        "Failed to create delegated credentials for user: " + str(e),
+                        details={"user_email": user_email, "error": str(e)},
+                    )
 
-            # Create new user service
-            user_service = DriveUserService(
-                logger=self.logger,
-                config=self.config_service,
-                rate_limiter=self.rate_limiter,
-                google_token_handler=self.google_token_handler,
-                credentials=user_credentials,
-            )
+                # Create new user service
+                user_service = DriveUserService(
+                    logger=self.logger,
+                    config=self.config_service,
+                    rate_limiter=self.rate_limiter,
+                    google_token_handler=self.google_token_handler,
+                    credentials=user_credentials,
+                )
 
-            # Connect the user service
-            try:
-                org_id = user.get("orgId")
-                user_id = user.get("userId")
-                if not await user_service.connect_enterprise_user(org_id, user_id):
+                # Connect the user service
+                try:
+                    org_id = user.get("orgId")
+                    user_id = user.get("userId")
+                    if not await user_service.connect_enterprise_user(org_id, user_id):
+                        raise UserOperationError(
+                            "Failed to connect user service",
+                            details={"user_email": user_email},
+                        )
+                except Exception as e:
                     raise UserOperationError(
-                        "Failed to connect user service",
-                        details={"user_email": user_email},
+                        "Error connecting user service: " + str(e),
+                        details={"user_email": user_email, "error": str(e)},
                     )
+
+                self._drive_user_services[user_email] = user_service
+                return user_service
+
+            except (AdminDelegationError, UserOperationError):
+                raise
             except Exception as e:
-                raise UserOperationError(
-                    "Error connecting user service: " + str(e),
+                self.logger.error(
+                    f"❌ Failed to create user service for {user_email}: {str(e)}"
+                )
+                raise AdminServiceError(
+                    "Unexpected error creating user service: " + str(e),
                     details={"user_email": user_email, "error": str(e)},
                 )
 
-            return user_service
-
-        except (AdminDelegationError, UserOperationError):
-            raise
-        except Exception as e:
-            self.logger.error(
-                f"❌ Failed to create user service for {user_email}: {str(e)}"
-            )
-            raise AdminServiceError(
-                "Unexpected error creating user service: " + str(e),
-                details={"user_email": user_email, "error": str(e)},
-            )
-
     async def create_gmail_user_service(
         self, user_email: str
     ) -> Optional[GmailUserService]:
         """Get or create a GmailUserService for a specific user"""
-        try:
-            # Create delegated credentials for the user
+        async with self._user_service_semaphore:
+            user_service = self._gmail_user_services.get(user_email)
+            if user_service is not None and user_service.service is not None:
+                return user_service
+
             try:
-                user_key = await self.arango_service.get_entity_id_by_email(user_email)
-                user = await self.arango_service.get_document(user_key, CollectionNames.USERS.value)
-                if self.credentials is None:
-                    await self.connect_admin(user.get("orgId"))
-                user_credentials = self.credentials.with_subject(user_email)
-            except Exception as e:
-                raise AdminDelegationError(
-                    "Failed to create delegated credentials for user: " + str(e),
-                    details={"user_email": user_email, "error": str(e)},
-                )
+                # Create delegated credentials for the user
+                try:
+                    user_key = await self.arango_service.get_entity_id_by_email(user_email)
+                    user = await self.arango_service.get_document(user_key, CollectionNames.USERS.value)
+                    if self.credentials is None:
+                        await self.connect_admin(user.get("orgId"))
+                    user_credentials = self.credentials.with_subject(user_email)
+                except Exception as e:
+                    raise AdminDelegationError(
+                        "Failed to create delegated credentials for user: " + str(e),
+                        details={"user_email": user_email, "error": str(e)},
+                    )
 
-            # Create new user service
-            user_service = GmailUserService(
-                logger=self.logger,
-                config=self.config_service,
-                rate_limiter=self.rate_limiter,
-                google_token_handler=self.google_token_handler,
-                credentials=user_credentials,
-                admin_service=self,  # Pass the current GoogleAdminService instance
-            )
+                # Create new user service
+                user_service = GmailUserService(
+                    logger=self.logger,
+                    config=self.config_service,
+                    rate_limiter=self.rate_limiter,
+                    google_token_handler=self.google_token_handler,
+                    credentials=user_credentials,
+                    admin_service=self,  # Pass the current GoogleAdminService instance
+                )
 
-            # Connect the user service
-            try:
-                org_id = user.get("orgId")
-                user_id = user.get("userId")
-                if not await user_service.connect_enterprise_user(org_id, user_id):
+                # Connect the user service
+                try:
+                    org_id = user.get("orgId")
+                    user_id = user.get("userId")
+                    if not await user_service.connect_enterprise_user(org_id, user_id):
+                        raise UserOperationError(
+                            "Failed to connect user service",
+                            details={"user_email": user_email},
+                        )
+                except Exception as e:
                     raise UserOperationError(
-                        "Failed to connect user service",
-                        details={"user_email": user_email},
+                        "Error connecting user service",
+                        details={"user_email": user_email, "error": str(e)},
                     )
+
+                self._gmail_user_services[user_email] = user_service
+                return user_service
+
+            except (AdminDelegationError, UserOperationError):
+                raise
             except Exception as e:
-                raise UserOperationError(
-                    "Error connecting user service",
+                raise GoogleMailError(
+                    "Unexpected error creating user service: " + str(e),
                     details={"user_email": user_email, "error": str(e)},
                 )
 
-            return user_service
-
-        except (AdminDelegationError, UserOperationError):
-            raise
+    async def cleanup_user_service(self, user_email: str) -> bool:
+        """Disconnect and forget the cached GmailUserService for a user"""
+        user_service = self._gmail_user_services.pop(user_email, None)
+        if user_service is None:
+            return False
+        try:
+            return await user_service.disconnect()
         except Exception as e:
-            raise GoogleMailError(
-                "Unexpected error creating user service: " + str(e),
-                details={"user_email": user_email, "error": str(e)},
+            self.logger.warning(
+                "⚠️ Failed to disconnect user service for %s: %s", user_email, str(e)
             )
+            return False
 
     async def create_gcal_user_service(
         self, user_email: str
     ) -> Optional[GCalUserService]:
         """Get or create a GCalUserService for a specific user"""
-        try:
-            # Create delegated credentials for the user
+        async with self._user_service_semaphore:
             try:
-                user_key = await self.arango_service.get_entity_id_by_email(user_email)
-                user = await self.arango_service.get_document(user_key, CollectionNames.USERS.value)
-                if self.credentials is None:
-                    await self.connect_admin(user.get("orgId"))
-                user_credentials = self.credentials.with_subject(user_email)
-            except Exception as e:
-                raise AdminDelegationError(
-                    "Failed to create delegated credentials for user: " + str(e),
-                    details={"user_email": user_email, "error": str(e)},
-                )
+                # Create delegated credentials for the user
+                try:
+                    user_key = await self.arango_service.get_entity_id_by_email(user_email)
+                    user = await self.arango_service.get_document(user_key, CollectionNames.USERS.value)
+                    if self.credentials is None:
+                        await self.connect_admin(user.get("orgId"))
+                    user_credentials = self.credentials.with_subject(user_email)
+                except Exception as e:
+                    raise AdminDelegationError(
+                        "Failed to create delegated credentials for user: " + str(e),
+                        details={"user_email": user_email, "error": str(e)},
+                    )
 
-            # Create new user service
-            user_service = GCalUserService(
-                config=self.config_service,
-                rate_limiter=self.rate_limiter,
-                credentials=user_credentials,
-            )
+                # Create new user service
+                user_service = GCalUserService(
+                    config=self.config_service,
+                    rate_limiter=self.rate_limiter,
+                    credentials=user_credentials,
+                )
 
-            org_id = user.get("orgId")
-            user_id = user.get("userId")
-            if not await user_service.connect_enterprise_user(org_id, user_id):
-                return None
+                org_id = user.get("orgId")
+                user_id = user.get("userId")
+                if not await user_service.connect_enterprise_user(org_id, user_id):
+                    return None
 
-            return user_service
+                return user_service
 
-        except Exception as e:
-            self.logger.error(
-                f"❌ Failed to create user service for {user_email}: {str(e)}"
-            )
-            raise AdminServiceError(
-                "Unexpected error creating user service: " + str(e),
-                details={"user_email": user_email, "error": str(e)},
-            )
+            except Exception as e:
+                self.logger.error(
+                    f"❌ Failed to create user service for {user_email}: {str(e)}"
+                )
+                raise AdminServiceError(
+                    "Unexpected error creating user service: " + str(e),
+                    details={"user_email": user_email, "error": str(e)},
+                )
 
     async def create_parser_user_service(
         self, user_email: str
     ) -> Optional[ParserUserService]:
         """Create a ParserUserService for a specific user"""
-        try:
-            self.logger.info("🚀 Creating parser user service for %s", user_email)
+        async with self._user_service_semaphore:
             try:
-                user_key = await self.arango_service.get_entity_id_by_email(user_email)
-                user = await self.arango_service.get_document(user_key, CollectionNames.USERS.value)
-                if self.credentials is None:
-                    await self.connect_admin(user.get("orgId"))
-                user_credentials = self.credentials.with_subject(user_email)
-            except Exception as e:
-                raise AdminDelegationError(
-                    "Failed to create delegated credentials for user: " + str(e),
-                    details={"user_email": user_email, "error": str(e)},
+                self.logger.info("🚀 Creating parser user service for %s", user_email)
+                try:
+                    user_key = await self.arango_service.get_entity_id_by_email(user_email)
+                    user = await self.arango_service.get_document(user_key, CollectionNames.USERS.value)
+                    if self.credentials is None:
+                        await self.connect_admin(user.get("orgId"))
+                    user_credentials = self.credentials.with_subject(user_email)
+                except Exception as e:
+                    raise AdminDelegationError(
+                        "Failed to create delegated credentials for user: " + str(e),
+                        details={"user_email": user_email, "error": str(e)},
+                    )
+                # Create new user service
+                user_service = ParserUserService(
+                    logger=self.logger,
+                    config=self.config_service,
+                    rate_limiter=self.rate_limiter,
+                    google_token_handler=self.google_token_handler,
+                    credentials=user_credentials,
                 )
-            # Create new user service
-            user_service = ParserUserService(
-                logger=self.logger,
-                config=self.config_service,
-                rate_limiter=self.rate_limiter,
-                google_token_handler=self.google_token_handler,
-                credentials=user_credentials,
-            )
-            org_id = user.get("orgId")
-            user_id = user.get("userId")
-            if not await user_service.connect_enterprise_user(org_id, user_id):
-                return None
+                org_id = user.get("orgId")
+                user_id = user.get("userId")
+                if not await user_service.connect_enterprise_user(org_id, user_id):
+                    return None
 
-            return user_service
+                return user_service
 
-        except Exception as e:
-            self.logger.error(
-                f"❌ Failed to create user service for {user_email}: {str(e)}"
-            )
-            raise AdminServiceError(
-                "Unexpected error creating user service: " + str(e),
-                details={"user_email": user_email, "error": str(e)},
-            )
+            except Exception as e:
+                self.logger.error(
+                    f"❌ Failed to create user service for {user_email}: {str(e)}"
+                )
+                raise AdminServiceError(
+                    "Unexpected error creating user service: " + str(e),
+                    details={"user_email": user_email, "error": str(e)},
+                )
@@ -1,9 +1,11 @@
 """ArangoDB service for interacting with the database"""
 
+import asyncio
 import json
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from arango import ArangoClient
 from arango.database import TransactionDatabase
@@ -12,14 +14,22 @@ from app.config.configuration_service import ConfigurationService
 from app.config.utils.named_constants.arangodb_constants import (
     CollectionNames,
     Connectors,
+    ProgressStatus,
 )
 from app.connectors.core.base_arango_service import BaseArangoService
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
+# Kept as a fixed string so ArangoDB can reuse the cached plan and results
+_EXTERNAL_RECORD_KEYS_AQL = f"FOR record IN {CollectionNames.RECORDS.value} FILTER record.externalRecordId IN @external_record_ids RETURN {{ externalRecordId: record.externalRecordId, key: record._key }}"
+
 
 class ArangoService(BaseArangoService):
     """ArangoDB service class for interacting with the database"""
 
+    # Seconds a sync state read stays cached; writes through this service
+    # invalidate it right away
+    SYNC_STATE_CACHE_TTL = 30
+
     def __init__(
         self,
         logger,
@@ -31,6 +41,33 @@ class ArangoService(BaseArangoService):
         super().__init__(logger, arango_client, config)
         self.kafka_service = kafka_service
         self.logger = logger
+        # Account type by organization key; it is fixed when the org is created
+        self._account_types: Dict[str, str] = {}
+        # Found user and drive sync states with their expiry time
+        self._sync_states: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+
+    def _get_cached_sync_state(self, key: Tuple[str, ...]) -> Optional[Any]:
+        entry = self._sync_states.get(key)
+        if entry is None:
+            return None
+        expires_at, state = entry
+        if expires_at < time.monotonic():
+            del self._sync_states[key]
+            return None
+        # Callers may modify the state documents they get, keep the cached
+        # one intact; plain states such as drive states are immutable strings
+        return dict(state) if isinstance(state, dict) else state
+
+    def _cache_sync_state(self, key: Tuple[str, ...], state: Any) -> None:
+        self._sync_states[key] = (
+            time.monotonic() + self.SYNC_STATE_CACHE_TTL,
+            dict(state) if isinstance(state, dict) else state,
+        )
+
+    @staticmethod
+    async def _execute_aql(db, query: str, **kwargs) -> List:
+        """Run an AQL query in a worker thread and return all of its results"""
+        return await asyncio.to_thread(lambda: list(db.aql.execute(query, **kwargs)))
 
     async def store_page_token(
         self,
@@ -98,6 +135,54 @@ class ArangoService(BaseArangoService):
             self.logger.error("❌ Error storing page token: %s", str(e))
             return None
 
+    async def batch_store_page_tokens(self, page_tokens: List[Dict]) -> bool:
+        """
+        Store the page tokens of several users in one query
+
+        Args:
+            page_tokens (List[Dict]): Token documents with channelId, resourceId,
+                userEmail, token and expiration
+
+        Returns:
+            bool: True if the tokens were stored
+        """
+        try:
+            self.logger.info("🚀 Storing %d page tokens", len(page_tokens))
+
+            if not self.db.has_collection(CollectionNames.PAGE_TOKENS.value):
+                self.db.create_collection(CollectionNames.PAGE_TOKENS.value)
+
+            created_at = get_epoch_timestamp_in_ms()
+            token_docs = [
+                {**page_token, "createdAtTimestamp": created_at}
+                for page_token in page_tokens
+            ]
+
+            # Upsert to handle updates to existing channel tokens
+            query = """
+            FOR token_doc IN @token_docs
+                UPSERT { userEmail: token_doc.userEmail }
+                INSERT token_doc
+                UPDATE token_doc
+                IN @@pageTokens
+                RETURN NEW._key
+            """
+            await self._execute_aql(
+                self.db,
+                query,
+                bind_vars={
+                    "token_docs": token_docs,
+                    "@pageTokens": CollectionNames.PAGE_TOKENS.value,
+                },
+            )
+
+            self.logger.info("✅ Stored %d page tokens", len(token_docs))
+            return True
+
+        except Exception as e:
+            self.logger.error("❌ Error storing page tokens: %s", str(e))
+            return False
+
     async def get_page_token_db(
         self, channel_id: str = None, resource_id: str = None, user_email: str = None
     ) -> Optional[str]:
@@ -329,8 +414,7 @@ class ArangoService(BaseArangoService):
 
             db = transaction if transaction else self.db
 
-            cursor = db.aql.execute(batch_query, bind_vars=bind_vars)
-            results = list(cursor)
+            results = await self._execute_aql(db, batch_query, bind_vars=bind_vars)
             self.logger.info(
                 "✅ Successfully upserted %d nodes in collection '%s'.",
                 len(results),
@@ -366,8 +450,7 @@ class ArangoService(BaseArangoService):
 
             db = transaction if transaction else self.db
 
-            cursor = db.aql.execute(batch_query, bind_vars=bind_vars)
-            results = list(cursor)
+            results = await self._execute_aql(db, batch_query, bind_vars=bind_vars)
             self.logger.info(
                 "✅ Successfully created %d edges in collection '%s'.",
                 len(results),
@@ -378,6 +461,125 @@ class ArangoService(BaseArangoService):
             self.logger.error("❌ Batch edge creation failed: %s", str(e))
             return False
 
+    async def batch_upsert_multi(
+        self,
+        nodes: Dict[str, List[Dict]],
+        edges: Optional[Dict[str, List[Dict]]] = None,
+        inserts: Optional[Dict[str, List[Dict]]] = None,
+        transaction: Optional[TransactionDatabase] = None,
+    ):
+        """Batch upsert nodes and edges across several collections in one query
+
+        Nodes are matched on _key and edges on _from/_to, as in
+        batch_upsert_nodes and batch_create_edges. Documents in inserts are
+        known not to exist yet and are inserted without the UPSERT lookup.
+        Each collection may appear only once.
+        """
+        try:
+            writes = (
+                [
+                    (collection, docs, "{ _key: doc._key }")
+                    for collection, docs in nodes.items()
+                    if docs
+                ]
+                + [
+                    (collection, docs, "{ _from: doc._from, _to: doc._to }")
+                    for collection, docs in (edges or {}).items()
+                    if docs
+                ]
+                + [
+                    (collection, docs, None)
+                    for collection, docs in (inserts or {}).items()
+                    if docs
+                ]
+            )
+            if not writes:
+                return True
+
+            self.logger.info(
+                "🚀 Batch upserting into collections: %s",
+                ", ".join(collection for collection, _, _ in writes),
+            )
+
+            clauses = []
+            bind_vars = {}
+            for index, (collection, docs, match) in enumerate(writes):
+                if match:
+                    write = f"""UPSERT {match}
+                    INSERT doc
+                    UPDATE doc
+                    IN @@collection{index}"""
+                else:
+                    write = f"INSERT doc IN @@collection{index}"
+                clauses.append(
+                    f"""
+            LET write{index} = (
+                FOR doc IN @docs{index}
+                    {write}
+                    RETURN 1
+            )"""
+                )
+                bind_vars[f"docs{index}"] = docs
+                bind_vars[f"@collection{index}"] = collection
+
+            counts = ", ".join(
+                f"LENGTH(write{index})" for index in range(len(writes))
+            )
+            batch_query = "".join(clauses) + f"\n            RETURN [{counts}]"
+
+            db = transaction if transaction else self.db
+
+            results = await self._execute_aql(db, batch_query, bind_vars=bind_vars)
+            counts = results[0]
+            for (collection, _, _), count in zip(writes, counts):
+                self.logger.info(
+                    "✅ Successfully upserted %d documents in collection '%s'.",
+                    count,
+                    collection,
+                )
+            return True
+
+        except Exception as e:
+            self.logger.error("❌ Batch multi-collection upsert failed: %s", str(e))
+            if transaction:
+                raise
+            return False
+
+    async def touch_records(
+        self,
+        record_keys: List[str],
+        timestamp: int,
+        transaction: Optional[TransactionDatabase] = None,
+    ) -> bool:
+        """Set lastSyncTimestamp on existing records without rewriting them"""
+        try:
+            if not record_keys:
+                return True
+
+            self.logger.info("🚀 Touching %d records", len(record_keys))
+
+            query = f"""
+            FOR key IN @record_keys
+                UPDATE {{ _key: key, lastSyncTimestamp: @timestamp }}
+                IN {CollectionNames.RECORDS.value}
+                OPTIONS {{ ignoreErrors: true }}
+            """
+            db = transaction if transaction else self.db
+            await self._execute_aql(
+                db,
+                query,
+                bind_vars={"record_keys": list(record_keys), "timestamp": timestamp},
+            )
+
+            self.logger.info("✅ Touched %d records", len(record_keys))
+            return True
+
+        except Exception as e:
+            self.logger.error("❌ Failed to touch records: %s", str(e))
+            if transaction:
+                raise
+            return False
+
     # async def remove_existing_edges(self, file_id: str) -> bool:
     #     """Remove all existing edges for a record"""
     #     try:
@@ -526,6 +728,116 @@ class ArangoService(BaseArangoService):
             )
             return None
 
+    async def get_entity_ids_by_emails(
+        self, emails: List[str], transaction: Optional[TransactionDatabase] = None
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Resolve many email addresses to users, groups or people in one query
+
+        Args:
+            emails (List[str]): Email addresses to look up
+
+        Returns:
+            Dict[str, Tuple[str, str]]: Mapping of email to (collection, _key) for
+            the emails found. Users take precedence over groups, and groups over
+            people.
+        """
+        try:
+            if not emails:
+                return {}
+
+            self.logger.info("🚀 Getting entity keys for %d emails", len(emails))
+
+            query = f"""
+            FOR email IN @emails
+                LET user = FIRST(
+                    FOR doc IN {CollectionNames.USERS.value}
+                        FILTER doc.email == email
+                        RETURN doc._key
+                )
+                LET group = user ? null : FIRST(
+                    FOR doc IN {CollectionNames.GROUPS.value}
+                        FILTER doc.email == email
+                        RETURN doc._key
+                )
+                LET person = (user OR group) ? null : FIRST(
+                    FOR doc IN {CollectionNames.PEOPLE.value}
+                        FILTER doc.email == email
+                        RETURN doc._key
+                )
+                FILTER user OR group OR person
+                RETURN {{ email, user, group, person }}
+            """
+            db = transaction if transaction else self.db
+            results = await self._execute_aql(
+                db, query, bind_vars={"emails": list(emails)}
+            )
+
+            entities = {}
+            for entity in results:
+                if entity["user"]:
+                    entities[entity["email"]] = (
+                        CollectionNames.USERS.value,
+                        entity["user"],
+                    )
+                elif entity["group"]:
+                    entities[entity["email"]] = (
+                        CollectionNames.GROUPS.value,
+                        entity["group"],
+                    )
+                else:
+                    entities[entity["email"]] = (
+                        CollectionNames.PEOPLE.value,
+                        entity["person"],
+                    )
+
+            self.logger.info("✅ Resolved %d of %d emails", len(entities), len(emails))
+            return entities
+
+        except Exception as e:
+            self.logger.error("❌ Failed to get entity IDs for emails: %s", str(e))
+            raise
+
+    async def get_user_and_org_id_by_email(
+        self, email: str
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Get a user and the key of the organization it belongs to in one query
+
+        Args:
+            email (str): Email address of the user
+
+        Returns:
+            Tuple[Optional[Dict], Optional[str]]: The user document and its
+            organization key, each None when not found
+        """
+        try:
+            self.logger.info("🚀 Getting user and organization for %s", email)
+            query = f"""
+            FOR user IN {CollectionNames.USERS.value}
+                FILTER user.email == @email
+                LIMIT 1
+                LET org_id = FIRST(
+                    FOR edge IN {CollectionNames.BELONGS_TO.value}
+                        FILTER edge._from == user._id
+                        AND edge.entityType == 'ORGANIZATION'
+                        RETURN PARSE_IDENTIFIER(edge._to).key
+                )
+                RETURN {{ user, org_id }}
+            """
+            results = await self._execute_aql(
+                self.db, query, bind_vars={"email": email}, cache=True
+            )
+            if not results:
+                return None, None
+            return results[0]["user"], results[0]["org_id"]
+
+        except Exception as e:
+            self.logger.error(
+                "❌ Failed to get user and organization for %s: %s", email, str(e)
+            )
+            return None, None
+
     async def organization_exists(self, organization_name: str) -> bool:
         """Check if the organization exists in the database"""
         self.logger.info("🚀 Checking whether the organization exists")
@@ -872,6 +1184,114 @@ class ArangoService(BaseArangoService):
             return False
 
 
+    async def process_new_file_permissions(
+        self,
+        org_id: str,
+        file_permissions: List[Tuple[str, List[Dict]]],
+        transaction: Optional[TransactionDatabase] = None,
+    ) -> bool:
+        """
+        Store the permissions of many newly created files in one write.
+        The files must not have any stored permissions yet, so nothing is
+        compared or removed as in process_file_permissions.
+
+        Args:
+            org_id (str): ID of the organization
+            file_permissions (List[Tuple[str, List[Dict]]]): Pairs of file key
+                and the permissions of that file
+        """
+        try:
+            self.logger.info(
+                "🚀 Processing permissions for %d new files", len(file_permissions)
+            )
+            timestamp = get_epoch_timestamp_in_ms()
+
+            # Resolve the users and groups of every permission at once
+            entities = await self.get_entity_ids_by_emails(
+                list(
+                    {
+                        perm.get("emailAddress")
+                        for _, permissions in file_permissions
+                        for perm in permissions
+                        if perm.get("type", "").lower() in ("user", "group")
+                        and perm.get("emailAddress")
+                    }
+                ),
+                transaction=transaction,
+            )
+
+            permission_edges = []
+            anyone_permissions = []
+            for file_key, permissions in file_permissions:
+                for perm in permissions:
+                    perm_type = perm.get("type", "").lower()
+                    if perm_type == "anyone":
+                        anyone_permissions.append(
+                            {
+                                "type": "anyone",
+                                "file_key": file_key,
+                                "organization": org_id,
+                                "role": perm.get("role", "READER"),
+                                "externalPermissionId": perm.get("id"),
+                                "lastUpdatedTimestampAtSource": timestamp,
+                                "active": True,
+                            }
+                        )
+                        continue
+
+                    if perm_type in ("user", "group"):
+                        entity = entities.get(perm.get("emailAddress"))
+                        if not entity or entity[0] == CollectionNames.PEOPLE.value:
+                            self.logger.warning(
+                                "⚠️ Skipping permission for non-existent user or group: %s",
+                                perm.get("emailAddress"),
+                            )
+                            continue
+                        entity_key = entity[1]
+                        to_collection = f"{perm_type}s"
+                    elif perm_type == "domain":
+                        entity_key = org_id
+                        to_collection = CollectionNames.ORGS.value
+                    else:
+                        continue
+
+                    permission_edges.append(
+                        {
+                            "_key": str(uuid.uuid4()),
+                            "_from": f"{CollectionNames.RECORDS.value}/{file_key}",
+                            "_to": f"{to_collection}/{entity_key}",
+                            "type": perm.get("type").upper(),
+                            "role": perm.get("role", "READER").upper(),
+                            "externalPermissionId": perm.get("id"),
+                            "createdAtTimestamp": timestamp,
+                            "updatedAtTimestamp": timestamp,
+                            "lastUpdatedTimestampAtSource": timestamp,
+                        }
+                    )
+
+            if not await self.batch_upsert_multi(
+                {},
+                inserts={
+                    CollectionNames.PERMISSIONS.value: permission_edges,
+                    CollectionNames.ANYONE.value: anyone_permissions,
+                },
+                transaction=transaction,
+            ):
+                return False
+
+            self.logger.info(
+                "✅ Stored %d permissions and %d anyone permissions",
+                len(permission_edges),
+                len(anyone_permissions),
+            )
+            return True
+
+        except Exception as e:
+            self.logger.error("❌ Failed to process new file permissions: %s", str(e))
+            if transaction:
+                raise
+            return False
+
     def _get_access_level(self, role: str) -> int:
         """Convert role to numeric access level for easy comparison"""
         role_levels = {
@@ -1115,9 +1535,15 @@ class ArangoService(BaseArangoService):
                     RETURN user
                 """
 
-            # Execute query with organization parameter
-            cursor = self.db.aql.execute(query, bind_vars={"org_id": org_id})
-            users = list(cursor)
+            # Stream the users off the event loop instead of having the server
+            # materialize the whole result set first
+            users = await self._execute_aql(
+                self.db,
+                query,
+                bind_vars={"org_id": org_id},
+                stream=True,
+                batch_size=1000,
+            )
 
             self.logger.info("✅ Successfully fetched %s users", len(users))
             return users
@@ -1282,6 +1708,218 @@ class ArangoService(BaseArangoService):
             )
             return None
 
+    async def get_keys_by_external_record_ids(
+        self,
+        external_record_ids: List[str],
+        transaction: Optional[TransactionDatabase] = None,
+    ) -> Dict[str, str]:
+        """
+        Get internal record keys for many external record IDs in one query
+
+        Args:
+            external_record_ids (List[str]): External record IDs to look up
+            transaction (Optional[TransactionDatabase]): Optional database transaction
+
+        Returns:
+            Dict[str, str]: Mapping of external record ID to internal key for the
+            records that exist
+        """
+        try:
+            if not external_record_ids:
+                return {}
+
+            self.logger.info(
+                "🚀 Retrieving internal keys for %d external record IDs",
+                len(external_record_ids),
+            )
+
+            db = transaction if transaction else self.db
+            results = await self._execute_aql(
+                db,
+                _EXTERNAL_RECORD_KEYS_AQL,
+                bind_vars={"external_record_ids": list(external_record_ids)},
+                cache=True,
+            )
+            keys = {record["externalRecordId"]: record["key"] for record in results}
+
+            self.logger.info(
+                "✅ Found %d existing records out of %d",
+                len(keys),
+                len(external_record_ids),
+            )
+            return keys
+
+        except Exception as e:
+            self.logger.error(
+                "❌ Failed to retrieve internal keys for external record IDs: %s",
+                str(e),
+            )
+            raise
+
+    async def get_records_and_files_by_external_record_ids(
+        self,
+        external_record_ids: List[str],
+        transaction: Optional[TransactionDatabase] = None,
+    ) -> Dict[str, Dict]:
+        """
+        Get records and their file documents for many external record IDs in one query
+
+        Args:
+            external_record_ids (List[str]): External record IDs to look up
+            transaction (Optional[TransactionDatabase]): Optional database transaction
+
+        Returns:
+            Dict[str, Dict]: Mapping of external record ID to a dict holding the
+            "record" and its "file" for the records that exist
+        """
+        try:
+            if not external_record_ids:
+                return {}
+
+            self.logger.info(
+                "🚀 Retrieving records and files for %d external record IDs",
+                len(external_record_ids),
+            )
+
+            query = f"""
+            FOR record IN {CollectionNames.RECORDS.value}
+                FILTER record.externalRecordId IN @external_record_ids
+                RETURN {{
+                    record: record,
+                    file: DOCUMENT({CollectionNames.FILES.value}, record._key)
+                }}
+            """
+            db = transaction if transaction else self.db
+            results = await self._execute_aql(
+                db,
+                query,
+                bind_vars={"external_record_ids": list(external_record_ids)},
+            )
+            documents = {
+                result["record"]["externalRecordId"]: result for result in results
+            }
+
+            self.logger.info(
+                "✅ Found %d records out of %d",
+                len(documents),
+                len(external_record_ids),
+            )
+            return documents
+
+        except Exception as e:
+            self.logger.error(
+                "❌ Failed to retrieve records and files for external record IDs: %s",
+                str(e),
+            )
+            raise
+
+    async def upsert_drive(
+        self,
+        drive: Dict,
+        record: Dict,
+        user_email: str,
+        permission: Dict,
+        transaction: Optional[TransactionDatabase] = None,
+    ) -> Optional[str]:
+        """
+        Store a drive, its record and the user's relations to both in one query.
+        A drive already stored as a record keeps its key, otherwise the key of
+        the given record is used.
+
+        Args:
+            drive (Dict): Drive document
+            record (Dict): Record document of the drive
+            user_email (str): Email of the user the drive belongs to
+            permission (Dict): Attributes of the user's permission on the record
+            transaction (Optional[TransactionDatabase]): Optional database transaction
+
+        Returns:
+            Optional[str]: Key of the drive and its record
+        """
+        try:
+            self.logger.info("🚀 Upserting drive %s", drive.get("id"))
+            self._sync_states.pop(("drive", drive.get("id")), None)
+
+            query = f"""
+            LET key = FIRST(
+                FOR r IN {CollectionNames.RECORDS.value}
+                    FILTER r.externalRecordId == @record.externalRecordId
+                    LIMIT 1
+                    RETURN r._key
+            ) || @record._key
+            LET drive = MERGE(@drive, {{ _key: key }})
+            LET record = MERGE(@record, {{ _key: key }})
+
+            LET drive_writes = (
+                UPSERT {{ _key: key }} INSERT drive UPDATE drive
+                IN {CollectionNames.DRIVES.value}
+                RETURN 1
+            )
+            LET record_writes = (
+                UPSERT {{ _key: key }} INSERT record UPDATE record
+                IN {CollectionNames.RECORDS.value}
+                RETURN 1
+            )
+            LET is_of_type = (
+                LET edge = {{
+                    _from: CONCAT('{CollectionNames.RECORDS.value}/', key),
+                    _to: CONCAT('{CollectionNames.DRIVES.value}/', key)
+                }}
+                UPSERT {{ _from: edge._from, _to: edge._to }} INSERT edge UPDATE edge
+                IN {CollectionNames.IS_OF_TYPE.value}
+                RETURN 1
+            )
+            LET user_id = FIRST(
+                FOR u IN {CollectionNames.USERS.value}
+                    FILTER u.email == @user_email
+                    LIMIT 1
+                    RETURN u._id
+            )
+            LET user_drive = (
+                FOR user_ref IN (user_id ? [user_id] : [])
+                    LET edge = {{
+                        _from: user_ref,
+                        _to: CONCAT('{CollectionNames.DRIVES.value}/', key),
+                        access_level: drive.access_level
+                    }}
+                    UPSERT {{ _from: edge._from, _to: edge._to }} INSERT edge UPDATE edge
+                    IN {CollectionNames.USER_DRIVE_RELATION.value}
+                    RETURN 1
+            )
+            LET user_record = (
+                FOR user_ref IN (user_id ? [user_id] : [])
+                    LET edge = MERGE(@permission, {{
+                        _from: CONCAT('{CollectionNames.RECORDS.value}/', key),
+                        _to: user_ref
+                    }})
+                    UPSERT {{ _from: edge._from, _to: edge._to }} INSERT edge UPDATE edge
+                    IN {CollectionNames.PERMISSIONS.value}
+                    RETURN 1
+            )
+            RETURN key
+            """
+            db = transaction if transaction else self.db
+            results = await self._execute_aql(
+                db,
+                query,
+                bind_vars={
+                    "drive": drive,
+                    "record": record,
+                    "user_email": user_email,
+                    "permission": permission,
+                },
+            )
+            key = results[0] if results else None
+
+            self.logger.info("✅ Upserted drive %s with key %s", drive.get("id"), key)
+            return key
+
+        except Exception as e:
+            self.logger.error("❌ Failed to upsert drive: %s", str(e))
+            if transaction:
+                raise
+            return None
+
     async def get_key_by_attachment_id(
         self,
         external_attachment_id: str,
@@ -1360,6 +1998,9 @@ class ArangoService(BaseArangoService):
             str: Account type ('individual' or 'business')
         """
         try:
+            if org_id in self._account_types:
+                return self._account_types[org_id]
+
             query = """
                 FOR org IN organizations
                     FILTER org._key == @org_id
@@ -1367,6 +2008,8 @@ class ArangoService(BaseArangoService):
             """
             cursor = self.db.aql.execute(query, bind_vars={"org_id": org_id})
             result = next(cursor, None)
+            if result is not None:
+                self._account_types[org_id] = result
             return result
         except Exception as e:
             self.logger.error(f"Error getting account type: {str(e)}")
@@ -1377,6 +2020,7 @@ class ArangoService(BaseArangoService):
         user_email: str,
         state: str,
         service_type: str = Connectors.GOOGLE_DRIVE.value,
+        expected_state: Optional[str] = None,
     ) -> Optional[Dict]:
         """
         Update user's sync state in USER_APP_RELATION collection for specific service
@@ -1385,6 +2029,8 @@ class ArangoService(BaseArangoService):
             user_email (str): Email of the user
             state (str): Sync state (NOT_STARTED, RUNNING, PAUSED, COMPLETED)
             service_type (str): Type of service
+            expected_state (Optional[str]): Only update if the current sync state
+                matches this value
 
         Returns:
             Optional[Dict]: Updated relation document if successful, None otherwise
@@ -1397,10 +2043,15 @@ class ArangoService(BaseArangoService):
                 state,
             )
 
-            user_key = await self.get_entity_id_by_email(user_email)
+            self._sync_states.pop(("user", user_email, service_type), None)
 
             # Get user key and app key based on service type and update the sync state
             query = f"""
+            LET user_key = FIRST(
+                FOR u IN {CollectionNames.USERS.value}
+                    FILTER u.email == @user_email
+                    RETURN u._key
+            )
             LET app = FIRST(FOR a IN {CollectionNames.APPS.value}
                           FILTER LOWER(a.name) == LOWER(@service_type)
                           RETURN {{
@@ -1410,8 +2061,9 @@ class ArangoService(BaseArangoService):
 
             LET edge = FIRST(
                 FOR rel in {CollectionNames.USER_APP_RELATION.value}
-                    FILTER rel._from == CONCAT('users/', @user_key)
+                    FILTER rel._from == CONCAT('users/', user_key)
                     FILTER rel._to == CONCAT('apps/', app._key)
+                    {"FILTER rel.syncState == @expected_state" if expected_state else ""}
                     UPDATE rel WITH {{ syncState: @state, lastSyncUpdate: @lastSyncUpdate }} IN {CollectionNames.USER_APP_RELATION.value}
                     RETURN NEW
             )
@@ -1419,15 +2071,16 @@ class ArangoService(BaseArangoService):
             RETURN edge
             """
 
-            cursor = self.db.aql.execute(
-                query,
-                bind_vars={
-                    "user_key": user_key,
-                    "service_type": service_type,
-                    "state": state,
-                    "lastSyncUpdate": get_epoch_timestamp_in_ms(),
-                },
-            )
+            bind_vars = {
+                "user_email": user_email,
+                "service_type": service_type,
+                "state": state,
+                "lastSyncUpdate": get_epoch_timestamp_in_ms(),
+            }
+            if expected_state:
+                bind_vars["expected_state"] = expected_state
+
+            cursor = self.db.aql.execute(query, bind_vars=bind_vars)
 
             result = next(cursor, None)
             if result:
@@ -1452,6 +2105,62 @@ class ArangoService(BaseArangoService):
             )
             return None
 
+    async def update_user_sync_checkpoint(
+        self,
+        user_email: str,
+        thread_id: Optional[str],
+        service_type: str = Connectors.GOOGLE_MAIL.value,
+    ) -> bool:
+        """
+        Record the last thread written by a user's initial sync
+
+        Args:
+            user_email (str): Email of the user
+            thread_id (Optional[str]): Last written thread, None to clear
+            service_type (str): Type of service
+
+        Returns:
+            bool: True if the user-app relation was updated
+        """
+        try:
+            # The cached sync state carries the previous checkpoint
+            self._sync_states.pop(("user", user_email, service_type), None)
+
+            query = f"""
+            LET user_key = FIRST(
+                FOR u IN {CollectionNames.USERS.value}
+                    FILTER u.email == @user_email
+                    RETURN u._key
+            )
+            LET app = FIRST(FOR a IN {CollectionNames.APPS.value}
+                          FILTER LOWER(a.name) == LOWER(@service_type)
+                          RETURN a)
+
+            FOR rel IN {CollectionNames.USER_APP_RELATION.value}
+                FILTER rel._from == CONCAT('users/', user_key)
+                FILTER rel._to == app._id
+                UPDATE rel WITH {{ resumeThreadId: @thread_id }} IN {CollectionNames.USER_APP_RELATION.value}
+                RETURN NEW._key
+            """
+            results = await self._execute_aql(
+                self.db,
+                query,
+                bind_vars={
+                    "user_email": user_email,
+                    "service_type": service_type,
+                    "thread_id": thread_id,
+                },
+            )
+            return bool(results)
+
+        except Exception as e:
+            self.logger.error(
+                "❌ Failed to update user %s sync checkpoint: %s",
+                service_type,
+                str(e),
+            )
+            return False
+
     async def get_user_sync_state(
         self, user_email: str, service_type: str = Connectors.GOOGLE_DRIVE.value
     ) -> Optional[Dict]:
@@ -1466,13 +2175,21 @@ class ArangoService(BaseArangoService):
             Optional[Dict]: Relation document containing sync state if found, None otherwise
         """
         try:
+            cache_key = ("user", user_email, service_type)
+            cached_state = self._get_cached_sync_state(cache_key)
+            if cached_state is not None:
+                return cached_state
+
             self.logger.info(
                 "🔍 Getting %s sync state for user %s", service_type, user_email
             )
 
-            user_key = await self.get_entity_id_by_email(user_email)
-
             query = f"""
+            LET user_key = FIRST(
+                FOR u IN {CollectionNames.USERS.value}
+                    FILTER u.email == @user_email
+                    RETURN u._key
+            )
             LET app = FIRST(FOR a IN {CollectionNames.APPS.value}
                           FILTER LOWER(a.name) == LOWER(@service_type)
                           RETURN {{
@@ -1482,7 +2199,7 @@ class ArangoService(BaseArangoService):
 
             LET edge = FIRST(
                 FOR rel in {CollectionNames.USER_APP_RELATION.value}
-                    FILTER rel._from == CONCAT('users/', @user_key)
+                    FILTER rel._from == CONCAT('users/', user_key)
                     FILTER rel._to == CONCAT('apps/', app._key)
                     RETURN rel
             )
@@ -1493,20 +2210,20 @@ class ArangoService(BaseArangoService):
             cursor = self.db.aql.execute(
                 query,
                 bind_vars={
-                    "user_key": user_key,
+                    "user_email": user_email,
                     "service_type": service_type,
                 },
             )
 
             result = next(cursor, None)
             if result:
-                self.logger.info("Result: %s", result)
                 self.logger.info(
                     "✅ Found %s sync state for user %s: %s",
                     service_type,
                     user_email,
                     result["syncState"],
                 )
+                self._cache_sync_state(cache_key, result)
                 return result
 
             self.logger.warning(
@@ -1522,8 +2239,108 @@ class ArangoService(BaseArangoService):
             )
             return None
 
+    async def get_users_sync_states(
+        self, user_emails: List[str], service_type: str = Connectors.GOOGLE_DRIVE.value
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Get the sync state of many users for a specific service in one query
+
+        Args:
+            user_emails (List[str]): Emails of the users
+            service_type (str): Type of service
+
+        Returns:
+            Dict[str, Optional[Dict]]: Relation document containing the sync
+            state of each email, None for users without one
+        """
+        try:
+            self.logger.info(
+                "🔍 Getting %s sync states for %d users", service_type, len(user_emails)
+            )
+
+            query = f"""
+            LET app = FIRST(FOR a IN {CollectionNames.APPS.value}
+                          FILTER LOWER(a.name) == LOWER(@service_type)
+                          RETURN a)
+
+            FOR email IN @user_emails
+                LET user_key = FIRST(
+                    FOR u IN {CollectionNames.USERS.value}
+                        FILTER u.email == email
+                        RETURN u._key
+                )
+                LET edge = FIRST(
+                    FOR rel IN {CollectionNames.USER_APP_RELATION.value}
+                        FILTER rel._from == CONCAT('users/', user_key)
+                        FILTER rel._to == app._id
+                        RETURN rel
+                )
+                RETURN {{ email: email, edge: edge }}
+            """
+            results = await self._execute_aql(
+                self.db,
+                query,
+                bind_vars={"user_emails": user_emails, "service_type": service_type},
+            )
+            return {result["email"]: result["edge"] for result in results}
+
+        except Exception as e:
+            self.logger.error(
+                "❌ Failed to get users %s sync states: %s", service_type, str(e)
+            )
+            raise
+
+    async def pause_running_user_syncs(
+        self, user_emails: List[str], service_type: str = Connectors.GOOGLE_DRIVE.value
+    ) -> List[str]:
+        """
+        Pause the running syncs of many users for a specific service in one query
+
+        Args:
+            user_emails (List[str]): Emails of the users
+            service_type (str): Type of service
+
+        Returns:
+            List[str]: Emails of the users whose sync was paused
+        """
+        try:
+            for user_email in user_emails:
+                self._sync_states.pop(("user", user_email, service_type), None)
+
+            query = f"""
+            LET app = FIRST(FOR a IN {CollectionNames.APPS.value}
+                          FILTER LOWER(a.name) == LOWER(@service_type)
+                          RETURN a)
+
+            FOR user IN {CollectionNames.USERS.value}
+                FILTER user.email IN @user_emails
+                FOR rel IN {CollectionNames.USER_APP_RELATION.value}
+                    FILTER rel._from == user._id
+                    FILTER rel._to == app._id
+                    FILTER rel.syncState == @running_state
+                    UPDATE rel WITH {{ syncState: @state, lastSyncUpdate: @lastSyncUpdate }} IN {CollectionNames.USER_APP_RELATION.value}
+                    RETURN user.email
+            """
+            return await self._execute_aql(
+                self.db,
+                query,
+                bind_vars={
+                    "user_emails": user_emails,
+                    "service_type": service_type,
+                    "running_state": ProgressStatus.IN_PROGRESS.value,
+                    "state": ProgressStatus.PAUSED.value,
+                    "lastSyncUpdate": get_epoch_timestamp_in_ms(),
+                },
+            )
+
+        except Exception as e:
+            self.logger.error(
+                "❌ Failed to pause users %s syncs: %s", service_type, str(e)
+            )
+            raise
+
     async def update_drive_sync_state(
-        self, drive_id: str, state: str
+        self, drive_id: str, state: str, fire_and_forget: bool = False
     ) -> Optional[Dict]:
         """
         Update drive's sync state in drives collection
@@ -1531,16 +2348,19 @@ class ArangoService(BaseArangoService):
         Args:
             drive_id (str): ID of the drive
             state (str): Sync state (NOT_STARTED, RUNNING, PAUSED, COMPLETED)
-            additional_data (dict, optional): Additional data to update
+            fire_and_forget (bool): Queue the update on the server without
+                waiting for it to be applied
 
         Returns:
             Optional[Dict]: Updated drive document if successful, None otherwise
+            and for fire and forget updates
         """
         try:
             self.logger.info(
                 "🚀 Updating sync state for drive %s to %s", drive_id, state
             )
 
+            self._sync_states.pop(("drive", drive_id), None)
             update_data = {
                 "sync_state": state,
                 "last_sync_update": get_epoch_timestamp_in_ms(),
@@ -1553,9 +2373,15 @@ class ArangoService(BaseArangoService):
                 RETURN NEW
             """
 
-            cursor = self.db.aql.execute(
-                query, bind_vars={"drive_id": drive_id, "update": update_data}
-            )
+            bind_vars = {"drive_id": drive_id, "update": update_data}
+            if fire_and_forget:
+                # Sent with x-arango-async, the server answers 202 once queued
+                self.db.begin_async_execution(return_result=False).aql.execute(
+                    query, bind_vars=bind_vars
+                )
+                return None
+
+            cursor = self.db.aql.execute(query, bind_vars=bind_vars)
 
             result = next(cursor, None)
             if result:
@@ -1584,6 +2410,10 @@ class ArangoService(BaseArangoService):
                           or None if drive not found
         """
         try:
+            cached_state = self._get_cached_sync_state(("drive", drive_id))
+            if cached_state is not None:
+                return cached_state
+
             self.logger.info("🔍 Getting sync state for drive %s", drive_id)
 
             query = """
@@ -1598,6 +2428,8 @@ class ArangoService(BaseArangoService):
                 self.logger.debug(
                     "✅ Found sync state for drive %s: %s", drive_id, result[0]
                 )
+                if result[0] is not None:
+                    self._cache_sync_state(("drive", drive_id), result[0])
                 return result[0]
 
             self.logger.debug(
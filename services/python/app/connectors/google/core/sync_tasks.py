@@ -146,7 +146,7 @@ class SyncTasks:
             elif action == "pause":
                 self.logger.info("Pausing sync")
 
-                self.drive_sync_service._stop_requested = True
+                self.drive_sync_service.request_stop()
                 self.logger.info("🚀 Setting stop requested")
 
                 # Wait a short time to allow graceful stop
@@ -202,7 +202,7 @@ class SyncTasks:
             elif action == "pause":
                 self.logger.info("Pausing sync")
 
-                self.gmail_sync_service._stop_requested = True
+                self.gmail_sync_service.request_stop()
                 self.logger.info("🚀 Setting stop requested")
 
                 # Wait a short time to allow graceful stop
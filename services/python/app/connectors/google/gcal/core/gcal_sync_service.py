@@ -165,8 +165,9 @@ class GCalSyncEnterpriseService(BaseGCalSyncService):
                 sync_hierarchy["status"] = "PAUSED"
                 await self.redis_service.store_sync_hierarchy(sync_hierarchy)
 
-            # Set up calendar watch for each user
-            for user in users:
+            # Set up calendar watch for each user concurrently; the admin
+            # service bounds how many user services are created at once
+            async def setup_calendar_watch(user):
                 try:
                     user_service = (
                         await self.gcal_admin_service.create_gcal_user_service(
@@ -177,14 +178,14 @@ class GCalSyncEnterpriseService(BaseGCalSyncService):
                         self.logger.warning(
                             f"❌ Failed to create user service for: {user['email']}"
                         )
-                        continue
+                        return
 
                     watch_response = await user_service.create_calendar_watch()
                     if not watch_response:
                         self.logger.warning(
                             f"❌ Failed to set up calendar watch for user: {user['email']}"
                         )
-                        continue
+                        return
 
                     self.logger.info(
                         f"✅ Calendar watch set up successfully for user: {user['email']}"
@@ -198,6 +199,8 @@ class GCalSyncEnterpriseService(BaseGCalSyncService):
                         f"❌ Error setting up calendar watch for user {user['email']}: {str(e)}"
                     )
 
+            await asyncio.gather(*(setup_calendar_watch(user) for user in users))
+
             self.logger.info("✅ Sync service initialized successfully")
             return True
 
@@ -11,6 +11,7 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 
 from app.config.configuration_service import ConfigurationService, config_node_constants
+from app.connectors.google.helpers.discovery import build_service
 from app.connectors.google.scopes import GOOGLE_CONNECTOR_INDIVIDUAL_SCOPES
 from app.connectors.utils.decorators import exponential_backoff
 from app.connectors.utils.rate_limiter import GoogleAPIRateLimiter
@@ -72,9 +73,7 @@ class GCalUserService:
             self.logger.info("🚀 Connecting to Enterprise Calendar Service")
             self.org_id = org_id
             self.user_id = user_id
-            self.service = build(
-                "calendar", "v3", credentials=self.credentials, cache_discovery=False
-            )
+            self.service = build_service("calendar", "v3", self.credentials)
             self.logger.info("✅ GCalUserService connected successfully")
             return True
 
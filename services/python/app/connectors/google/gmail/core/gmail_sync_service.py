@@ -4,8 +4,12 @@
 import asyncio
 import uuid
 from abc import ABC, abstractmethod
+from collections import defaultdict, deque
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+import orjson
 
 from app.config.configuration_service import (
     ConfigurationService,
@@ -27,6 +31,20 @@ from app.connectors.google.core.arango_service import ArangoService
 from app.connectors.google.gmail.core.gmail_user_service import GmailUserService
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
+# Gmail message link; the literal {user.email} placeholder is filled in downstream
+GMAIL_WEB_URL_PREFIX = "https://mail.google.com/mail?authuser={user.email}#all/"
+# Message headers whose addresses are granted read permission on the message
+RECIPIENT_HEADERS = ("To", "From", "Cc", "Bcc")
+
+
+def _recipient_emails(headers) -> List[str]:
+    """Addresses of a message's recipient headers, each once and in order"""
+    return list(
+        dict.fromkeys(
+            email for header in RECIPIENT_HEADERS for email in headers.get(header, ())
+        )
+    )
+
 
 class GmailSyncProgress:
     """Class to track sync progress"""
@@ -42,6 +60,21 @@ class GmailSyncProgress:
 class BaseGmailSyncService(ABC):
     """Abstract base class for sync services"""
 
+    # Bounds for the number of threads per batch. Batches grow while they are
+    # written within TARGET_BATCH_SECONDS and halve when slower, and never hold
+    # more than about TARGET_BATCH_BYTES of metadata
+    DEFAULT_BATCH_SIZE = 200
+    MIN_BATCH_SIZE = 10
+    MAX_BATCH_SIZE = 1000
+    TARGET_BATCH_BYTES = 2_000_000
+    TARGET_BATCH_SECONDS = 2.0
+    MAX_CACHED_EMAILS = 50_000
+    # Gmail requests in flight per user while enumerating a mailbox
+    MAX_CONCURRENT_FETCHES = 20
+    # Written batches waiting for their Kafka events, and the tasks sending them
+    EVENT_QUEUE_SIZE = 4
+    EVENT_WORKERS = 2
+
     def __init__(
         self,
         logger,
@@ -62,18 +95,30 @@ class BaseGmailSyncService(ABC):
         self._current_batch = None
         self._pause_event = asyncio.Event()
         self._pause_event.set()
-        self._stop_requested = False
+        # Set once a stop is requested; checked in the sync loops without awaiting
+        self._stop_event = asyncio.Event()
+        self._active_batches = 0
+        self._batch_idle = asyncio.Event()
+        self._batch_idle.set()
+        # Batches whose indexing events are sent in the background
+        self._event_queue = asyncio.Queue(maxsize=self.EVENT_QUEUE_SIZE)
+        self._event_workers: List[asyncio.Task] = []
+        # Organization users, cached for the state transitions
+        self._org_users: Dict[str, List[Dict]] = {}
+        # Permission email to (collection, key), kept for the current sync
+        self._email_entities: Dict[str, Tuple[str, str]] = {}
 
         # Locks
-        self._sync_lock = asyncio.Lock()
         self._transition_lock = asyncio.Lock()
-        self._worker_lock = asyncio.Lock()
-        self._progress_lock = asyncio.Lock()
+        # Serializes permission email resolution so batches running for
+        # different users do not create the same person twice
+        self._people_lock = asyncio.Lock()
 
         # Configuration
         self._hierarchy_version = 0
         self._sync_task = None
-        self.batch_size = 100
+        self.batch_size = self.DEFAULT_BATCH_SIZE
+        self._avg_thread_bytes = None
 
     @abstractmethod
     async def connect_services(self, org_id: str) -> bool:
@@ -97,85 +142,92 @@ class BaseGmailSyncService(ABC):
         """Resync a user's Google Gmail"""
         pass
 
+    async def refresh_org_users(self, org_id) -> List[Dict]:
+        """Reload the cached users of an organization"""
+        self._org_users[org_id] = await self.arango_service.get_users(org_id=org_id)
+        return self._org_users[org_id]
+
+    async def _get_org_users(self, org_id) -> List[Dict]:
+        """Return the cached users of an organization, loading them on first use"""
+        if org_id not in self._org_users:
+            return await self.refresh_org_users(org_id)
+        return self._org_users[org_id]
+
     async def start(self, org_id) -> bool:
         self.logger.info("🚀 Starting Gmail sync, Action: start")
         async with self._transition_lock:
-            try:
-                # Get current user
-                users = await self.arango_service.get_users(org_id=org_id)
+            return await self._start(org_id)
 
-                for user in users:
-                    # Check current state using get_user_sync_state
-                    sync_state = await self.arango_service.get_user_sync_state(
-                        user["email"], Connectors.GOOGLE_MAIL.value
-                    )
-                    current_state = (
-                        sync_state.get("syncState") if sync_state else "NOT_STARTED"
-                    )
+    async def _start(self, org_id) -> bool:
+        """Start a fresh sync; the caller must hold _transition_lock"""
+        try:
+            # Get current user
+            users = await self.refresh_org_users(org_id)
 
-                    if current_state == "IN_PROGRESS":
-                        self.logger.warning("💥 Gmail sync service is already running")
-                        return False
+            for user in users:
+                # Check current state using get_user_sync_state
+                sync_state = await self.arango_service.get_user_sync_state(
+                    user["email"], Connectors.GOOGLE_MAIL.value
+                )
+                current_state = (
+                    sync_state.get("syncState") if sync_state else "NOT_STARTED"
+                )
 
-                    if current_state == "PAUSED":
-                        self.logger.warning(
-                            "💥 Gmail sync is paused, use resume to continue"
-                        )
-                        return False
+                if current_state == "IN_PROGRESS":
+                    self.logger.warning("💥 Gmail sync service is already running")
+                    return False
 
-                    # Cancel any existing task
-                    if self._sync_task and not self._sync_task.done():
-                        self._sync_task.cancel()
-                        try:
-                            await self._sync_task
-                        except asyncio.CancelledError:
-                            pass
+                if current_state == "PAUSED":
+                    self.logger.warning(
+                        "💥 Gmail sync is paused, use resume to continue"
+                    )
+                    return False
 
-                # Start fresh sync
-                self._sync_task = asyncio.create_task(
-                    self.perform_initial_sync(org_id, action="start")
-                )
+                # Cancel any existing task
+                if self._sync_task and not self._sync_task.done():
+                    self._sync_task.cancel()
+                    try:
+                        await self._sync_task
+                    except asyncio.CancelledError:
+                        pass
+
+            self._stop_event.clear()
+            self._email_entities.clear()
+            # Start fresh sync
+            self._sync_task = asyncio.create_task(
+                self.perform_initial_sync(org_id, action="start")
+            )
 
-                self.logger.info("✅ Gmail sync service started")
-                return True
+            self.logger.info("✅ Gmail sync service started")
+            return True
 
-            except Exception as e:
-                self.logger.error(f"❌ Failed to start Gmail sync service: {str(e)}")
-                return False
+        except Exception as e:
+            self.logger.error(f"❌ Failed to start Gmail sync service: {str(e)}")
+            return False
 
     async def pause(self, org_id) -> bool:
         self.logger.info("⏸️ Pausing Gmail sync service")
         async with self._transition_lock:
             try:
-                users = await self.arango_service.get_users(org_id=org_id)
-                for user in users:
-
-                    # Check current state using get_user_sync_state
-                    sync_state = await self.arango_service.get_user_sync_state(
-                        user["email"], Connectors.GOOGLE_MAIL.value
-                    )
-                    current_state = (
-                        sync_state.get("syncState") if sync_state else "NOT_STARTED"
-                    )
-
-                    if current_state != "IN_PROGRESS":
-                        self.logger.warning("💥 Gmail sync service is not running")
-                        return False
-
-                    self._stop_requested = True
-
-                    # Update state in Arango
-                    await self.arango_service.update_user_sync_state(
-                        user["email"], "PAUSED", Connectors.GOOGLE_MAIL.value
-                    )
-
-                    # Cancel current sync task
-                    if self._sync_task and not self._sync_task.done():
-                        self._sync_task.cancel()
-                        try:
-                            await self._sync_task
-                        except asyncio.CancelledError:
-                            pass
+                # Stop every user coroutine, let in-flight batches commit,
+                # then cancel current sync task
+                self._stop_event.set()
+                await self._batch_idle.wait()
+                if self._sync_task and not self._sync_task.done():
+                    self._sync_task.cancel()
+                    try:
+                        await self._sync_task
+                    except asyncio.CancelledError:
+                        pass
+
+                # Mark the users still running as paused in one write
+                users = await self._get_org_users(org_id)
+                paused_emails = await self.arango_service.pause_running_user_syncs(
+                    [user["email"] for user in users], Connectors.GOOGLE_MAIL.value
+                )
+                if not paused_emails:
+                    self.logger.warning("💥 Gmail sync service is not running")
+                    return False
 
                 self.logger.info("✅ Gmail sync service paused")
                 return True
@@ -188,7 +240,7 @@ class BaseGmailSyncService(ABC):
         self.logger.info("🔄 Resuming Gmail sync service")
         async with self._transition_lock:
             try:
-                users = await self.arango_service.get_users(org_id=org_id)
+                users = await self._get_org_users(org_id)
                 for user in users:
 
                     # Check current state using get_user_sync_state
@@ -197,7 +249,7 @@ class BaseGmailSyncService(ABC):
                     )
                     if not sync_state:
                         self.logger.warning("⚠️ No user found, starting fresh")
-                        return await self.start(org_id)
+                        return await self._start(org_id)
 
                     current_state = sync_state.get("syncState")
                     if current_state == "IN_PROGRESS":
@@ -211,8 +263,9 @@ class BaseGmailSyncService(ABC):
                         return False
 
                     self._pause_event.set()
-                    self._stop_requested = False
+                    self._stop_event.clear()
 
+                self._email_entities.clear()
                 # Start sync with resume state
                 self._sync_task = asyncio.create_task(
                     self.perform_initial_sync(org_id, action="resume")
@@ -225,641 +278,892 @@ class BaseGmailSyncService(ABC):
                 self.logger.error(f"❌ Failed to resume Gmail sync service: {str(e)}")
                 return False
 
-    async def _should_stop(self, org_id) -> bool:
-        """Check if operation should stop"""
-        if self._stop_requested:
-            # Get current user
-            users = await self.arango_service.get_users(org_id=org_id)
-            for user in users:
-                current_state = await self.arango_service.get_user_sync_state(
-                    user["email"], Connectors.GOOGLE_MAIL.value
+    def request_stop(self) -> None:
+        """Ask the running sync to stop at its next checkpoint"""
+        self._stop_event.set()
+
+    async def _fetch_messages(
+        self, user_service, messages_list, org_id, user, account_type
+    ) -> List[Tuple[Dict, List[Dict]]]:
+        """Fetch full messages and their attachments concurrently, in list order
+
+        Messages come from Gmail batch requests; any that a batch could not
+        return are fetched on their own.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        messages_by_id = await user_service.batch_get_messages(
+            [message["id"] for message in messages_list]
+        )
+
+        async def fetch(message):
+            async with semaphore:
+                message_data = messages_by_id.get(message["id"])
+                if message_data is None:
+                    message_data = await user_service.get_message(message["id"])
+                attachments = await user_service.list_attachments(
+                    message_data, org_id, user, account_type
                 )
-                if current_state:
-                    current_state = current_state.get("syncState")
-                    if current_state == "IN_PROGRESS":
-                        await self.arango_service.update_user_sync_state(
-                            user["email"], "PAUSED", Connectors.GOOGLE_MAIL.value
-                        )
-                        self.logger.info("✅ Gmail sync state updated before stopping")
-                        return True
+            # The body is decoded and the attachments listed, so the raw MIME
+            # payload is not kept around for the rest of the batch
+            message_data.pop("payload", None)
+            return message_data, attachments
+
+        return await asyncio.gather(*(fetch(message) for message in messages_list))
+
+    async def _fetch_thread_batch(
+        self, user_service, batch, messages_by_thread_id, org_id, user, account_type
+    ):
+        """Fetch the full messages of a batch of threads
+
+        Only the batch's messages are held in memory, so a mailbox is never
+        materialized in full.
+
+        Returns:
+            (messages_by_thread, attachments_by_message, permissions_by_message)
+            for the messages of the batch
+        """
+        fetched_messages = await self._fetch_messages(
+            user_service,
+            [
+                message
+                for thread in batch
+                for message in messages_by_thread_id.get(thread["id"], [])
+            ],
+            org_id,
+            user,
+            account_type,
+        )
+
+        messages_by_thread = defaultdict(list)
+        for message, _ in fetched_messages:
+            messages_by_thread[message.get("threadId")].append(message)
+        attachments_by_message = {
+            message["id"]: attachments for message, attachments in fetched_messages
+        }
+        permissions_by_message = {
+            message["id"]: {
+                "messageId": message["id"],
+                "attachmentIds": [
+                    attachment["attachment_id"] for attachment in attachments
+                ],
+                "role": "reader",
+                "users": _recipient_emails(message.get("headers", {})),
+            }
+            for message, attachments in fetched_messages
+        }
+        return messages_by_thread, attachments_by_message, permissions_by_message
+
+    async def _fetched_thread_batches(
+        self,
+        user_service,
+        threads,
+        sync_state,
+        messages_by_thread_id,
+        org_id,
+        user,
+        account_type,
+    ):
+        """Yield (index, batch, fetched) for each thread batch of a user
+
+        The next batch is fetched from Gmail while the caller writes the one
+        just yielded, so API latency overlaps with the database writes.
+        """
+        batches = self._thread_batches(threads, sync_state)
+
+        def fetch(batch):
+            return asyncio.create_task(
+                self._fetch_thread_batch(
+                    user_service,
+                    batch,
+                    messages_by_thread_id,
+                    org_id,
+                    user,
+                    account_type,
+                )
+            )
+
+        current = next(batches, None)
+        pending = fetch(current[1]) if current else None
+        try:
+            while current:
+                i, batch = current
+                fetched = await pending
+                current = next(batches, None)
+                pending = fetch(current[1]) if current else None
+                yield i, batch, fetched
+        finally:
+            if pending and not pending.done():
+                pending.cancel()
+
+    async def _send_batch_events(self, batch_metadata, org_id, user) -> bool:
+        """Send Kafka indexing events for the messages and attachments of a batch
+
+        Fields shared by every event of the batch come from one template per
+        record type, and internal record keys are looked up in one query.
+        """
+        endpoints = await self.config_service.get_config(
+            config_node_constants.ENDPOINTS.value
+        )
+        connector_endpoint = endpoints.get("connectors").get(
+            "endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value
+        )
+        signed_url_prefix = (
+            f"{connector_endpoint}/api/v1/{org_id}/{user['userId']}/gmail/record/"
+        )
+        current_timestamp = get_epoch_timestamp_in_ms()
+
+        record_keys = await self.arango_service.get_keys_by_external_record_ids(
+            [
+                message_data["message"]["id"]
+                for metadata in batch_metadata
+                for message_data in metadata["messages"]
+            ]
+            + [
+                attachment["attachment_id"]
+                for metadata in batch_metadata
+                for attachment in metadata["attachments"]
+            ]
+        )
+
+        base_event = {
+            "orgId": org_id,
+            "recordVersion": 0,
+            "eventType": EventTypes.NEW_RECORD.value,
+            "connectorName": Connectors.GOOGLE_MAIL.value,
+            "origin": OriginTypes.CONNECTOR.value,
+        }
+        message_template = {
+            **base_event,
+            "recordType": RecordTypes.MAIL.value,
+            "mimeType": "text/gmail_content",
+        }
+        attachment_template = {
+            **base_event,
+            "recordType": RecordTypes.ATTACHMENT.value,
+            "createdAtSourceTimestamp": current_timestamp,
+            "modifiedAtSourceTimestamp": current_timestamp,
+        }
+
+        events = []
+        for metadata in batch_metadata:
+            for message_data in metadata["messages"]:
+                message = message_data["message"]
+                message_key = record_keys.get(message["id"])
+                source_timestamp = int(message.get("internalDate", current_timestamp))
+                events.append(
+                    {
+                        **message_template,
+                        "recordId": message_key,
+                        "recordName": message.get("headers", {}).get(
+                            "Subject", "No Subject"
+                        ),
+                        "body": message.get("body", ""),
+                        "signedUrlRoute": f"{signed_url_prefix}{message_key}/signedUrl",
+                        "threadId": metadata["thread"]["id"],
+                        "createdAtSourceTimestamp": source_timestamp,
+                        "modifiedAtSourceTimestamp": source_timestamp,
+                    }
+                )
+
+            for attachment in metadata["attachments"]:
+                attachment_key = record_keys.get(attachment["attachment_id"])
+                events.append(
+                    {
+                        **attachment_template,
+                        "recordId": attachment_key,
+                        "recordName": attachment.get("filename", "Unnamed Attachment"),
+                        "signedUrlRoute": f"{signed_url_prefix}{attachment_key}/signedUrl",
+                        "mimeType": attachment.get(
+                            "mimeType", "application/octet-stream"
+                        ),
+                        "size": attachment.get("size", 0),
+                    }
+                )
+
+        if not await self.kafka_service.send_events_to_kafka(events):
             return False
+        self.logger.info("📨 Sent %s Kafka indexing events", len(events))
+        return True
+
+    async def _queue_batch_events(self, batch_metadata, org_id, user) -> asyncio.Future:
+        """Hand a written batch to the event workers
+
+        Kafka events are sent while the next batch is fetched and written.
+        The bounded queue holds the sync back when the workers fall behind.
+
+        Returns:
+            A future resolved with whether the events of the batch were sent
+        """
+        if not any(not worker.done() for worker in self._event_workers):
+            self._event_workers = [
+                asyncio.create_task(self._event_worker())
+                for _ in range(self.EVENT_WORKERS)
+            ]
+        sent = asyncio.get_running_loop().create_future()
+        await self._event_queue.put((batch_metadata, org_id, user, sent))
+        return sent
+
+    async def _event_worker(self) -> None:
+        while True:
+            batch_metadata, org_id, user, sent = await self._event_queue.get()
+            try:
+                sent.set_result(
+                    await self._send_batch_events(batch_metadata, org_id, user)
+                )
+            except Exception as e:
+                self.logger.error(
+                    "❌ Failed to send Kafka events for batch: %s", str(e)
+                )
+                sent.set_result(False)
+            finally:
+                self._event_queue.task_done()
+
+    async def _advance_sync_checkpoint(self, user_email, pending_batches) -> bool:
+        """Move a user's resume checkpoint past the leading sent batches
+
+        Args:
+            pending_batches: Deque of (sent future, last thread id) in batch order
+
+        Returns:
+            False once a batch failed to send, the checkpoint stays before it
+        """
+        last_thread_id = None
+        while pending_batches and pending_batches[0][0].done():
+            sent, thread_id = pending_batches.popleft()
+            if not sent.result():
+                pending_batches.clear()
+                return False
+            last_thread_id = thread_id
+
+        if last_thread_id:
+            await self.arango_service.update_user_sync_checkpoint(
+                user_email, last_thread_id
+            )
+        return True
+
+    async def _finish_user_sync(
+        self, user_email, sent_batches, pending_batches, checkpoint_open
+    ) -> bool:
+        """Wait for the events of a user's own batches and record the outcome
+
+        The user is marked COMPLETED only if every batch was written and its
+        events were sent. Otherwise it is marked FAILED with its checkpoint
+        kept, so the next run retries from the first failed batch.
+
+        Returns:
+            True if the user's sync completed
+        """
+        results = await asyncio.gather(*sent_batches)
+        if checkpoint_open and all(results):
+            await self.arango_service.update_user_sync_state(
+                user_email, "COMPLETED", Connectors.GOOGLE_MAIL.value
+            )
+            await self.arango_service.update_user_sync_checkpoint(user_email, None)
+            return True
+
+        if checkpoint_open:
+            await self._advance_sync_checkpoint(user_email, pending_batches)
+        self.logger.warning(
+            "⚠️ Some Gmail batches of user %s failed, leaving it for a retry",
+            user_email,
+        )
+        await self.arango_service.update_user_sync_state(
+            user_email, "FAILED", Connectors.GOOGLE_MAIL.value
+        )
         return False
 
+    def _thread_batches(self, threads, sync_state=None):
+        """Yield (index, batch) slices of threads using the current batch size
+
+        A sync that was interrupted resumes after the last thread it wrote,
+        looked up by id since new mail shifts the listing.
+        """
+        i = 0
+        resume_thread_id = (sync_state or {}).get("resumeThreadId")
+        if resume_thread_id:
+            for index, thread in enumerate(threads):
+                if thread["id"] == resume_thread_id:
+                    i = index + 1
+                    self.logger.info("⏩ Resuming sync after %s threads", i)
+                    break
+        while i < len(threads):
+            batch = threads[i : i + self.batch_size]
+            yield i, batch
+            i += len(batch)
+
+    def _adapt_batch_size(self, metadata_list, processing_seconds: float) -> None:
+        """Resize thread batches from the last batch's processing time
+
+        The size is also capped by a running average of thread metadata size
+        so a batch stays close to TARGET_BATCH_BYTES.
+        """
+        if not metadata_list:
+            return
+        sample_bytes = len(orjson.dumps(metadata_list[0], default=str))
+        self._avg_thread_bytes = (
+            sample_bytes
+            if self._avg_thread_bytes is None
+            else 0.9 * self._avg_thread_bytes + 0.1 * sample_bytes
+        )
+        if processing_seconds > self.TARGET_BATCH_SECONDS:
+            batch_size = self.batch_size // 2
+        else:
+            batch_size = int(self.batch_size * 1.25)
+        self.batch_size = max(
+            self.MIN_BATCH_SIZE,
+            min(
+                self.MAX_BATCH_SIZE,
+                int(self.TARGET_BATCH_BYTES / max(self._avg_thread_bytes, 1)),
+                batch_size,
+            ),
+        )
+
     async def process_batch(self, metadata_list, org_id):
         """Process a single batch with atomic operations"""
         self.logger.info(
             "🚀 Starting batch processing with %d items", len(metadata_list)
         )
         batch_start_time = datetime.now(timezone.utc)
+        # Single timestamp shared by every record and edge created in this batch
+        current_timestamp = get_epoch_timestamp_in_ms()
+        # Track in-flight batches so pause can let them commit before cancelling
+        self._active_batches += 1
+        self._batch_idle.clear()
 
         try:
-            if await self._should_stop(org_id):
+            if self._stop_event.is_set():
                 self.logger.info("⏹️ Stop requested, halting batch processing")
                 return False
 
-            async with self._sync_lock:
-                self.logger.debug("🔒 Acquired sync lock for batch processing")
-                # Prepare nodes and edges for batch processing
-                messages = []
-                attachments = []
-                is_of_type = []
-                records = []
-                permissions = []
-                recordRelations = []
-                existing_messages = []
-                existing_attachments = []
+            # Prepare nodes and edges for batch processing
+            messages = []
+            attachments = []
+            is_of_type = []
+            records = []
+            permissions = []
+            recordRelations = []
+            existing_message_keys = []
+            existing_attachment_keys = []
 
-                self.logger.debug(
-                    "📊 Processing metadata list of size: %d", len(metadata_list)
+            self.logger.debug(
+                "📊 Processing metadata list of size: %d", len(metadata_list)
+            )
+
+            # Look up every message and attachment of the batch in one query
+            existing_record_keys = (
+                await self.arango_service.get_keys_by_external_record_ids(
+                    [
+                        message_data["message"]["id"]
+                        for metadata in metadata_list
+                        for message_data in metadata["messages"]
+                    ]
+                    + [
+                        attachment["attachment_id"]
+                        for metadata in metadata_list
+                        for attachment in metadata["attachments"]
+                    ]
                 )
-                for metadata in metadata_list:
-                    # self.logger.debug(
-                    #     "📝 Starting metadata processing: %s", metadata)
-                    thread_metadata = metadata["thread"]
-                    messages_metadata = metadata["messages"]
-                    attachments_metadata = metadata["attachments"]
-                    permissions_metadata = metadata["permissions"]
+            )
 
-                    self.logger.debug(
-                        "📨 Messages in current metadata: %d", len(messages_metadata)
-                    )
-                    self.logger.debug(
-                        "📎 Attachments in current metadata: %d",
-                        len(attachments_metadata),
+            # Record keys by external id, seeded with the stored records and
+            # extended as new records are created below
+            record_keys = dict(existing_record_keys)
+
+            # Resolve every permission email of the batch to a user, group or
+            # person. Emails seen earlier in this sync come from the cache, the
+            # rest are looked up in one query and unknown ones become new people
+            permission_emails = {
+                email
+                for metadata in metadata_list
+                for permission in metadata["permissions"]
+                for email in permission.get("users", [])
+            }
+            async with self._people_lock:
+                entities_by_email = {
+                    email: self._email_entities[email]
+                    for email in permission_emails
+                    if email in self._email_entities
+                }
+                entities_by_email.update(
+                    await self.arango_service.get_entity_ids_by_emails(
+                        list(permission_emails - entities_by_email.keys())
                     )
+                )
+                new_people = []
+                for email in permission_emails - entities_by_email.keys():
+                    person_key = uuid.uuid4().hex
+                    entities_by_email[email] = (CollectionNames.PEOPLE.value, person_key)
+                    new_people.append({"_key": person_key, "email": email})
+                if new_people and not await self.arango_service.batch_upsert_nodes(
+                    new_people, collection=CollectionNames.PEOPLE.value
+                ):
+                    raise Exception("Failed to save people for permissions")
+
+                if len(self._email_entities) > self.MAX_CACHED_EMAILS:
+                    self._email_entities.clear()
+                self._email_entities.update(entities_by_email)
+
+            for metadata in metadata_list:
+                # self.logger.debug(
+                #     "📝 Starting metadata processing: %s", metadata)
+                thread_metadata = metadata["thread"]
+                messages_metadata = metadata["messages"]
+                attachments_metadata = metadata["attachments"]
+                permissions_metadata = metadata["permissions"]
 
-                    if not thread_metadata:
-                        self.logger.warning("❌ No metadata found for thread, skipping")
-                        continue
+                self.logger.debug(
+                    "📨 Messages in current metadata: %d", len(messages_metadata)
+                )
+                self.logger.debug(
+                    "📎 Attachments in current metadata: %d",
+                    len(attachments_metadata),
+                )
 
-                    thread_id = thread_metadata["id"]
-                    self.logger.debug("🧵 Processing thread ID: %s", thread_id)
-                    if not thread_id:
-                        self.logger.warning(
-                            "❌ No thread ID found for thread, skipping"
-                        )
-                        continue
+                if not thread_metadata:
+                    self.logger.warning("❌ No metadata found for thread, skipping")
+                    continue
 
-                    # Process messages
-                    self.logger.debug(
-                        "📨 Processing %d messages for thread %s",
-                        len(messages_metadata),
-                        thread_id,
+                thread_id = thread_metadata["id"]
+                self.logger.debug("🧵 Processing thread ID: %s", thread_id)
+                if not thread_id:
+                    self.logger.warning(
+                        "❌ No thread ID found for thread, skipping"
                     )
+                    continue
 
-                    # Sort messages by internalDate to identify the first message in thread
-                    sorted_messages = sorted(
-                        messages_metadata,
-                        key=lambda x: int(x["message"].get("internalDate", 0)),
-                    )
+                # Process messages
+                self.logger.debug(
+                    "📨 Processing %d messages for thread %s",
+                    len(messages_metadata),
+                    thread_id,
+                )
 
-                    previous_message_key = (
-                        None  # Track previous message to create chain
-                    )
+                # Sort messages by internalDate to identify the first message in
+                # thread, parsing each date once for the sort and the record
+                sorted_messages = sorted(
+                    (
+                        (int(message_data["message"].get("internalDate") or 0), message_data)
+                        for message_data in messages_metadata
+                    ),
+                    key=itemgetter(0),
+                )
+
+                previous_message_key = (
+                    None  # Track previous message to create chain
+                )
+
+                for i, (internal_date, message_data) in enumerate(sorted_messages):
+                    message = message_data["message"]
+                    message_id = message["id"]
+                    self.logger.debug("📝 Processing message: %s", message_id)
+                    headers = message.get("headers", {})
+                    self.logger.debug("📝 Processing headers: %s", headers)
+
+                    subject = headers.get("Subject", "No Subject")
+                    date = headers.get("Date", None)
+                    from_email = headers.get("From", [""])[0]
+                    to_email = headers.get("To", [])
+                    cc_email = headers.get("Cc", [])
+                    bcc_email = headers.get("Bcc", [])
+                    message_id_header = headers.get("Message-ID", None)
+
+                    # Check if message exists
+                    existing_message_key = existing_record_keys.get(message_id)
 
-                    for i, message_data in enumerate(sorted_messages):
-                        message = message_data["message"]
-                        message_id = message["id"]
-                        self.logger.debug("📝 Processing message: %s", message_id)
-                        headers = message.get("headers", {})
-                        self.logger.debug("📝 Processing headers: %s", headers)
-
-                        subject = headers.get("Subject", "No Subject")
-                        date = headers.get("Date", None)
-                        from_email = headers.get("From", [""])[0]
-                        to_email = headers.get("To", [])
-                        cc_email = headers.get("Cc", [])
-                        bcc_email = headers.get("Bcc", [])
-                        message_id_header = headers.get("Message-ID", None)
-
-                        # Check if message exists
+                    if existing_message_key:
                         self.logger.debug(
-                            "🔍 Checking if message %s exists in ArangoDB", message_id
+                            "♻️ Message %s already exists in ArangoDB", message_id
                         )
-                        existing_message = self.arango_service.db.aql.execute(
-                            f"FOR doc IN {CollectionNames.RECORDS.value} FILTER doc.externalRecordId == @message_id RETURN doc",
-                            bind_vars={"message_id": message_id},
+                        existing_message_keys.append(existing_message_key)
+                        # Keep track of previous message key for chain
+                        previous_message_key = existing_message_key
+                    else:
+                        self.logger.debug(
+                            "➕ Creating new message record for %s", message_id
                         )
-                        existing_message = next(existing_message, None)
+                        message_record = {
+                            "_key": uuid.uuid4().hex,
+                            "threadId": thread_id,
+                            "isParent": i
+                            == 0,  # First message in sorted list is parent
+                            "internalDate": message.get("internalDate"),
+                            "subject": subject,
+                            "date": date,
+                            "from": from_email,
+                            "to": to_email,
+                            "cc": cc_email,
+                            "bcc": bcc_email,
+                            "messageIdHeader": message_id_header,
+                            # Move thread history to message
+                            "historyId": thread_metadata.get("historyId"),
+                            "webUrl": GMAIL_WEB_URL_PREFIX + message_id,
+                            "labelIds": message.get("labelIds", []),
+                        }
+                        self.logger.debug("📝 Message record: %s", message_record)
 
-                        if existing_message:
-                            self.logger.debug(
-                                "♻️ Message %s already exists in ArangoDB", message_id
-                            )
-                            existing_messages.append(message_id)
-                            # Keep track of previous message key for chain
-                            previous_message_key = existing_message["_key"]
-                        else:
+                        record = {
+                            "_key": message_record["_key"],
+                            "orgId": org_id,
+                            "recordName": subject,
+                            "externalRecordId": message_id,
+                            "externalRevisionId": None,
+                            "recordType": RecordTypes.MAIL.value,
+                            "version": 0,
+                            "origin": OriginTypes.CONNECTOR.value,
+                            "connectorName": Connectors.GOOGLE_MAIL.value,
+                            "createdAtTimestamp": current_timestamp,
+                            "updatedAtTimestamp": current_timestamp,
+                            "lastSyncTimestamp": current_timestamp,
+                            "sourceCreatedAtTimestamp": internal_date or None,
+                            "sourceLastModifiedTimestamp": internal_date or None,
+                            "isDeleted": False,
+                            "isArchived": False,
+                            "lastIndexTimestamp": None,
+                            "lastExtractionTimestamp": None,
+                            "indexingStatus": "NOT_STARTED",
+                            "extractionStatus": "NOT_STARTED",
+                            "virtualRecordId": None,
+                            "isLatestVersion": True,
+                            "isDirty": False,
+                            "reason": None,
+                        }
+
+                        # Create is_of_type edge
+                        is_of_type_record = {
+                            "_from": f'{CollectionNames.RECORDS.value}/{message_record["_key"]}',
+                            "_to": f'{CollectionNames.MAILS.value}/{message_record["_key"]}',
+                            "createdAtTimestamp": current_timestamp,
+                            "updatedAtTimestamp": current_timestamp,
+                        }
+
+                        messages.append(message_record)
+                        records.append(record)
+                        record_keys[record["externalRecordId"]] = record["_key"]
+                        is_of_type.append(is_of_type_record)
+                        self.logger.debug(
+                            "✅ Message record created: %s", message_record
+                        )
+
+                        # Create PARENT_CHILD relationship in thread if not first message
+                        if previous_message_key:
                             self.logger.debug(
-                                "➕ Creating new message record for %s", message_id
+                                "🔗 Creating PARENT_CHILD relation between messages in thread"
                             )
-                            message_record = {
-                                "_key": str(uuid.uuid4()),
-                                "threadId": thread_id,
-                                "isParent": i
-                                == 0,  # First message in sorted list is parent
-                                "internalDate": message.get("internalDate"),
-                                "subject": subject,
-                                "date": date,
-                                "from": from_email,
-                                "to": to_email,
-                                "cc": cc_email,
-                                "bcc": bcc_email,
-                                "messageIdHeader": message_id_header,
-                                # Move thread history to message
-                                "historyId": thread_metadata.get("historyId"),
-                                "webUrl": f"https://mail.google.com/mail?authuser={{user.email}}#all/{message_id}",
-                                "labelIds": message.get("labelIds", []),
-                            }
-                            self.logger.debug("📝 Message record: %s", message_record)
-
-                            record = {
-                                "_key": message_record["_key"],
-                                "orgId": org_id,
-                                "recordName": subject,
-                                "externalRecordId": message_id,
-                                "externalRevisionId": None,
-                                "recordType": RecordTypes.MAIL.value,
-                                "version": 0,
-                                "origin": OriginTypes.CONNECTOR.value,
-                                "connectorName": Connectors.GOOGLE_MAIL.value,
-                                "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                                "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
-                                "lastSyncTimestamp": get_epoch_timestamp_in_ms(),
-                                "sourceCreatedAtTimestamp": (
-                                    int(message.get("internalDate"))
-                                    if message.get("internalDate")
-                                    else None
-                                ),
-                                "sourceLastModifiedTimestamp": (
-                                    int(message.get("internalDate"))
-                                    if message.get("internalDate")
-                                    else None
-                                ),
-                                "isDeleted": False,
-                                "isArchived": False,
-                                "lastIndexTimestamp": None,
-                                "lastExtractionTimestamp": None,
-                                "indexingStatus": "NOT_STARTED",
-                                "extractionStatus": "NOT_STARTED",
-                                "virtualRecordId": None,
-                                "isLatestVersion": True,
-                                "isDirty": False,
-                                "reason": None,
-                            }
-
-                            # Create is_of_type edge
-                            is_of_type_record = {
-                                "_from": f'{CollectionNames.RECORDS.value}/{message_record["_key"]}',
-                                "_to": f'{CollectionNames.MAILS.value}/{message_record["_key"]}',
-                                "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                                "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
-                            }
-
-                            messages.append(message_record)
-                            records.append(record)
-                            is_of_type.append(is_of_type_record)
-                            self.logger.debug(
-                                "✅ Message record created: %s", message_record
+                            recordRelations.append(
+                                {
+                                    "_from": f"{CollectionNames.RECORDS.value}/{previous_message_key}",
+                                    "_to": f"{CollectionNames.RECORDS.value}/{message_record['_key']}",
+                                    "relationType": RecordRelations.SIBLING.value,
+                                }
                             )
 
-                            # Create PARENT_CHILD relationship in thread if not first message
-                            if previous_message_key:
-                                self.logger.debug(
-                                    "🔗 Creating PARENT_CHILD relation between messages in thread"
-                                )
-                                recordRelations.append(
-                                    {
-                                        "_from": f"{CollectionNames.RECORDS.value}/{previous_message_key}",
-                                        "_to": f"{CollectionNames.RECORDS.value}/{message_record['_key']}",
-                                        "relationType": RecordRelations.SIBLING.value,
-                                    }
-                                )
-
-                            # Update previous message key for next iteration
-                            previous_message_key = message_record["_key"]
+                        # Update previous message key for next iteration
+                        previous_message_key = message_record["_key"]
 
-                    # Process attachments
+                # Process attachments
+                self.logger.debug(
+                    "📎 Processing %d attachments", len(attachments_metadata)
+                )
+                for attachment in attachments_metadata:
+                    attachment_id = attachment["attachment_id"]
+                    message_id = attachment.get("message_id")
                     self.logger.debug(
-                        "📎 Processing %d attachments", len(attachments_metadata)
+                        "📎 Processing attachment %s for message %s",
+                        attachment_id,
+                        message_id,
                     )
-                    for attachment in attachments_metadata:
-                        attachment_id = attachment["attachment_id"]
-                        message_id = attachment.get("message_id")
+
+                    # Check if attachment exists
+                    if attachment_id in existing_record_keys:
                         self.logger.debug(
-                            "📎 Processing attachment %s for message %s",
+                            "♻️ Attachment %s already exists in ArangoDB",
                             attachment_id,
-                            message_id,
                         )
-
-                        # Check if attachment exists
+                        existing_attachment_keys.append(
+                            existing_record_keys[attachment_id]
+                        )
+                    else:
                         self.logger.debug(
-                            "🔍 Checking if attachment %s exists in ArangoDB",
+                            "➕ Creating new attachment record for %s",
                             attachment_id,
                         )
-                        existing_attachment = self.arango_service.db.aql.execute(
-                            "FOR doc IN records FILTER doc.externalRecordId == @attachment_id RETURN doc",
-                            bind_vars={"attachment_id": attachment_id},
+                        attachment_record = {
+                            "_key": uuid.uuid4().hex,
+                            "orgId": org_id,
+                            "name": attachment.get("filename"),
+                            "isFile": True,
+                            "mimeType": attachment.get("mimeType"),
+                            "extension": attachment.get("extension"),
+                            "sizeInBytes": int(attachment.get("size", 0)),
+                            "webUrl": GMAIL_WEB_URL_PREFIX + message_id,
+                        }
+                        record = {
+                            "_key": attachment_record["_key"],
+                            "orgId": org_id,
+                            "recordName": attachment.get("filename"),
+                            "recordType": RecordTypes.FILE.value,
+                            "version": 0,
+                            "createdAtTimestamp": current_timestamp,
+                            "updatedAtTimestamp": current_timestamp,
+                            "sourceCreatedAtTimestamp": (
+                                int(attachment.get("internalDate"))
+                                if attachment.get("internalDate")
+                                else None
+                            ),
+                            "sourceLastModifiedTimestamp": (
+                                int(attachment.get("internalDate"))
+                                if attachment.get("internalDate")
+                                else None
+                            ),
+                            "externalRecordId": attachment_id,
+                            "externalRevisionId": None,
+                            "origin": OriginTypes.CONNECTOR.value,
+                            "connectorName": Connectors.GOOGLE_MAIL.value,
+                            "lastSyncTimestamp": current_timestamp,
+                            "isDeleted": False,
+                            "isArchived": False,
+                            "virtualRecordId": None,
+                            "indexingStatus": "NOT_STARTED",
+                            "extractionStatus": "NOT_STARTED",
+                            "lastIndexTimestamp": None,
+                            "lastExtractionTimestamp": None,
+                            "isLatestVersion": True,
+                            "isDirty": False,
+                            "reason": None,
+                        }
+
+                        # Create is_of_type edge
+                        is_of_type_record = {
+                            "_from": f'{CollectionNames.RECORDS.value}/{attachment_record["_key"]}',
+                            "_to": f'{CollectionNames.FILES.value}/{attachment_record["_key"]}',
+                            "createdAtTimestamp": current_timestamp,
+                            "updatedAtTimestamp": current_timestamp,
+                        }
+
+                        attachments.append(attachment_record)
+                        records.append(record)
+                        record_keys[record["externalRecordId"]] = record["_key"]
+                        is_of_type.append(is_of_type_record)
+                        self.logger.debug(
+                            "✅ Attachment record created: %s", attachment_record
                         )
-                        existing_attachment = next(existing_attachment, None)
 
-                        if existing_attachment:
+                        # Create record relation
+                        message_key = record_keys.get(message_id)
+                        if message_key:
                             self.logger.debug(
-                                "♻️ Attachment %s already exists in ArangoDB",
+                                "🔗 Creating relation between message %s and attachment %s",
+                                message_id,
                                 attachment_id,
                             )
-                            existing_attachments.append(attachment_id)
+                            recordRelations.append(
+                                {
+                                    "_from": f"{CollectionNames.RECORDS.value}/{message_key}",
+                                    "_to": f"{CollectionNames.RECORDS.value}/{attachment_record['_key']}",
+                                    "relationType": RecordRelations.ATTACHMENT.value,
+                                }
+                            )
                         else:
-                            self.logger.debug(
-                                "➕ Creating new attachment record for %s",
+                            self.logger.warning(
+                                "⚠️ Could not find message key for attachment relation: %s -> %s",
+                                message_id,
                                 attachment_id,
                             )
-                            attachment_record = {
-                                "_key": str(uuid.uuid4()),
-                                "orgId": org_id,
-                                "name": attachment.get("filename"),
-                                "isFile": True,
-                                "messageId": message_id,
-                                "mimeType": attachment.get("mimeType"),
-                                "extension": attachment.get("extension"),
-                                "sizeInBytes": int(attachment.get("size", 0)),
-                                "webUrl": f"https://mail.google.com/mail?authuser={{user.email}}#all/{message_id}",
-                            }
-                            record = {
-                                "_key": attachment_record["_key"],
-                                "orgId": org_id,
-                                "recordName": attachment.get("filename"),
-                                "recordType": RecordTypes.FILE.value,
-                                "version": 0,
-                                "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                                "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
-                                "sourceCreatedAtTimestamp": (
-                                    int(attachment.get("internalDate"))
-                                    if attachment.get("internalDate")
-                                    else None
-                                ),
-                                "sourceLastModifiedTimestamp": (
-                                    int(attachment.get("internalDate"))
-                                    if attachment.get("internalDate")
-                                    else None
-                                ),
-                                "externalRecordId": attachment_id,
-                                "externalRevisionId": None,
-                                "origin": OriginTypes.CONNECTOR.value,
-                                "connectorName": Connectors.GOOGLE_MAIL.value,
-                                "lastSyncTimestamp": get_epoch_timestamp_in_ms(),
-                                "isDeleted": False,
-                                "isArchived": False,
-                                "virtualRecordId": None,
-                                "indexingStatus": "NOT_STARTED",
-                                "extractionStatus": "NOT_STARTED",
-                                "lastIndexTimestamp": None,
-                                "lastExtractionTimestamp": None,
-                                "isLatestVersion": True,
-                                "isDirty": False,
-                                "reason": None,
-                            }
-
-                            # Create is_of_type edge
-                            is_of_type_record = {
-                                "_from": f'{CollectionNames.RECORDS.value}/{attachment_record["_key"]}',
-                                "_to": f'{CollectionNames.FILES.value}/{attachment_record["_key"]}',
-                                "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                                "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
-                            }
-
-                            attachments.append(attachment_record)
-                            records.append(record)
-                            is_of_type.append(is_of_type_record)
-                            self.logger.debug(
-                                "✅ Attachment record created: %s", attachment_record
-                            )
 
-                            # Create record relation
-                            message_key = next(
-                                (
-                                    m["_key"]
-                                    for m in records
-                                    if m["externalRecordId"] == message_id
-                                ),
-                                None,
-                            )
-                            if message_key:
-                                self.logger.debug(
-                                    "🔗 Creating relation between message %s and attachment %s",
-                                    message_id,
-                                    attachment_id,
-                                )
-                                recordRelations.append(
-                                    {
-                                        "_from": f"{CollectionNames.RECORDS.value}/{message_key}",
-                                        "_to": f"{CollectionNames.RECORDS.value}/{attachment_record['_key']}",
-                                        "relationType": RecordRelations.ATTACHMENT.value,
-                                    }
-                                )
-                            else:
-                                self.logger.warning(
-                                    "⚠️ Could not find message key for attachment relation: %s -> %s",
-                                    message_id,
-                                    attachment_id,
-                                )
+                self.logger.debug("🔒 Processing permissions")
+                for permission in permissions_metadata:
+                    message_id = permission.get("messageId")
+                    attachment_ids = permission.get("attachmentIds", [])
+                    emails = permission.get("users", [])
+                    role = permission.get("role").upper()
+                    self.logger.debug(
+                        "Processing permission for message %s, users/groups %s",
+                        message_id,
+                        emails,
+                    )
 
-                    self.logger.debug("🔒 Processing permissions")
-                    for permission in permissions_metadata:
-                        message_id = permission.get("messageId")
-                        attachment_ids = permission.get("attachmentIds", [])
-                        emails = permission.get("users", [])
-                        role = permission.get("role").upper()
+                    # Get the correct message_key from messages based on messageId
+                    message_key = record_keys.get(message_id)
+                    if message_key:
                         self.logger.debug(
-                            "Processing permission for message %s, users/groups %s",
+                            "🔗 Creating relation between users/groups and message %s",
+                            message_id,
+                        )
+                        for email in emails:
+                            entity_type, entity_id = entities_by_email[email]
+                            permissions.append(
+                                {
+                                    "_to": f"{entity_type}/{entity_id}",
+                                    "_from": f"{CollectionNames.RECORDS.value}/{message_key}",
+                                    "role": role,
+                                    "externalPermissionId": None,
+                                    "type": (
+                                        "GROUP"
+                                        if entity_type == CollectionNames.GROUPS.value
+                                        else "USER"
+                                    ),
+                                    "createdAtTimestamp": current_timestamp,
+                                    "updatedAtTimestamp": current_timestamp,
+                                    "lastUpdatedTimestampAtSource": current_timestamp,
+                                }
+                            )
+                    else:
+                        self.logger.warning(
+                            "⚠️ Could not find message key for permission relation: message %s",
                             message_id,
-                            emails,
                         )
 
-                        # Get the correct message_key from messages based on messageId
-                        message_key = next(
-                            (
-                                m["_key"]
-                                for m in records
-                                if m["externalRecordId"] == message_id
-                            ),
-                            None,
+                    # Process permissions for attachments
+                    for attachment_id in attachment_ids:
+                        self.logger.debug(
+                            "🔗 Processing permission for attachment %s",
+                            attachment_id,
                         )
-                        if message_key:
+                        attachment_key = record_keys.get(attachment_id)
+                        if attachment_key:
                             self.logger.debug(
-                                "🔗 Creating relation between users/groups and message %s",
-                                message_id,
+                                "🔗 Creating relation between users/groups and attachment %s",
+                                attachment_id,
                             )
                             for email in emails:
-                                entity_id = (
-                                    await self.arango_service.get_entity_id_by_email(
-                                        email
-                                    )
-                                )
-                                if entity_id:
-                                    # Check if entity exists in users or groups
-                                    if self.arango_service.db.collection(
-                                        CollectionNames.USERS.value
-                                    ).has(entity_id):
-                                        entityType = CollectionNames.USERS.value
-                                        permType = "USER"
-                                    elif self.arango_service.db.collection(
-                                        CollectionNames.GROUPS.value
-                                    ).has(entity_id):
-                                        entityType = CollectionNames.GROUPS.value
-                                        permType = "GROUP"
-                                else:
-                                    # Save entity in people collection
-                                    entityType = CollectionNames.PEOPLE.value
-                                    entity_id = str(uuid.uuid4())
-                                    permType = "USER"
-                                    await self.arango_service.save_to_people_collection(
-                                        entity_id, email
-                                    )
-
+                                entity_type, entity_id = entities_by_email[email]
                                 permissions.append(
                                     {
-                                        "_to": f"{entityType}/{entity_id}",
-                                        "_from": f"{CollectionNames.RECORDS.value}/{message_key}",
+                                        "_to": f"{entity_type}/{entity_id}",
+                                        "_from": f"{CollectionNames.RECORDS.value}/{attachment_key}",
                                         "role": role,
                                         "externalPermissionId": None,
-                                        "type": permType,
-                                        "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                                        "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
-                                        "lastUpdatedTimestampAtSource": get_epoch_timestamp_in_ms(),
+                                        "type": (
+                                            "GROUP"
+                                            if entity_type
+                                            == CollectionNames.GROUPS.value
+                                            else "USER"
+                                        ),
+                                        "createdAtTimestamp": current_timestamp,
+                                        "updatedAtTimestamp": current_timestamp,
+                                        "lastUpdatedTimestampAtSource": current_timestamp,
                                     }
                                 )
                         else:
                             self.logger.warning(
-                                "⚠️ Could not find message key for permission relation: message %s",
-                                message_id,
-                            )
-
-                        # Process permissions for attachments
-                        for attachment_id in attachment_ids:
-                            self.logger.debug(
-                                "🔗 Processing permission for attachment %s",
+                                "⚠️ Could not find attachment key for permission relation: attachment %s",
                                 attachment_id,
                             )
-                            attachment_key = next(
-                                (
-                                    a["_key"]
-                                    for a in records
-                                    if a["externalRecordId"] == attachment_id
-                                ),
-                                None,
-                            )
-                            if attachment_key:
-                                self.logger.debug(
-                                    "🔗 Creating relation between users/groups and attachment %s",
-                                    attachment_id,
-                                )
-                                for email in emails:
-                                    entity_id = await self.arango_service.get_entity_id_by_email(
-                                        email
-                                    )
-                                    if entity_id:
-                                        # Check if entity exists in users or groups
-                                        if self.arango_service.db.collection(
-                                            CollectionNames.USERS.value
-                                        ).has(entity_id):
-                                            entityType = CollectionNames.USERS.value
-                                            permType = "USER"
-                                        elif self.arango_service.db.collection(
-                                            CollectionNames.GROUPS.value
-                                        ).has(entity_id):
-                                            entityType = CollectionNames.GROUPS.value
-                                            permType = "GROUP"
-                                    else:
-                                        # Save entity in people collection
-                                        entityType = CollectionNames.PEOPLE.value
-                                        entity_id = str(uuid.uuid4())
-                                        permType = "USER"
-                                        await self.arango_service.save_to_people_collection(
-                                            entity_id, email
-                                        )
-
-                                    permissions.append(
-                                        {
-                                            "_to": f"{entityType}/{entity_id}",
-                                            "_from": f"{CollectionNames.RECORDS.value}/{attachment_key}",
-                                            "role": role,
-                                            "externalPermissionId": None,
-                                            "type": permType,
-                                            "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                                            "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
-                                            "lastUpdatedTimestampAtSource": get_epoch_timestamp_in_ms(),
-                                        }
-                                    )
-                            else:
-                                self.logger.warning(
-                                    "⚠️ Could not find attachment key for permission relation: attachment %s",
-                                    attachment_id,
-                                )
 
-                # Batch process all collected data
-                self.logger.info("📊 Batch summary before processing:")
-                self.logger.info("- New messages to create: %d", len(messages))
-                self.logger.info("- New attachments to create: %d", len(attachments))
-                self.logger.info("- New relations to create: %d", len(recordRelations))
-                self.logger.info(
-                    "- Existing messages skipped: %d", len(existing_messages)
-                )
-                self.logger.info(
-                    "- Existing attachments skipped: %d", len(existing_attachments)
-                )
-
-                if messages or attachments:
-                    try:
-                        self.logger.debug("🔄 Starting database transaction")
-                        txn = None
-                        txn = self.arango_service.db.begin_transaction(
-                            read=[
-                                CollectionNames.MAILS.value,
-                                CollectionNames.RECORDS.value,
-                                CollectionNames.FILES.value,
-                                CollectionNames.RECORD_RELATIONS.value,
-                                CollectionNames.PERMISSIONS.value,
-                                CollectionNames.IS_OF_TYPE.value,
-                            ],
-                            write=[
-                                CollectionNames.MAILS.value,
-                                CollectionNames.RECORDS.value,
-                                CollectionNames.FILES.value,
-                                CollectionNames.RECORD_RELATIONS.value,
-                                CollectionNames.PERMISSIONS.value,
-                                CollectionNames.IS_OF_TYPE.value,
-                            ],
-                        )
-
-                        if messages:
-                            self.logger.debug("📥 Upserting %d messages", len(messages))
-                            if not await self.arango_service.batch_upsert_nodes(
-                                messages,
-                                collection=CollectionNames.MAILS.value,
-                                transaction=txn,
-                            ):
-                                raise Exception("Failed to batch upsert messages")
-                            self.logger.debug("✅ Messages upserted successfully")
-
-                        if attachments:
-                            # Create a copy of attachments without messageId
-                            attachment_docs = []
-                            for attachment in attachments:
-                                attachment_doc = attachment.copy()
-                                attachment_doc.pop(
-                                    "messageId", None
-                                )  # Remove messageId if it exists
-                                attachment_docs.append(attachment_doc)
-
-                            self.logger.debug(
-                                "📥 Upserting %d attachments", len(attachment_docs)
-                            )
-                            if not await self.arango_service.batch_upsert_nodes(
-                                attachment_docs,
-                                collection=CollectionNames.FILES.value,
-                                transaction=txn,
-                            ):
-                                raise Exception("Failed to batch upsert attachments")
-                            self.logger.debug("✅ Attachments upserted successfully")
-
-                        if records:
-                            self.logger.debug("📥 Upserting %d records", len(records))
-                            if not await self.arango_service.batch_upsert_nodes(
-                                records,
-                                collection=CollectionNames.RECORDS.value,
-                                transaction=txn,
-                            ):
-                                raise Exception("Failed to batch upsert records")
-                            self.logger.debug("✅ Records upserted successfully")
-
-                        if recordRelations:
-                            self.logger.debug(
-                                "🔗 Creating %d record relations", len(recordRelations)
-                            )
-                            if not await self.arango_service.batch_create_edges(
-                                recordRelations,
-                                collection=CollectionNames.RECORD_RELATIONS.value,
-                                transaction=txn,
-                            ):
-                                raise Exception("Failed to batch create relations")
-                            self.logger.debug(
-                                "✅ Record relations created successfully"
-                            )
+            # Batch process all collected data
+            self.logger.info("📊 Batch summary before processing:")
+            self.logger.info("- New messages to create: %d", len(messages))
+            self.logger.info("- New attachments to create: %d", len(attachments))
+            self.logger.info("- New relations to create: %d", len(recordRelations))
+            self.logger.info(
+                "- Existing messages skipped: %d", len(existing_message_keys)
+            )
+            self.logger.info(
+                "- Existing attachments skipped: %d", len(existing_attachment_keys)
+            )
 
-                        if is_of_type:
-                            self.logger.debug(
-                                "🔗 Creating %d is_of_type relations", len(is_of_type)
-                            )
-                            if not await self.arango_service.batch_create_edges(
-                                is_of_type,
-                                collection=CollectionNames.IS_OF_TYPE.value,
-                                transaction=txn,
-                            ):
-                                raise Exception(
-                                    "Failed to batch create is_of_type relations"
-                                )
-                            self.logger.debug(
-                                "✅ is_of_type relations created successfully"
-                            )
+            # Existing records are not rewritten, only marked as seen by this sync
+            if not await self.arango_service.touch_records(
+                existing_message_keys + existing_attachment_keys, current_timestamp
+            ):
+                self.logger.warning("⚠️ Failed to update lastSyncTimestamp of records")
 
-                        if permissions:
-                            self.logger.debug(
-                                "🔗 Creating %d permissions", len(permissions)
-                            )
+            if messages or attachments:
+                try:
+                    # A Drive file linked from several messages is one attachment
+                    # record, so the same edge can be built more than once
+                    permissions = list(
+                        {
+                            (permission["_from"], permission["_to"]): permission
+                            for permission in permissions
+                        }.values()
+                    )
 
-                            if not await self.arango_service.batch_create_edges(
-                                permissions,
-                                collection=CollectionNames.PERMISSIONS.value,
-                                transaction=txn,
-                            ):
-                                raise Exception("Failed to batch create permissions")
-                            self.logger.debug("✅ Permissions created successfully")
-
-                        self.logger.debug("✅ Committing transaction")
-                        txn.commit_transaction()
-
-                        txn = None
-
-                        processing_time = datetime.now(timezone.utc) - batch_start_time
-                        self.logger.info(
-                            """
-                        ✅ Batch processed successfully:
-                        - Messages: %d
-                        - Attachments: %d
-                        - Relations: %d
-                        - Processing Time: %s
-                        """,
-                            len(messages),
-                            len(attachments),
-                            len(recordRelations),
-                            processing_time,
-                        )
+                    self.logger.debug(
+                        "📥 Upserting %d messages, %d attachments, %d records, "
+                        "%d relations, %d is_of_type edges and %d permissions",
+                        len(messages),
+                        len(attachments),
+                        len(records),
+                        len(recordRelations),
+                        len(is_of_type),
+                        len(permissions),
+                    )
+                    # Records, their type and relation edges are all new in this
+                    # batch and can be inserted outright. Permissions may point at
+                    # records stored earlier, in which case they are upserted
+                    new_record_ids = {
+                        f"{CollectionNames.RECORDS.value}/{record['_key']}"
+                        for record in records
+                    }
+                    inserts = {
+                        CollectionNames.MAILS.value: messages,
+                        CollectionNames.FILES.value: attachments,
+                        CollectionNames.RECORDS.value: records,
+                        CollectionNames.RECORD_RELATIONS.value: recordRelations,
+                        CollectionNames.IS_OF_TYPE.value: is_of_type,
+                    }
+                    edges = {}
+                    if all(
+                        permission["_from"] in new_record_ids
+                        for permission in permissions
+                    ):
+                        inserts[CollectionNames.PERMISSIONS.value] = permissions
+                    else:
+                        edges[CollectionNames.PERMISSIONS.value] = permissions
+
+                    # A single AQL query is atomic on its own, so the batch is
+                    # written without a stream transaction around it
+                    if not await self.arango_service.batch_upsert_multi(
+                        {}, edges=edges, inserts=inserts
+                    ):
+                        raise Exception("Failed to batch upsert records")
+                    self.logger.debug("✅ Batch upserted successfully")
+
+                    processing_time = datetime.now(timezone.utc) - batch_start_time
+                    self._adapt_batch_size(
+                        metadata_list, processing_time.total_seconds()
+                    )
+                    self.logger.info(
+                        """
+                    ✅ Batch processed successfully:
+                    - Messages: %d
+                    - Attachments: %d
+                    - Relations: %d
+                    - Processing Time: %s
+                    """,
+                        len(messages),
+                        len(attachments),
+                        len(recordRelations),
+                        processing_time,
+                    )
 
-                        return True
+                    return True
 
-                    except Exception as e:
-                        if txn:
-                            self.logger.error(
-                                "❌ Transaction failed, rolling back: %s", str(e)
-                            )
-                            txn.abort_transaction()
-                        self.logger.error("❌ Failed to process batch data: %s", str(e))
-                        return False
+                except Exception as e:
+                    self.logger.error("❌ Failed to process batch data: %s", str(e))
+                    return False
 
-                self.logger.info(
-                    "✅ Batch processing completed with no new data to process"
-                )
-                return True
+            self.logger.info(
+                "✅ Batch processing completed with no new data to process"
+            )
+            return True
 
         except Exception as e:
             self.logger.error("❌ Batch processing failed with error: %s", str(e))
             return False
+        finally:
+            self._active_batches -= 1
+            if not self._active_batches:
+                self._batch_idle.set()
 
 
 class GmailSyncEnterpriseService(BaseGmailSyncService):
     """Sync service for enterprise setup using admin service"""
 
+    # Users whose mailboxes are synced at the same time during initial sync
+    MAX_CONCURRENT_USERS = 5
+
     def __init__(
         self,
         logger,
@@ -955,54 +1259,57 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
             if not await self.connect_services(org_id):
                 return False
 
-            # List and store enterprise users
             enterprise_users = await self.gmail_admin_service.list_enterprise_users(org_id)
+            groups = await self.gmail_admin_service.list_groups(org_id)
+
+            # Look up which users and groups are already stored in one query
+            existing_entities = await self.arango_service.get_entity_ids_by_emails(
+                [entity["email"] for entity in enterprise_users + groups]
+            )
+            existing_emails = {
+                email
+                for email, (collection, _) in existing_entities.items()
+                if collection != CollectionNames.PEOPLE.value
+            }
+
+            # Store new enterprise users
             if enterprise_users:
                 self.logger.info("🚀 Found %s users", len(enterprise_users))
-
-                for user in enterprise_users:
-                    # Add sync state to user info
-                    user_id = await self.arango_service.get_entity_id_by_email(
-                        user["email"]
+                new_users = [
+                    user
+                    for user in enterprise_users
+                    if user["email"] not in existing_emails
+                ]
+                if new_users:
+                    await self.arango_service.batch_upsert_nodes(
+                        new_users, collection=CollectionNames.USERS.value
                     )
-                    if not user_id:
-                        await self.arango_service.batch_upsert_nodes(
-                            [user], collection=CollectionNames.USERS.value
-                        )
 
-            # List and store groups
-            groups = await self.gmail_admin_service.list_groups(org_id)
+            # Store new groups
             if groups:
                 self.logger.info("🚀 Found %s groups", len(groups))
-
-                for group in groups:
-                    group_id = await self.arango_service.get_entity_id_by_email(
-                        group["email"]
+                new_groups = [
+                    group for group in groups if group["email"] not in existing_emails
+                ]
+                if new_groups:
+                    await self.arango_service.batch_upsert_nodes(
+                        new_groups, collection=CollectionNames.GROUPS.value
                     )
-                    if not group_id:
-                        await self.arango_service.batch_upsert_nodes(
-                            [group], collection=CollectionNames.GROUPS.value
-                        )
 
             # Create relationships between users and groups in belongsTo collection
             belongs_to_group_relations = []
+            members_by_group = await self.gmail_admin_service.batch_list_group_members(
+                [group["email"] for group in groups]
+            )
+            users_by_email = {user["email"]: user for user in enterprise_users}
             for group in groups:
                 try:
                     # Get group members for each group
-                    group_members = await self.gmail_admin_service.list_group_members(
-                        group["email"]
-                    )
+                    group_members = members_by_group.get(group["email"], [])
 
                     for member in group_members:
                         # Find the matching user
-                        matching_user = next(
-                            (
-                                user
-                                for user in enterprise_users
-                                if user["email"] == member["email"]
-                            ),
-                            None,
-                        )
+                        matching_user = users_by_email.get(member["email"])
 
                         if matching_user:
                             # Check if the relationship already exists
@@ -1029,17 +1336,6 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
                         str(e),
                     )
 
-            # Batch insert belongsTo group relations
-            if belongs_to_group_relations:
-                await self.arango_service.batch_create_edges(
-                    belongs_to_group_relations,
-                    collection=CollectionNames.BELONGS_TO.value,
-                )
-                self.logger.info(
-                    "✅ Created %s user-group relationships",
-                    len(belongs_to_group_relations),
-                )
-
             # Create relationships between users and orgs in belongsTo collection
             belongs_to_org_relations = []
             for user in enterprise_users:
@@ -1057,49 +1353,37 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
                     }
                     belongs_to_org_relations.append(relation)
 
-            if belongs_to_org_relations:
+            # Batch insert belongsTo group and org relations in one request
+            if belongs_to_group_relations or belongs_to_org_relations:
                 await self.arango_service.batch_create_edges(
-                    belongs_to_org_relations,
+                    belongs_to_group_relations + belongs_to_org_relations,
                     collection=CollectionNames.BELONGS_TO.value,
                 )
                 self.logger.info(
-                    "✅ Created %s user-organization relationships",
+                    "✅ Created %s user-group and %s user-organization relationships",
+                    len(belongs_to_group_relations),
                     len(belongs_to_org_relations),
                 )
 
             await self.celery_app.setup_app()
 
-            # Set up changes watch for each user
-            active_users = await self.arango_service.get_users(org_id, active=True)
-            for user in active_users:
-                # Check if user exists in enterprise users
-                is_enterprise_user = False
-                for enterprise_user in enterprise_users:
-                    if enterprise_user["email"] == user["email"]:
-                        is_enterprise_user = True
-                        break
-
-                if not is_enterprise_user:
-                    self.logger.warning(f"User {user['email']} not found in enterprise users")
-                    continue
-
-                self.logger.info(f"Found enterprise user {user['email']}, continuing with sync")
-
-                sync_state = await self.arango_service.get_user_sync_state(
-                    user["email"], Connectors.GOOGLE_MAIL.value
-                )
-                current_state = (
-                    sync_state.get("syncState") if sync_state else "NOT_STARTED"
-                )
-                if current_state == "IN_PROGRESS":
-                    self.logger.warning(
-                        f"Sync is currently RUNNING for user {user['email']}. Pausing it."
-                    )
-                    await self.arango_service.update_user_sync_state(
-                        user["email"],
-                        "PAUSED",
-                        service_type=Connectors.GOOGLE_MAIL.value,
-                    )
+            # Set up changes watch for each user
+            active_users = await self.arango_service.get_users(org_id, active=True)
+            paused_emails = await self.arango_service.pause_running_user_syncs(
+                [user["email"] for user in active_users if user["email"] in users_by_email],
+                Connectors.GOOGLE_MAIL.value,
+            )
+            for email in paused_emails:
+                self.logger.warning(
+                    "Sync was RUNNING for user %s, paused it", email
+                )
+            for user in active_users:
+                # Check if user exists in enterprise users
+                if user["email"] not in users_by_email:
+                    self.logger.warning(f"User {user['email']} not found in enterprise users")
+                    continue
+
+                self.logger.info(f"Found enterprise user {user['email']}, continuing with sync")
 
                 self.logger.info(
                     "🚀 Setting up changes watch for user %s", user["email"]
@@ -1143,7 +1427,7 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
         """First phase: Build complete gmail structure"""
         try:
             # Add global stop check at the start
-            if await self._should_stop(org_id):
+            if self._stop_event.is_set():
                 self.logger.info("Sync stopped before starting")
                 return False
 
@@ -1151,354 +1435,286 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
             users = await self.arango_service.get_users(org_id=org_id)
             account_type = await self.arango_service.get_account_type(org_id=org_id)
 
-            for user in users:
-                enterprise_users = await self.gmail_admin_service.list_enterprise_users(org_id)
-
-                # Check if user exists in enterprise users
-                is_enterprise_user = False
-                for enterprise_user in enterprise_users:
-                    if enterprise_user["email"] == user["email"]:
-                        is_enterprise_user = True
-                        break
-
-                if not is_enterprise_user:
-                    self.logger.warning(f"User {user['email']} not found in enterprise users")
-                    continue
-
-                self.logger.info(f"Found enterprise user {user['email']}, continuing with sync")
-
+            enterprise_users = await self.gmail_admin_service.list_enterprise_users(org_id)
+            enterprise_emails = {
+                enterprise_user["email"] for enterprise_user in enterprise_users
+            }
 
-                sync_state = await self.arango_service.get_user_sync_state(
-                    user["email"], Connectors.GOOGLE_MAIL.value
-                )
-                if sync_state is None:
-                    apps = await self.arango_service.get_org_apps(org_id)
-                    for app in apps:
-                        if app["name"] == Connectors.GOOGLE_MAIL.value:
-                            app_key = app["_key"]
-                            break
-                    # Create edge between user and app
-                    app_edge_data = {
-                        "_from": f"{CollectionNames.USERS.value}/{user['_key']}",
-                        "_to": f"{CollectionNames.APPS.value}/{app_key}",
-                        "syncState": "NOT_STARTED",
-                        "lastSyncUpdate": get_epoch_timestamp_in_ms(),
-                    }
-                    await self.arango_service.batch_create_edges(
-                        [app_edge_data],
-                        CollectionNames.USER_APP_RELATION.value,
-                    )
-                    sync_state = app_edge_data
+            # Sync users concurrently, a bounded number at a time
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_USERS)
 
-                current_state = sync_state.get("syncState")
-                if current_state == "COMPLETED":
-                    self.logger.info(
-                        "💥 Gmail sync is already completed for user %s", user["email"]
+            async def sync_user(user):
+                async with semaphore:
+                    return await self._sync_user(
+                        org_id, user, account_type, enterprise_emails
                     )
-                    try:
-                        if not await self.resync_gmail(org_id, user):
-                            self.logger.error(
-                                f"Failed to resync gmail for user {user['email']}"
-                            )
-                            continue
-                    except Exception as e:
-                        self.logger.error(
-                            f"Error processing user {user['email']}: {str(e)}"
-                        )
-                        continue
-
-                    continue
 
-                await self.arango_service.update_user_sync_state(
-                    user["email"],
-                    "IN_PROGRESS",
-                    service_type=Connectors.GOOGLE_MAIL.value,
-                )
+            results = await asyncio.gather(
+                *(sync_user(user) for user in users), return_exceptions=True
+            )
 
-                # Stop checks
-                if await self._should_stop(org_id):
-                    self.logger.info(
-                        "Sync stopped during user %s processing", user["email"]
+            failed = False
+            for user, result in zip(users, results):
+                if isinstance(result, Exception):
+                    failed = True
+                    self.logger.error(
+                        "❌ Initial sync failed for user %s: %s",
+                        user["email"],
+                        str(result),
                     )
                     await self.arango_service.update_user_sync_state(
                         user["email"],
-                        "PAUSED",
+                        "FAILED",
                         service_type=Connectors.GOOGLE_MAIL.value,
                     )
-                    return False
+            if failed or not all(results):
+                return False
 
-                # Initialize user service
-                user_service = await self.gmail_admin_service.create_gmail_user_service(
-                    user["email"]
-                )
-                if not user_service:
-                    self.logger.warning(
-                        "❌ Failed to create user service for user: %s", user["email"]
-                    )
-                    continue
+            # Add completion handling
+            self.is_completed = True
+            return True
 
-                # List all threads for the user
-                threads = await user_service.list_threads()
-                for thread in threads:
-                    if thread.get("historyId"):
-                        self.logger.info("🚀 Thread historyId: %s", thread["historyId"])
-                        channel_history = await self.arango_service.get_channel_history_id(user["email"])
-                        if not channel_history:
-                            await self.arango_service.store_channel_history_id(
-                                history_id=thread["historyId"],
-                                expiration=None,
-                                user_email=user["email"],
-                            )
-                        break
+        except Exception as e:
+            self.logger.error(f"❌ Initial sync failed: {str(e)}")
+            return False
 
-                messages_list = await user_service.list_messages()
-                messages_full = []
-                attachments = []
-                permissions = []
-                for message in messages_list:
-                    message_data = await user_service.get_message(message["id"])
-                    messages_full.append(message_data)
+    async def _sync_user(self, org_id, user, account_type, enterprise_emails) -> bool:
+        """Run the initial sync for one enterprise user
 
-                for message in messages_full:
-                    attachments_for_message = await user_service.list_attachments(
-                        message, org_id, user, account_type
-                    )
-                    attachments.extend(attachments_for_message)
-                    attachment_ids = [
-                        attachment["attachment_id"]
-                        for attachment in attachments_for_message
-                    ]
-                    headers = message.get("headers", {})
-                    permission = {
-                        "messageId": message["id"],
-                        "attachmentIds": attachment_ids,
-                        "role": "reader",
-                        "users": [
-                            *(
-                                headers.get("To", [])
-                                if isinstance(headers.get("To"), list)
-                                else [headers.get("To")] if headers.get("To") else []
-                            ),
-                            *(
-                                headers.get("From", [])
-                                if isinstance(headers.get("From"), list)
-                                else (
-                                    [headers.get("From")] if headers.get("From") else []
-                                )
-                            ),
-                            *(
-                                headers.get("Cc", [])
-                                if isinstance(headers.get("Cc"), list)
-                                else [headers.get("Cc")] if headers.get("Cc") else []
-                            ),
-                            *(
-                                headers.get("Bcc", [])
-                                if isinstance(headers.get("Bcc"), list)
-                                else [headers.get("Bcc")] if headers.get("Bcc") else []
-                            ),
-                        ],
-                    }
-                    permissions.append(permission)
+        Returns:
+            False if the sync was stopped or a batch failed, True otherwise
+        """
+        if user["email"] not in enterprise_emails:
+            self.logger.warning(f"User {user['email']} not found in enterprise users")
+            return True
 
-                if not threads:
-                    self.logger.info(f"No threads found for user {user['email']}")
-                    continue
+        self.logger.info(f"Found enterprise user {user['email']}, continuing with sync")
 
-                self.progress.total_files = len(threads) + len(messages_full)
-                self.logger.info("🚀 Total threads: %s", len(threads))
-                # self.logger.debug(f"Threads: {threads}")
-                self.logger.info("🚀 Total messages: %s", len(messages_full))
-                # self.logger.debug(f"Messages: {messages_full}")
-                self.logger.info("🚀 Total permissions: %s", len(permissions))
-                self.logger.debug(f"Permissions: {permissions}")
-
-                # Process threads in batches
-                batch_size = 50
-                start_batch = 0
-
-                for i in range(start_batch, len(threads), batch_size):
-                    # Stop check before each batch
-                    if await self._should_stop(org_id):
-                        self.logger.info(
-                            f"Sync stopped during batch processing at index {i}"
-                        )
-                        # Save current state before stopping
-                        return False
+        sync_state = await self.arango_service.get_user_sync_state(
+            user["email"], Connectors.GOOGLE_MAIL.value
+        )
+        if sync_state is None:
+            apps = await self.arango_service.get_org_apps(org_id)
+            for app in apps:
+                if app["name"] == Connectors.GOOGLE_MAIL.value:
+                    app_key = app["_key"]
+                    break
+            # Create edge between user and app
+            app_edge_data = {
+                "_from": f"{CollectionNames.USERS.value}/{user['_key']}",
+                "_to": f"{CollectionNames.APPS.value}/{app_key}",
+                "syncState": "NOT_STARTED",
+                "lastSyncUpdate": get_epoch_timestamp_in_ms(),
+            }
+            await self.arango_service.batch_create_edges(
+                [app_edge_data],
+                CollectionNames.USER_APP_RELATION.value,
+            )
+            sync_state = app_edge_data
 
-                    batch = threads[i : i + batch_size]
-                    self.logger.info(
-                        "🚀 Processing batch of %s threads starting at index %s",
-                        len(batch),
-                        i,
+        current_state = sync_state.get("syncState")
+        if current_state == "COMPLETED":
+            self.logger.info(
+                "💥 Gmail sync is already completed for user %s", user["email"]
+            )
+            try:
+                if not await self.resync_gmail(org_id, user):
+                    self.logger.error(
+                        f"Failed to resync gmail for user {user['email']}"
                     )
-                    batch_metadata = []
+                    return True
+            except Exception as e:
+                self.logger.error(
+                    f"Error processing user {user['email']}: {str(e)}"
+                )
+                return True
 
-                    # Process each thread in batch
-                    for thread in batch:
-                        thread_messages = []
-                        thread_attachments = []
+            return True
 
-                        current_thread_messages = [
-                            m
-                            for m in messages_full
-                            if m.get("threadId") == thread["id"]
-                        ]
+        await self.arango_service.update_user_sync_state(
+            user["email"],
+            "IN_PROGRESS",
+            service_type=Connectors.GOOGLE_MAIL.value,
+        )
 
-                        if not current_thread_messages:
-                            self.logger.warning(
-                                "❌ 1. No messages found for thread %s", thread["id"]
-                            )
-                            continue
+        # Stop checks
+        if self._stop_event.is_set():
+            self.logger.info(
+                "Sync stopped during user %s processing", user["email"]
+            )
+            await self.arango_service.update_user_sync_state(
+                user["email"],
+                "PAUSED",
+                service_type=Connectors.GOOGLE_MAIL.value,
+            )
+            return False
 
-                        self.logger.info(
-                            "📨 Found %s messages in thread %s",
-                            len(current_thread_messages),
-                            thread["id"],
-                        )
+        # Initialize user service
+        user_service = await self.gmail_admin_service.create_gmail_user_service(
+            user["email"]
+        )
+        if not user_service:
+            self.logger.warning(
+                "❌ Failed to create user service for user: %s", user["email"]
+            )
+            return True
 
-                        # Process each message
-                        for message in current_thread_messages:
-                            message_attachments = await user_service.list_attachments(
-                                message, org_id, user, account_type
-                            )
-                            if message_attachments:
-                                self.logger.debug(
-                                    "📎 Found %s attachments in message %s",
-                                    len(message_attachments),
-                                    message["id"],
-                                )
-                                thread_attachments.extend(message_attachments)
+        # List all threads for the user
+        threads = await user_service.list_threads()
+        for thread in threads:
+            if thread.get("historyId"):
+                self.logger.info("🚀 Thread historyId: %s", thread["historyId"])
+                channel_history = await self.arango_service.get_channel_history_id(user["email"])
+                if not channel_history:
+                    await self.arango_service.store_channel_history_id(
+                        history_id=thread["historyId"],
+                        expiration=None,
+                        user_email=user["email"],
+                    )
+                break
 
-                            # Add message with its attachments
-                            thread_messages.append(
-                                {"message": message, "attachments": message_attachments}
-                            )
+        messages_list = await user_service.list_messages()
+        # Message ids by thread; full messages are fetched one batch at a time
+        messages_by_thread_id = defaultdict(list)
+        for message in messages_list:
+            messages_by_thread_id[message["threadId"]].append(message)
 
-                        # Prepare complete thread metadata
-                        metadata = {
-                            "thread": thread,
-                            "thread_id": thread["id"],
-                            "messages": thread_messages,
-                            "attachments": thread_attachments,
-                            "permissions": permissions,
-                        }
+        if not threads:
+            self.logger.info(f"No threads found for user {user['email']}")
+            return True
 
-                        self.logger.info(
-                            "✅ Completed thread %s processing: %s messages, %s attachments",
-                            thread["id"],
-                            len(thread_messages),
-                            len(thread_attachments),
-                        )
-                        batch_metadata.append(metadata)
+        self.progress.total_files = len(threads) + len(messages_list)
+        self.logger.info("🚀 Total threads: %s", len(threads))
+        # self.logger.debug(f"Threads: {threads}")
+        self.logger.info("🚀 Total messages: %s", len(messages_list))
+
+        # Written batches whose events are still being sent; the resume
+        # checkpoint only moves past batches that were written and sent
+        pending_batches = deque()
+        checkpoint_open = True
+        # Send result of every batch of this user
+        sent_batches = []
+
+        # Process threads in batches
+        thread_batches = self._fetched_thread_batches(
+            user_service,
+            threads,
+            sync_state,
+            messages_by_thread_id,
+            org_id,
+            user,
+            account_type,
+        )
+        async for i, batch, fetched in thread_batches:
+            # Stop check before each batch
+            if self._stop_event.is_set():
+                self.logger.info(
+                    f"Sync stopped during batch processing at index {i}"
+                )
+                await self.arango_service.update_user_sync_state(
+                    user["email"],
+                    "PAUSED",
+                    Connectors.GOOGLE_MAIL.value,
+                    expected_state="IN_PROGRESS",
+                )
+                # Cancel the prefetch of the next batch
+                await thread_batches.aclose()
+                return False
 
-                    self.logger.info(
-                        "✅ Completed batch processing: %s threads", len(batch_metadata)
+            self.logger.info(
+                "🚀 Processing batch of %s threads starting at index %s",
+                len(batch),
+                i,
+            )
+            (
+                messages_by_thread,
+                attachments_by_message,
+                permissions_by_message,
+            ) = fetched
+            batch_metadata = []
+
+            # Process each thread in batch
+            for thread in batch:
+                thread_messages = []
+                thread_attachments = []
+
+                current_thread_messages = messages_by_thread.get(
+                    thread["id"], []
+                )
+
+                if not current_thread_messages:
+                    self.logger.warning(
+                        "❌ 1. No messages found for thread %s", thread["id"]
                     )
+                    continue
 
-                    # Process the batch metadata
-                    if not await self.process_batch(batch_metadata, org_id):
-                        self.logger.warning(
-                            "Failed to process batch starting at index %s", i
-                        )
-                        continue
+                self.logger.debug(
+                    "📨 Found %s messages in thread %s",
+                    len(current_thread_messages),
+                    thread["id"],
+                )
 
-                    endpoints = await self.config_service.get_config(
-                        config_node_constants.ENDPOINTS.value
+                # Process each message
+                for message in current_thread_messages:
+                    message_attachments = attachments_by_message.get(
+                        message["id"], []
                     )
-                    connector_endpoint = endpoints.get("connectors").get("endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value)
-
-                    # Send events to Kafka for the batch
-                    for metadata in batch_metadata:
-                        for message_data in metadata["messages"]:
-                            message = message_data["message"]
-                            message_key = await self.arango_service.get_key_by_external_message_id(
-                                message["id"]
-                            )
-                            user_id = user["userId"]
-
-                            headers = message.get("headers", {})
-                            message_event = {
-                                "orgId": org_id,
-                                "recordId": message_key,
-                                "recordName": headers.get("Subject", "No Subject"),
-                                "recordType": RecordTypes.MAIL.value,
-                                "recordVersion": 0,
-                                "eventType": EventTypes.NEW_RECORD.value,
-                                "body": message.get("body", ""),
-                                "signedUrlRoute": f"{connector_endpoint}/api/v1/{org_id}/{user_id}/gmail/record/{message_key}/signedUrl",
-                                "connectorName": Connectors.GOOGLE_MAIL.value,
-                                "origin": OriginTypes.CONNECTOR.value,
-                                "mimeType": "text/gmail_content",
-                                "createdAtSourceTimestamp": int(
-                                    message.get(
-                                        "internalDate",
-                                        get_epoch_timestamp_in_ms(),
-                                    )
-                                ),
-                                "modifiedAtSourceTimestamp": int(
-                                    message.get(
-                                        "internalDate",
-                                        get_epoch_timestamp_in_ms(),
-                                    )
-                                ),
-                            }
-                            await self.kafka_service.send_event_to_kafka(message_event)
-                            self.logger.info(
-                                "📨 Sent Kafka Indexing event for message %s",
-                                message_key,
-                            )
-
-                        # Attachment events
-                        for attachment in metadata["attachments"]:
-                            attachment_key = (
-                                await self.arango_service.get_key_by_attachment_id(
-                                    attachment["attachment_id"]
-                                )
-                            )
-                            attachment_event = {
-                                "orgId": org_id,
-                                "recordId": attachment_key,
-                                "recordName": attachment.get(
-                                    "filename", "Unnamed Attachment"
-                                ),
-                                "recordType": RecordTypes.ATTACHMENT.value,
-                                "recordVersion": 0,
-                                "eventType": EventTypes.NEW_RECORD.value,
-                                "signedUrlRoute": f"{connector_endpoint}/api/v1/{org_id}/{user_id}/gmail/record/{attachment_key}/signedUrl",
-                                "connectorName": Connectors.GOOGLE_MAIL.value,
-                                "origin": OriginTypes.CONNECTOR.value,
-                                "mimeType": attachment.get(
-                                    "mimeType", "application/octet-stream"
-                                ),
-                                "size": attachment.get("size", 0),
-                                "createdAtSourceTimestamp": get_epoch_timestamp_in_ms(),
-                                "modifiedAtSourceTimestamp": get_epoch_timestamp_in_ms(),
-                            }
-                            await self.kafka_service.send_event_to_kafka(
-                                attachment_event
-                            )
-                            self.logger.info(
-                                "📨 Sent Kafka Indexing event for attachment %s",
-                                attachment_key,
-                            )
+                    if message_attachments:
+                        self.logger.debug(
+                            "📎 Found %s attachments in message %s",
+                            len(message_attachments),
+                            message["id"],
+                        )
+                        thread_attachments.extend(message_attachments)
+
+                    # Attachments are carried once, on the thread
+                    thread_messages.append({"message": message})
+
+                # Prepare complete thread metadata
+                metadata = {
+                    "thread": thread,
+                    "thread_id": thread["id"],
+                    "messages": thread_messages,
+                    "attachments": thread_attachments,
+                    # Only the permissions of the thread's own messages
+                    "permissions": [
+                        permissions_by_message[message["id"]]
+                        for message in current_thread_messages
+                    ],
+                }
 
-                await self.arango_service.update_user_sync_state(
-                    user["email"],
-                    "COMPLETED",
-                    service_type=Connectors.GOOGLE_MAIL.value,
+                self.logger.debug(
+                    "✅ Completed thread %s processing: %s messages, %s attachments",
+                    thread["id"],
+                    len(thread_messages),
+                    len(thread_attachments),
                 )
+                batch_metadata.append(metadata)
 
-            # Add completion handling
-            self.is_completed = True
-            return True
+            self.logger.info(
+                "✅ Completed batch processing: %s threads", len(batch_metadata)
+            )
 
-        except Exception as e:
-            if "user" in locals():
-                await self.arango_service.update_user_sync_state(
-                    user["email"], "FAILED", service_type=Connectors.GOOGLE_MAIL.value
+            # Process the batch metadata
+            if not await self.process_batch(batch_metadata, org_id):
+                self.logger.warning(
+                    "Failed to process batch starting at index %s", i
+                )
+                # A resumed sync has to write this batch again
+                checkpoint_open = False
+                continue
+
+            sent = await self._queue_batch_events(batch_metadata, org_id, user)
+            sent_batches.append(sent)
+            if checkpoint_open:
+                pending_batches.append((sent, batch[-1]["id"]))
+                checkpoint_open = await self._advance_sync_checkpoint(
+                    user["email"], pending_batches
                 )
-            self.logger.error(f"❌ Initial sync failed: {str(e)}")
-            return False
+
+        return await self._finish_user_sync(
+            user["email"], sent_batches, pending_batches, checkpoint_open
+        )
 
     async def sync_specific_user(self, user_email: str) -> bool:
         """Synchronize a specific user's Gmail content"""
@@ -1618,72 +1834,45 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
                 )
                 return True
 
-            # Process messages and build full metadata
-            messages_full = []
-            attachments = []
-            permissions = []
-
+            # Message ids by thread; full messages are fetched one batch at a time
+            messages_by_thread_id = defaultdict(list)
             for message in messages_list:
-                message_data = await user_service.get_message(message["id"])
-                messages_full.append(message_data)
-
-                # Get attachments for message
-                attachments_for_message = await user_service.list_attachments(
-                    message_data, org_id, user, account_type
-                )
-                attachments.extend(attachments_for_message)
-                attachment_ids = [
-                    attachment["attachment_id"]
-                    for attachment in attachments_for_message
-                ]
+                messages_by_thread_id[message["threadId"]].append(message)
 
-                # Build permissions from message headers
-                headers = message_data.get("headers", {})
-                permissions.append(
-                    {
-                        "messageId": message["id"],
-                        "attachmentIds": attachment_ids,
-                        "role": "reader",
-                        "users": [
-                            *(
-                                headers.get("To", [])
-                                if isinstance(headers.get("To"), list)
-                                else [headers.get("To")] if headers.get("To") else []
-                            ),
-                            *(
-                                headers.get("From", [])
-                                if isinstance(headers.get("From"), list)
-                                else (
-                                    [headers.get("From")] if headers.get("From") else []
-                                )
-                            ),
-                            *(
-                                headers.get("Cc", [])
-                                if isinstance(headers.get("Cc"), list)
-                                else [headers.get("Cc")] if headers.get("Cc") else []
-                            ),
-                            *(
-                                headers.get("Bcc", [])
-                                if isinstance(headers.get("Bcc"), list)
-                                else [headers.get("Bcc")] if headers.get("Bcc") else []
-                            ),
-                        ],
-                    }
-                )
+            # Written batches whose events are still being sent; the resume
+            # checkpoint only moves past batches that were written and sent
+            pending_batches = deque()
+            checkpoint_open = True
+            # Send result of every batch of this user
+            sent_batches = []
 
             # Process threads in batches
-            batch_size = 50
-            for i in range(0, len(threads), batch_size):
-                if await self._should_stop(org_id):
+            thread_batches = self._fetched_thread_batches(
+                user_service,
+                threads,
+                sync_state,
+                messages_by_thread_id,
+                org_id,
+                user,
+                account_type,
+            )
+            async for i, batch, fetched in thread_batches:
+                if self._stop_event.is_set():
                     self.logger.info(
                         "Sync stopped during batch processing at index %s", i
                     )
                     await self.arango_service.update_user_sync_state(
                         user_email, "PAUSED", Connectors.GOOGLE_MAIL.value
                     )
+                    # Cancel the prefetch of the next batch
+                    await thread_batches.aclose()
                     return False
 
-                batch = threads[i : i + batch_size]
+                (
+                    messages_by_thread,
+                    attachments_by_message,
+                    permissions_by_message,
+                ) = fetched
                 batch_metadata = []
 
                 # Process each thread in batch
@@ -1692,9 +1881,7 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
                     thread_attachments = []
 
                     # Get messages for this thread
-                    current_thread_messages = [
-                        m for m in messages_full if m.get("threadId") == thread["id"]
-                    ]
+                    current_thread_messages = messages_by_thread.get(thread["id"], [])
 
                     if not current_thread_messages:
                         self.logger.warning(
@@ -1704,9 +1891,7 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
 
                     # Process messages in thread
                     for message in current_thread_messages:
-                        message_attachments = await user_service.list_attachments(
-                            message, org_id, user, account_type
-                        )
+                        message_attachments = attachments_by_message.get(message["id"], [])
                         if message_attachments:
                             thread_attachments.extend(message_attachments)
                         thread_messages.append({"message": message})
@@ -1717,7 +1902,11 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
                         "threadId": thread["id"],
                         "messages": thread_messages,
                         "attachments": thread_attachments,
-                        "permissions": permissions,
+                        # Only the permissions of the thread's own messages
+                        "permissions": [
+                            permissions_by_message[message["id"]]
+                            for message in current_thread_messages
+                        ],
                     }
                     batch_metadata.append(metadata)
 
@@ -1726,91 +1915,22 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
                     self.logger.warning(
                         "Failed to process batch starting at index %s", i
                     )
+                    # A resumed sync has to write this batch again
+                    checkpoint_open = False
                     continue
 
-                endpoints = await self.config_service.get_config(
-                    config_node_constants.ENDPOINTS.value
-                )
-                connector_endpoint = endpoints.get("connectors").get("endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value)
-
-                # Send events to Kafka
-                for metadata in batch_metadata:
-                    # Message events
-                    for message_data in metadata["messages"]:
-                        message = message_data["message"]
-                        message_key = (
-                            await self.arango_service.get_key_by_external_message_id(
-                                message["id"]
-                            )
-                        )
-                        user_id = user["userId"]
-                        headers = message.get("headers", {})
-                        message_event = {
-                            "orgId": org_id,
-                            "recordId": message_key,
-                            "recordName": headers.get("Subject", "No Subject"),
-                            "recordType": RecordTypes.MAIL.value,
-                            "recordVersion": 0,
-                            "eventType": EventTypes.NEW_RECORD.value,
-                            "body": message.get("body", ""),
-                            "signedUrlRoute": f"{connector_endpoint}/api/v1/{org_id}/{user_id}/gmail/record/{message_key}/signedUrl",
-                            "connectorName": Connectors.GOOGLE_MAIL.value,
-                            "origin": OriginTypes.CONNECTOR.value,
-                            "mimeType": "text/gmail_content",
-                            "threadId": metadata["thread"]["id"],
-                            "createdAtSourceTimestamp": int(
-                                message.get(
-                                    "internalDate",
-                                    get_epoch_timestamp_in_ms(),
-                                )
-                            ),
-                            "modifiedAtSourceTimestamp": int(
-                                message.get(
-                                    "internalDate",
-                                    get_epoch_timestamp_in_ms(),
-                                )
-                            ),
-                        }
-                        await self.kafka_service.send_event_to_kafka(message_event)
-                        self.logger.info(
-                            "📨 Sent Kafka Indexing event for message %s", message_key
-                        )
-
-                    # Attachment events
-                    for attachment in metadata["attachments"]:
-                        attachment_key = (
-                            await self.arango_service.get_key_by_attachment_id(
-                                attachment["attachment_id"]
-                            )
-                        )
-                        attachment_event = {
-                            "orgId": org_id,
-                            "recordId": attachment_key,
-                            "recordName": attachment.get(
-                                "filename", "Unnamed Attachment"
-                            ),
-                            "recordType": RecordTypes.ATTACHMENT.value,
-                            "recordVersion": 0,
-                            "eventType": EventTypes.NEW_RECORD.value,
-                            "signedUrlRoute": f"{connector_endpoint}/api/v1/{org_id}/{user_id}/gmail/record/{attachment_key}/signedUrl",
-                            "connectorName": Connectors.GOOGLE_MAIL.value,
-                            "origin": OriginTypes.CONNECTOR.value,
-                            "mimeType": attachment.get(
-                                "mimeType", "application/octet-stream"
-                            ),
-                            "createdAtSourceTimestamp": get_epoch_timestamp_in_ms(),
-                            "modifiedAtSourceTimestamp": get_epoch_timestamp_in_ms(),
-                        }
-                        await self.kafka_service.send_event_to_kafka(attachment_event)
-                        self.logger.info(
-                            "📨 Sent Kafka Indexing event for attachment %s",
-                            attachment_key,
-                        )
+                sent = await self._queue_batch_events(batch_metadata, org_id, user)
+                sent_batches.append(sent)
+                if checkpoint_open:
+                    pending_batches.append((sent, batch[-1]["id"]))
+                    checkpoint_open = await self._advance_sync_checkpoint(
+                        user["email"], pending_batches
+                    )
 
-            # Update user state to COMPLETED
-            await self.arango_service.update_user_sync_state(
-                user_email, "COMPLETED", Connectors.GOOGLE_MAIL.value
-            )
+            if not await self._finish_user_sync(
+                user_email, sent_batches, pending_batches, checkpoint_open
+            ):
+                return False
             self.logger.info("✅ Successfully completed sync for user %s", user_email)
             return True
 
@@ -1920,7 +2040,7 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
             )
             connector_endpoint = endpoints.get("connectors").get("endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value)
 
-            count = 0
+            reindex_events = []
             failed_records_with_users = list(failed_records_with_users)
             if len(failed_records_with_users) == 0:
                 self.logger.info("⚠️ NO FAILED RECORDS")
@@ -1965,18 +2085,23 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
                                     "mimeType": record.get("mimeType", "application/octet-stream")
                                 })
 
-                            await self.kafka_service.send_event_to_kafka(event)
-                            count += 1
-                            self.logger.debug(f"✅ Sent reindex event for record {record['_key']} with user {user['email']}")
+                            reindex_events.append(event)
+                            self.logger.debug("✅ Prepared reindex event for record %s with user %s", record["_key"], user["email"])
 
                         except Exception as e:
-                            self.logger.error(f"❌ Error sending event for user {user['email']}: {str(e)}")
+                            self.logger.error(f"❌ Error preparing event for user {user['email']}: {str(e)}")
                             continue
 
                 except Exception as e:
                     self.logger.error(f"❌ Error processing record {record['_key']}: {str(e)}")
                     continue
 
+            # Send all reindex events with a single flush
+            count = 0
+            if reindex_events and await self.kafka_service.send_events_to_kafka(
+                reindex_events
+            ):
+                count = len(reindex_events)
             self.logger.info(f"✅ Successfully sent reindex events for {count} records")
             return True
 
@@ -2161,7 +2286,7 @@ class GmailSyncIndividualService(BaseGmailSyncService):
     async def perform_initial_sync(self, org_id, action: str = "start") -> bool:
         """First phase: Build complete gmail structure"""
         try:
-            if await self._should_stop(org_id):
+            if self._stop_event.is_set():
                 self.logger.info("Sync stopped before starting")
                 return False
 
@@ -2214,7 +2339,7 @@ class GmailSyncIndividualService(BaseGmailSyncService):
                 user["email"], "IN_PROGRESS", Connectors.GOOGLE_MAIL.value
             )
 
-            if await self._should_stop(org_id):
+            if self._stop_event.is_set():
                 self.logger.info(
                     "Sync stopped during user %s processing", user["email"]
                 )
@@ -2241,9 +2366,6 @@ class GmailSyncIndividualService(BaseGmailSyncService):
                     break
 
             messages_list = await user_service.list_messages()
-            messages_full = []
-            attachments = []
-            permissions = []
 
             if not threads:
                 self.logger.info(f"No threads found for user {user['email']}")
@@ -2252,69 +2374,45 @@ class GmailSyncIndividualService(BaseGmailSyncService):
                 )
                 return False
 
-            # Process messages
+            # Message ids by thread; full messages are fetched one batch at a time
+            messages_by_thread_id = defaultdict(list)
             for message in messages_list:
-                message_data = await user_service.get_message(message["id"])
-                messages_full.append(message_data)
+                messages_by_thread_id[message["threadId"]].append(message)
 
-            for message in messages_full:
-                attachments_for_message = await user_service.list_attachments(
-                    message, org_id, user, account_type
-                )
-                attachments.extend(attachments_for_message)
-                attachment_ids = [
-                    attachment["attachment_id"]
-                    for attachment in attachments_for_message
-                ]
-                headers = message.get("headers", {})
-                permission = {
-                    "messageId": message["id"],
-                    "attachmentIds": attachment_ids,
-                    "role": "reader",
-                    "users": [
-                        *(
-                            headers.get("To", [])
-                            if isinstance(headers.get("To"), list)
-                            else [headers.get("To")] if headers.get("To") else []
-                        ),
-                        *(
-                            headers.get("From", [])
-                            if isinstance(headers.get("From"), list)
-                            else [headers.get("From")] if headers.get("From") else []
-                        ),
-                        *(
-                            headers.get("Cc", [])
-                            if isinstance(headers.get("Cc"), list)
-                            else [headers.get("Cc")] if headers.get("Cc") else []
-                        ),
-                        *(
-                            headers.get("Bcc", [])
-                            if isinstance(headers.get("Bcc"), list)
-                            else [headers.get("Bcc")] if headers.get("Bcc") else []
-                        ),
-                    ],
-                }
-                self.logger.info(
-                    "🚀 Mail Permission for message %s: %s", message["id"], permission
-                )
-
-                permissions.append(permission)
+            # Written batches whose events are still being sent; the resume
+            # checkpoint only moves past batches that were written and sent
+            pending_batches = deque()
+            checkpoint_open = True
+            # Send result of every batch of this user
+            sent_batches = []
 
             # Process threads in batches
-            batch_size = 50
-            start_batch = 0
-
-            for i in range(start_batch, len(threads), batch_size):
-                if await self._should_stop(org_id):
+            thread_batches = self._fetched_thread_batches(
+                user_service,
+                threads,
+                sync_state,
+                messages_by_thread_id,
+                org_id,
+                user,
+                account_type,
+            )
+            async for i, batch, fetched in thread_batches:
+                if self._stop_event.is_set():
                     self.logger.info(
                         f"Sync stopped during batch processing at index {i}"
                     )
                     await self.arango_service.update_user_sync_state(
                         user["email"], "PAUSED", Connectors.GOOGLE_MAIL.value
                     )
+                    # Cancel the prefetch of the next batch
+                    await thread_batches.aclose()
                     return False
 
-                batch = threads[i : i + batch_size]
+                (
+                    messages_by_thread,
+                    attachments_by_message,
+                    permissions_by_message,
+                ) = fetched
                 batch_metadata = []
 
                 # Process each thread in batch
@@ -2323,9 +2421,7 @@ class GmailSyncIndividualService(BaseGmailSyncService):
                     thread_attachments = []
 
                     # Get messages for this thread
-                    current_thread_messages = [
-                        m for m in messages_full if m.get("threadId") == thread["id"]
-                    ]
+                    current_thread_messages = messages_by_thread.get(thread["id"], [])
 
                     if not current_thread_messages:
                         self.logger.warning(
@@ -2335,9 +2431,7 @@ class GmailSyncIndividualService(BaseGmailSyncService):
 
                     # Process messages in thread
                     for message in current_thread_messages:
-                        message_attachments = await user_service.list_attachments(
-                            message, org_id, user, account_type
-                        )
+                        message_attachments = attachments_by_message.get(message["id"], [])
                         if message_attachments:
                             thread_attachments.extend(message_attachments)
                         thread_messages.append({"message": message})
@@ -2348,7 +2442,11 @@ class GmailSyncIndividualService(BaseGmailSyncService):
                         "threadId": thread["id"],
                         "messages": thread_messages,
                         "attachments": thread_attachments,
-                        "permissions": permissions,
+                        # Only the permissions of the thread's own messages
+                        "permissions": [
+                            permissions_by_message[message["id"]]
+                            for message in current_thread_messages
+                        ],
                     }
                     batch_metadata.append(metadata)
 
@@ -2357,93 +2455,25 @@ class GmailSyncIndividualService(BaseGmailSyncService):
                     self.logger.warning(
                         f"Failed to process batch starting at index {i}"
                     )
+                    # A resumed sync has to write this batch again
+                    checkpoint_open = False
                     continue
 
                 # Send events to Kafka for threads, messages and attachments
                 self.logger.info("🚀 Preparing events for Kafka for batch %s", i)
 
-                endpoints = await self.config_service.get_config(
-                    config_node_constants.ENDPOINTS.value
-                )
-                connector_endpoint = endpoints.get("connectors").get("endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value)
-
-                for metadata in batch_metadata:
-                    # Message events
-                    for message_data in metadata["messages"]:
-                        message = message_data["message"]
-                        message_key = (
-                            await self.arango_service.get_key_by_external_message_id(
-                                message["id"]
-                            )
-                        )
-
-                        user_id = user["userId"]
-                        headers = message.get("headers", {})
-                        message_event = {
-                            "orgId": org_id,
-                            "recordId": message_key,
-                            "recordName": headers.get("Subject", "No Subject"),
-                            "recordType": RecordTypes.MAIL.value,
-                            "recordVersion": 0,
-                            "eventType": EventTypes.NEW_RECORD.value,
-                            "body": message.get("body", ""),
-                            "signedUrlRoute": f"{connector_endpoint}/api/v1/{org_id}/{user_id}/gmail/record/{message_key}/signedUrl",
-                            "connectorName": Connectors.GOOGLE_MAIL.value,
-                            "origin": OriginTypes.CONNECTOR.value,
-                            "mimeType": "text/gmail_content",
-                            "createdAtSourceTimestamp": int(
-                                message.get(
-                                    "internalDate",
-                                    get_epoch_timestamp_in_ms(),
-                                )
-                            ),
-                            "modifiedAtSourceTimestamp": int(
-                                message.get(
-                                    "internalDate",
-                                    get_epoch_timestamp_in_ms(),
-                                )
-                            ),
-                        }
-                        await self.kafka_service.send_event_to_kafka(message_event)
-                        self.logger.info(
-                            "📨 Sent Kafka Indexing event for message %s", message_key
-                        )
-
-                    # Attachment events
-                    for attachment in metadata["attachments"]:
-                        attachment_key = (
-                            await self.arango_service.get_key_by_attachment_id(
-                                attachment["attachment_id"]
-                            )
-                        )
-                        attachment_event = {
-                            "orgId": org_id,
-                            "recordId": attachment_key,
-                            "recordName": attachment.get(
-                                "filename", "Unnamed Attachment"
-                            ),
-                            "recordType": RecordTypes.ATTACHMENT.value,
-                            "recordVersion": 0,
-                            "eventType": EventTypes.NEW_RECORD.value,
-                            "signedUrlRoute": f"{connector_endpoint}/api/v1/{org_id}/{user_id}/gmail/record/{attachment_key}/signedUrl",
-                            "connectorName": Connectors.GOOGLE_MAIL.value,
-                            "origin": OriginTypes.CONNECTOR.value,
-                            "mimeType": attachment.get(
-                                "mimeType", "application/octet-stream"
-                            ),
-                            "createdAtSourceTimestamp": get_epoch_timestamp_in_ms(),
-                            "modifiedAtSourceTimestamp": get_epoch_timestamp_in_ms(),
-                        }
-                        await self.kafka_service.send_event_to_kafka(attachment_event)
-                        self.logger.info(
-                            "📨 Sent Kafka Indexing event for attachment %s",
-                            attachment_key,
-                        )
+                sent = await self._queue_batch_events(batch_metadata, org_id, user)
+                sent_batches.append(sent)
+                if checkpoint_open:
+                    pending_batches.append((sent, batch[-1]["id"]))
+                    checkpoint_open = await self._advance_sync_checkpoint(
+                        user["email"], pending_batches
+                    )
 
-            # Update user state to COMPLETED
-            await self.arango_service.update_user_sync_state(
-                user["email"], "COMPLETED", Connectors.GOOGLE_MAIL.value
-            )
+            if not await self._finish_user_sync(
+                user["email"], sent_batches, pending_batches, checkpoint_open
+            ):
+                return False
 
             self.is_completed = True
             return True
@@ -2532,7 +2562,7 @@ class GmailSyncIndividualService(BaseGmailSyncService):
 
             user_id = user[0]["userId"]
 
-            count = 0
+            reindex_events = []
             failed_records = list(failed_records)
             if len(failed_records) == 0:
                 self.logger.info("⚠️ NO FAILED RECORDS")
@@ -2565,15 +2595,19 @@ class GmailSyncIndividualService(BaseGmailSyncService):
                             "mimeType": record.get("mimeType", "application/octet-stream")
                         })
 
-                    # Send event to Kafka
-                    await self.kafka_service.send_event_to_kafka(event)
-                    count += 1
-                    self.logger.debug(f"✅ Sent reindex event for record {record['_key']}")
+                    reindex_events.append(event)
+                    self.logger.debug("✅ Prepared reindex event for record %s", record["_key"])
 
                 except Exception as e:
                     self.logger.error(f"❌ Error processing record {record['_key']}: {str(e)}")
                     continue
 
+            # Send all reindex events with a single flush
+            count = 0
+            if reindex_events and await self.kafka_service.send_events_to_kafka(
+                reindex_events
+            ):
+                count = len(reindex_events)
             self.logger.info(f"✅ Successfully sent reindex events for {count} failed records")
             return True
 
@@ -4,6 +4,7 @@ import base64
 import os
 import re
 from datetime import datetime, timedelta, timezone
+from email.utils import getaddresses
 from typing import Dict, List, Optional
 from uuid import uuid4
 
@@ -14,6 +15,8 @@ from googleapiclient.errors import HttpError
 from app.config.configuration_service import ConfigurationService
 from app.config.utils.named_constants.arangodb_constants import AccountType
 from app.connectors.google.gmail.core.gmail_drive_interface import GmailDriveInterface
+from app.connectors.google.helpers.discovery import build_service
+from app.connectors.google.helpers.request_execution import execute_in_thread
 from app.connectors.google.scopes import GOOGLE_CONNECTOR_INDIVIDUAL_SCOPES
 from app.connectors.utils.decorators import exponential_backoff, token_refresh
 from app.connectors.utils.rate_limiter import GoogleAPIRateLimiter
@@ -29,6 +32,21 @@ from app.utils.time_conversion import get_epoch_timestamp_in_ms
 class GmailUserService:
     """GmailUserService class for interacting with Google Gmail API"""
 
+    # Gmail advises against batches of more than 50 requests
+    MESSAGE_BATCH_SIZE = 50
+    # Largest page Gmail returns when listing messages or threads
+    LIST_PAGE_SIZE = 500
+    MESSAGE_LIST_FIELDS = "messages(id,threadId),nextPageToken"
+    THREAD_LIST_FIELDS = "threads(id,historyId),nextPageToken"
+    # Message fields the sync reads; snippet, size estimate and the headers of
+    # MIME parts are left out of the response
+    MESSAGE_FIELDS = (
+        "id,threadId,labelIds,historyId,internalDate,"
+        "payload(mimeType,headers,body,"
+        "parts(partId,mimeType,filename,body,"
+        "parts(partId,mimeType,filename,body,parts)))"
+    )
+
     def __init__(
         self,
         logger,
@@ -53,6 +71,9 @@ class GmailUserService:
                 rate_limiter=rate_limiter,
                 admin_service=admin_service,
             )
+            # Drive file metadata by file id, shared by every message that
+            # links the same file
+            self._drive_files: Dict[str, Dict] = {}
 
             # Rate limiters
             self.rate_limiter = rate_limiter
@@ -201,9 +222,7 @@ class GmailUserService:
             self.org_id = org_id
             self.user_id = user_id
             try:
-                self.service = build(
-                    "gmail", "v1", credentials=self.credentials, cache_discovery=False
-                )
+                self.service = build_service("gmail", "v1", self.credentials)
                 self.logger.debug("Self Gmail Service: %s", self.service)
             except Exception as e:
                 raise MailOperationError(
@@ -311,44 +330,11 @@ class GmailUserService:
         try:
             self.logger.info("🚀 Getting list of messages")
             messages = []
-            page_token = None
-
-            while True:
-                try:
-                    async with self.google_limiter:
-                        results = (
-                            self.service.users()
-                            .messages()
-                            .list(userId="me", pageToken=page_token, q=query)
-                            .execute()
-                        )
-                except HttpError as e:
-                    if e.resp.status == 403:
-                        raise GoogleAuthError(
-                            "Permission denied listing messages: " + str(e),
-                            details={"query": query, "error": str(e)},
-                        )
-                    raise MailOperationError(
-                        "Failed to list messages: " + str(e),
-                        details={"query": query, "error": str(e)},
-                    )
-
-                current_messages = results.get("messages", [])
-                if not isinstance(current_messages, list):
-                    raise MailOperationError(
-                        "Invalid response format for messages",
-                        details={
-                            "query": query,
-                            "response_type": type(current_messages),
-                        },
-                    )
-
+            async for current_messages in self._list_pages(
+                "messages", query, self.MESSAGE_LIST_FIELDS
+            ):
                 messages.extend(current_messages)
 
-                page_token = results.get("nextPageToken")
-                if not page_token:
-                    break
-
             self.logger.info("✅ Found %s messages", len(messages))
             return messages
 
@@ -360,61 +346,163 @@ class GmailUserService:
                 details={"query": query, "error": str(e)},
             )
 
-    @exponential_backoff()
-    @token_refresh
-    async def get_message(self, message_id: str) -> Dict:
-        """Get message by id"""
+    async def _list_pages(self, kind: str, query: str, fields: str):
+        """Yield the items of each page of a messages or threads listing
 
-        def get_message_content(payload):
-            """Recursively extract message content from MIME parts"""
-            if not payload:
-                return ""
-
-            # If this part is multipart, recursively process its parts
-            if payload.get("mimeType", "").startswith("multipart/"):
-                parts = payload.get("parts", [])
-                # For multipart/alternative, prefer HTML over plain text
-                if payload["mimeType"] == "multipart/alternative":
-                    html_content = ""
-                    plain_content = ""
-                    for part in parts:
-                        if part["mimeType"] == "text/html":
-                            html_content = get_message_content(part)
-                        elif part["mimeType"] == "text/plain":
-                            plain_content = get_message_content(part)
-                    return html_content or plain_content
-                # For other multipart types, concatenate all text content
-                text_parts = []
-                for part in parts:
-                    if part["mimeType"].startswith("text/") or part[
-                        "mimeType"
-                    ].startswith("multipart/"):
-                        content = get_message_content(part)
-                        if content:
-                            text_parts.append(content)
-                return "\n".join(text_parts)
-
-            # If this is a text part, decode and return its content
-            if payload["mimeType"].startswith("text/"):
-                if "data" in payload.get("body", {}):
-                    try:
-                        decoded_content = base64.urlsafe_b64decode(
-                            payload["body"]["data"]
-                        ).decode("utf-8")
-                        return decoded_content
-                    except Exception as e:
-                        self.logger.error(f"❌ Error decoding content: {str(e)}")
-                        return ""
+        Pages are as large as Gmail allows and carry only the given fields.
+        """
+        page_token = None
+        while True:
+            resource = getattr(self.service.users(), kind)()
+            try:
+                results = await self._execute_request(
+                    resource.list(
+                        userId="me",
+                        pageToken=page_token,
+                        q=query,
+                        maxResults=self.LIST_PAGE_SIZE,
+                        fields=fields,
+                    )
+                )
+            except HttpError as e:
+                if e.resp.status == 403:
+                    raise GoogleAuthError(
+                        f"Permission denied listing {kind}: " + str(e),
+                        details={"query": query, "error": str(e)},
+                    )
+                raise MailOperationError(
+                    f"Failed to list {kind}: " + str(e),
+                    details={"query": query, "error": str(e)},
+                )
 
+            items = results.get(kind, [])
+            if not isinstance(items, list):
+                raise MailOperationError(
+                    f"Invalid response format for {kind}",
+                    details={"query": query, "response_type": type(items)},
+                )
+            yield items
+
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                break
+
+    async def _execute_request(self, request):
+        """Execute a Gmail API request under the shared rate limiter
+
+        The blocking HTTP call runs in a worker thread, so several messages can
+        be fetched concurrently without holding up the event loop.
+        """
+        await self.rate_limiter.wait_for_backoff()
+        async with self.google_limiter:
+            try:
+                response = await execute_in_thread(request)
+            except HttpError as e:
+                if e.resp.status == 429:
+                    self.rate_limiter.record_rate_limited()
+                raise
+        self.rate_limiter.record_success()
+        return response
+
+    def _get_message_content(self, payload) -> str:
+        """Recursively extract message content from MIME parts"""
+        if not payload:
             return ""
 
+        # If this part is multipart, recursively process its parts
+        if payload.get("mimeType", "").startswith("multipart/"):
+            parts = payload.get("parts", [])
+            # For multipart/alternative, prefer HTML over plain text
+            if payload["mimeType"] == "multipart/alternative":
+                html_content = ""
+                plain_content = ""
+                for part in parts:
+                    if part["mimeType"] == "text/html":
+                        html_content = self._get_message_content(part)
+                    elif part["mimeType"] == "text/plain":
+                        plain_content = self._get_message_content(part)
+                return html_content or plain_content
+            # For other multipart types, concatenate all text content
+            text_parts = []
+            for part in parts:
+                if part["mimeType"].startswith("text/") or part[
+                    "mimeType"
+                ].startswith("multipart/"):
+                    content = self._get_message_content(part)
+                    if content:
+                        text_parts.append(content)
+            return "\n".join(text_parts)
+
+        # If this is a text part, decode and return its content
+        if payload["mimeType"].startswith("text/"):
+            if "data" in payload.get("body", {}):
+                try:
+                    decoded_content = base64.urlsafe_b64decode(
+                        payload["body"]["data"]
+                    ).decode("utf-8")
+                    return decoded_content
+                except Exception as e:
+                    self.logger.error(f"❌ Error decoding content: {str(e)}")
+                    return ""
+
+        return ""
+
+    def _parse_message(self, message: Dict) -> Dict:
+        """Add parsed headers and the decoded body to a full-format message"""
+        try:
+            headers = message.get("payload", {}).get("headers", [])
+            header_dict = {}
+            for header in headers:
+                if header["name"] in [
+                    "Subject",
+                    "From",
+                    "To",
+                    "Cc",
+                    "Bcc",
+                    "Date",
+                    "Message-ID",
+                ]:
+                    if header["name"] in ["From", "To", "Cc", "Bcc"]:
+                        # Parse the address list, honouring quoted display names
+                        header["value"] = [
+                            address
+                            for _, address in getaddresses([header["value"]])
+                            if "@" in address
+                        ]
+                    header_dict[header["name"]] = header["value"]
+
+            self.logger.debug("📝 Headers: %s", header_dict)
+
+            # Extract message content
+            payload = message.get("payload", {})
+            message_content = self._get_message_content(payload)
+
+            message["body"] = message_content
+            message["headers"] = header_dict
+
+            return message
+
+        except Exception as e:
+            raise MailOperationError(
+                "Failed to process message content: " + str(e),
+                details={"message_id": message.get("id"), "error": str(e)},
+            )
+
+    @exponential_backoff()
+    @token_refresh
+    async def get_message(self, message_id: str) -> Dict:
+        """Get message by id"""
         try:
             try:
-                message = (
+                message = await self._execute_request(
                     self.service.users()
                     .messages()
-                    .get(userId="me", id=message_id, format="full")
-                    .execute()
+                    .get(
+                        userId="me",
+                        id=message_id,
+                        format="full",
+                        fields=self.MESSAGE_FIELDS,
+                    )
                 )
                 self.logger.debug("📝 Message: %s", message)
             except HttpError as e:
@@ -433,44 +521,9 @@ class GmailUserService:
                     details={"message_id": message_id, "error": str(e)},
                 )
 
-            try:
-                headers = message.get("payload", {}).get("headers", [])
-                header_dict = {}
-                for header in headers:
-                    if header["name"] in [
-                        "Subject",
-                        "From",
-                        "To",
-                        "Cc",
-                        "Bcc",
-                        "Date",
-                        "Message-ID",
-                    ]:
-                        if header["name"] in ["From", "To", "Cc", "Bcc"]:
-                            # Extract all email addresses using regex
-                            emails = re.findall(
-                                r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+",
-                                header["value"],
-                            )
-                            header["value"] = emails if emails else []
-                        header_dict[header["name"]] = header["value"]
-
-                self.logger.debug("📝 Headers: %s", header_dict)
-
-                # Extract message content
-                payload = message.get("payload", {})
-                message_content = get_message_content(payload)
-
-                message["body"] = message_content
-                message["headers"] = header_dict
+            message = self._parse_message(message)
 
-            except Exception as e:
-                raise MailOperationError(
-                    "Failed to process message content: " + str(e),
-                    details={"message_id": message_id, "error": str(e)},
-                )
-
-            self.logger.info("✅ Successfully retrieved message %s", message.get("id"))
+            self.logger.debug("✅ Successfully retrieved message %s", message.get("id"))
             return message
 
         except (GoogleAuthError, MailOperationError):
@@ -483,48 +536,70 @@ class GmailUserService:
 
     @exponential_backoff()
     @token_refresh
-    async def list_threads(self, query: str = "newer_than:30d") -> List[Dict]:
-        """Get list of unique threads"""
-        try:
-            self.logger.info("🚀 Getting list of threads")
-            threads = []
-            page_token = None
+    async def batch_get_messages(self, message_ids: List[str]) -> Dict[str, Dict]:
+        """Get many messages through Gmail batch requests
 
-            while True:
-                try:
-                    async with self.google_limiter:
-                        results = (
-                            self.service.users()
-                            .threads()
-                            .list(userId="me", pageToken=page_token, q=query)
-                            .execute()
-                        )
-                except HttpError as e:
-                    if e.resp.status == 403:
-                        raise GoogleAuthError(
-                            "Permission denied listing threads: " + str(e),
-                            details={"query": query, "error": str(e)},
-                        )
-                    raise MailOperationError(
-                        "Failed to list threads: " + str(e),
-                        details={"query": query, "error": str(e)},
+        Returns parsed messages keyed by id. Messages whose sub-request failed
+        are left out, so callers can retry them with get_message.
+        """
+        try:
+            self.logger.info("🚀 Batch getting %d messages", len(message_ids))
+            messages = {}
+
+            def message_callback(request_id, response, exception):
+                if exception is not None:
+                    self.logger.warning(
+                        "⚠️ Failed to get message %s in batch: %s",
+                        request_id,
+                        str(exception),
                     )
+                    return
+                messages[request_id] = response
 
-                current_threads = results.get("threads", [])
-                if not isinstance(current_threads, list):
-                    raise MailOperationError(
-                        "Invalid response format for threads",
-                        details={
-                            "query": query,
-                            "response_type": type(current_threads),
-                        },
+            for i in range(0, len(message_ids), self.MESSAGE_BATCH_SIZE):
+                batch = self.service.new_batch_http_request()
+                for message_id in message_ids[i : i + self.MESSAGE_BATCH_SIZE]:
+                    batch.add(
+                        self.service.users()
+                        .messages()
+                        .get(
+                            userId="me",
+                            id=message_id,
+                            format="full",
+                            fields=self.MESSAGE_FIELDS,
+                        ),
+                        callback=message_callback,
+                        request_id=message_id,
                     )
+                await self._execute_request(batch)
 
-                threads.extend(current_threads)
+            for message_id, message in messages.items():
+                messages[message_id] = self._parse_message(message)
 
-                page_token = results.get("nextPageToken")
-                if not page_token:
-                    break
+            self.logger.info(
+                "✅ Retrieved %d of %d messages", len(messages), len(message_ids)
+            )
+            return messages
+
+        except MailOperationError:
+            raise
+        except Exception as e:
+            raise GoogleMailError(
+                "Unexpected error batch getting messages: " + str(e),
+                details={"message_count": len(message_ids), "error": str(e)},
+            )
+
+    @exponential_backoff()
+    @token_refresh
+    async def list_threads(self, query: str = "newer_than:30d") -> List[Dict]:
+        """Get list of unique threads"""
+        try:
+            self.logger.info("🚀 Getting list of threads")
+            threads = []
+            async for current_threads in self._list_pages(
+                "threads", query, self.THREAD_LIST_FIELDS
+            ):
+                threads.extend(current_threads)
 
             self.logger.info("✅ Found %s threads", len(threads))
             return threads
@@ -555,7 +630,7 @@ class GmailUserService:
             attachments = []
             failed_items = []
 
-            self.logger.info(f"🎯 Processing attachments for message: {message['id']}")
+            self.logger.debug("🎯 Processing attachments for message: %s", message["id"])
 
             # Process regular attachments
             if "payload" in message and "parts" in message["payload"]:
@@ -593,24 +668,27 @@ class GmailUserService:
 
             # Process Drive attachments
             try:
-                self.logger.info(
-                    f"🎯 Processing Drive attachments for message: {message['id']}"
+                self.logger.debug(
+                    "🎯 Processing Drive attachments for message: %s", message["id"]
                 )
 
                 file_ids = await self.get_file_ids(message)
                 if file_ids:
                     for file_id in file_ids:
                         try:
-                            file_metadata = (
-                                await self.gmail_drive_interface.get_drive_file(
-                                    file_id=file_id,
-                                    user_email=user_email,
-                                    org_id=org_id,
-                                    user_id=user_id,
-                                    account_type=account_type,
+                            file_metadata = self._drive_files.get(file_id)
+                            if file_metadata is None:
+                                file_metadata = (
+                                    await self.gmail_drive_interface.get_drive_file(
+                                        file_id=file_id,
+                                        user_email=user_email,
+                                        org_id=org_id,
+                                        user_id=user_id,
+                                        account_type=account_type,
+                                    )
                                 )
-                            )
                             if file_metadata:
+                                self._drive_files[file_id] = file_metadata
                                 attachments.append(
                                     {
                                         "message_id": message["id"],
@@ -638,7 +716,7 @@ class GmailUserService:
                     },
                 )
 
-            self.logger.info("✅ Found %s attachments", len(attachments))
+            self.logger.debug("✅ Found %s attachments", len(attachments))
             return attachments
 
         except BatchOperationError:
@@ -910,7 +988,7 @@ class GmailUserService:
             message_id, part_id = combined_id.split("_", 1)
             user_id = user.get("userId")
 
-            self.logger.info(f"🔍 Fetching message: {message_id} to get attachment ID for part: {part_id}")
+            self.logger.info("🔍 Fetching message: %s to get attachment ID for part: %s", message_id, part_id)
 
             message = (
                 self.service.users()
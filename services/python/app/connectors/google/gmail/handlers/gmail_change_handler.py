@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 
 from app.config.configuration_service import DefaultEndpoints, config_node_constants
@@ -9,10 +10,14 @@ from app.config.utils.named_constants.arangodb_constants import (
     RecordRelations,
     RecordTypes,
 )
+from app.connectors.google.gmail.core.gmail_sync_service import GMAIL_WEB_URL_PREFIX
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
 
 class GmailChangeHandler:
+    # Messages whose attachments are listed at the same time
+    MAX_CONCURRENT_FETCHES = 20
+
     def __init__(self, config_service, arango_service, logger):
         self.config_service = config_service
         self.arango_service = arango_service
@@ -20,8 +25,9 @@ class GmailChangeHandler:
 
     async def process_changes(self, user_service, changes, org_id, user) -> bool:
         """Process changes since last sync time"""
-        self.logger.info("🚀 Processing changes")
-        self.logger.info(f"changes: {changes}")
+        self.logger.info(
+            "🚀 Processing %d history records", len(changes.get("history", []))
+        )
         try:
             endpoints = await self.config_service.get_config(
                 config_node_constants.ENDPOINTS.value
@@ -29,10 +35,33 @@ class GmailChangeHandler:
             connector_endpoint = endpoints.get("connectors").get("endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value)
 
             user_id = user.get("userId")
+            # One timestamp and signed URL prefix for every record of the changes
+            current_timestamp = get_epoch_timestamp_in_ms()
+            signed_url_prefix = (
+                f"{connector_endpoint}/api/v1/{org_id}/{user_id}/gmail/record/"
+            )
+            # Fields shared by every NEW_RECORD event of the changes
+            base_event = {
+                "orgId": org_id,
+                "recordVersion": 0,
+                "eventType": EventTypes.NEW_RECORD.value,
+                "connectorName": Connectors.GOOGLE_MAIL.value,
+                "origin": OriginTypes.CONNECTOR.value,
+            }
+            message_template = {
+                **base_event,
+                "recordType": RecordTypes.MAIL.value,
+                "mimeType": "text/gmail_content",
+            }
+            attachment_template = {
+                **base_event,
+                "recordType": RecordTypes.ATTACHMENT.value,
+                "createdAtSourceTimestamp": current_timestamp,
+                "modifiedAtSourceTimestamp": current_timestamp,
+            }
+            account_type = await self.arango_service.get_account_type(org_id)
             for change in changes.get("history", []):
-                self.logger.info(f"🚀 Processing change: {change}")
-
-                account_type = await self.arango_service.get_account_type(org_id)
+                self.logger.info("🚀 Processing change: %s", change)
 
                 # Handle message additions
                 messages_to_add = []
@@ -54,38 +83,63 @@ class GmailChangeHandler:
                             seen_message_ids.add(message_id)
                             messages_to_add.append(message)
 
+                # Look up which of the messages are already stored in one query
+                existing_message_keys = (
+                    await self.arango_service.get_keys_by_external_record_ids(
+                        [message["id"] for message in messages_to_add if message.get("id")]
+                    )
+                )
+                # Fetch the new messages through Gmail batch requests, then
+                # list their attachments concurrently
+                new_message_ids = [
+                    message["id"]
+                    for message in messages_to_add
+                    if message.get("id") and message["id"] not in existing_message_keys
+                ]
+                fetched_messages = await user_service.batch_get_messages(
+                    new_message_ids
+                )
+                semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+
+                async def fetch(message_id):
+                    async with semaphore:
+                        # Fall back to a single get for messages the batch missed
+                        message_data = fetched_messages.get(message_id)
+                        if message_data is None:
+                            message_data = await user_service.get_message(message_id)
+                        if not message_data:
+                            return None, []
+                        attachments = await user_service.list_attachments(
+                            message_data, org_id, user, account_type
+                        )
+                    return message_data, attachments
+
+                fetched_by_message_id = dict(
+                    zip(
+                        new_message_ids,
+                        await asyncio.gather(
+                            *(fetch(message_id) for message_id in new_message_ids)
+                        ),
+                    )
+                )
+
+                new_record_events = []
                 for message in messages_to_add:
                     message_id = message.get("id")
                     if not message_id:
                         continue
 
-                    # Check if message already exists
-                    self.logger.debug(
-                        "🔍 Checking if message %s exists in ArangoDB", message_id
-                    )
-                    existing_message = self.arango_service.db.aql.execute(
-                        f"FOR doc IN {CollectionNames.RECORDS.value} FILTER doc.externalRecordId == @message_id RETURN doc",
-                        bind_vars={"message_id": message_id},
-                    )
-                    existing_message = next(existing_message, None)
-
-                    if existing_message:
+                    if message_id in existing_message_keys:
                         self.logger.debug(
                             "♻️ Message %s already exists in ArangoDB, skipping",
                             message_id,
                         )
                         continue
 
-                    # Fetch full message details
-                    message_data = await user_service.get_message(message_id)
+                    message_data, attachments = fetched_by_message_id[message_id]
                     if not message_data:
                         continue
 
-                    # Get attachments for this message
-                    attachments = await user_service.list_attachments(
-                        message_data, org_id, user, account_type
-                    )
-
                     # Extract headers
                     headers = message_data.get("headers", {})
 
@@ -102,7 +156,7 @@ class GmailChangeHandler:
                         "bcc": headers.get("Bcc", []),
                         "messageIdHeader": headers.get("Message-ID", None),
                         "historyId": message_data.get("historyId"),
-                        "webUrl": f"https://mail.google.com/mail?authuser={{user.email}}#all/{message_id}",
+                        "webUrl": GMAIL_WEB_URL_PREFIX + message_id,
                         "labelIds": message_data.get("labelIds", []),
                     }
 
@@ -116,9 +170,9 @@ class GmailChangeHandler:
                         "version": 0,
                         "origin": OriginTypes.CONNECTOR.value,
                         "connectorName": Connectors.GOOGLE_MAIL.value,
-                        "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                        "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
-                        "lastSyncTimestamp": get_epoch_timestamp_in_ms(),
+                        "createdAtTimestamp": current_timestamp,
+                        "updatedAtTimestamp": current_timestamp,
+                        "lastSyncTimestamp": current_timestamp,
                         "sourceCreatedAtTimestamp": message.get("internalDate"),
                         "sourceLastModifiedTimestamp": message.get("internalDate"),
                         "isDeleted": False,
@@ -136,8 +190,8 @@ class GmailChangeHandler:
                     is_of_type_record = {
                         "_from": f'{CollectionNames.RECORDS.value}/{record["_key"]}',
                         "_to": f'{CollectionNames.MAILS.value}/{message_record["_key"]}',
-                        "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                        "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
+                        "createdAtTimestamp": current_timestamp,
+                        "updatedAtTimestamp": current_timestamp,
                     }
 
                     # Start transaction
@@ -193,7 +247,7 @@ class GmailChangeHandler:
                                     "name": attachment.get("filename"),
                                     "sizeInBytes": int(attachment.get("size", 0)),
                                     "extension": attachment.get("extension"),
-                                    "webUrl": f"https://mail.google.com/mail?authuser={{user.email}}#all/{message_id}",
+                                    "webUrl": GMAIL_WEB_URL_PREFIX + message_id,
                                 }
 
                                 attachment_records.append(attachment_record)
@@ -204,8 +258,8 @@ class GmailChangeHandler:
                                     "recordName": attachment.get("filename"),
                                     "recordType": RecordTypes.FILE.value,
                                     "version": 0,
-                                    "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                                    "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
+                                    "createdAtTimestamp": current_timestamp,
+                                    "updatedAtTimestamp": current_timestamp,
                                     "sourceCreatedAtTimestamp": message.get(
                                         "internalDate"
                                     ),
@@ -219,7 +273,7 @@ class GmailChangeHandler:
                                     "origin": OriginTypes.CONNECTOR.value,
                                     "connectorName": Connectors.GOOGLE_MAIL.value,
                                     "virtualRecordId": None,
-                                    "lastSyncTimestamp": get_epoch_timestamp_in_ms(),
+                                    "lastSyncTimestamp": current_timestamp,
                                     "isDeleted": False,
                                     "isArchived": False,
                                     "lastIndexTimestamp": None,
@@ -233,8 +287,8 @@ class GmailChangeHandler:
                                 is_of_type_record = {
                                     "_from": f"{CollectionNames.RECORDS.value}/{record['_key']}",
                                     "_to": f"{CollectionNames.FILES.value}/{attachment_record['_key']}",
-                                    "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                                    "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
+                                    "createdAtTimestamp": current_timestamp,
+                                    "updatedAtTimestamp": current_timestamp,
                                 }
                                 record_relation = {
                                     "_from": f"{CollectionNames.RECORDS.value}/{message_record['_key']}",
@@ -269,67 +323,59 @@ class GmailChangeHandler:
                                 transaction=txn,
                             )
 
-                        # Store permissions
-                        permission_records = []
+                        # Store permissions, one edge per distinct recipient
+                        emails = []
                         for email_type in ["from", "to", "cc", "bcc"]:
-                            emails = message_record.get(email_type, [])
-                            if isinstance(emails, str):
-                                emails = [emails]
-
-                            for email in emails:
-                                if not email:
-                                    continue
-
-                                entity_id = await self.arango_service.get_entity_id_by_email(
-                                    email
+                            addresses = message_record.get(email_type, [])
+                            if isinstance(addresses, str):
+                                addresses = [addresses]
+                            emails.extend(address for address in addresses if address)
+                        emails = list(dict.fromkeys(emails))
+
+                        entities_by_email = (
+                            await self.arango_service.get_entity_ids_by_emails(emails)
+                        )
+                        new_people = []
+                        for email in emails:
+                            if email not in entities_by_email:
+                                person_key = str(uuid.uuid4())
+                                entities_by_email[email] = (
+                                    CollectionNames.PEOPLE.value,
+                                    person_key,
                                 )
-                                if entity_id:
-                                    # Check if entity exists in users or groups
-                                    if self.arango_service.db.collection(
-                                        CollectionNames.USERS.value
-                                    ).has(entity_id):
-                                        entityType = CollectionNames.USERS.value
-                                        permType = "USER"
-                                    elif self.arango_service.db.collection(
-                                        CollectionNames.GROUPS.value
-                                    ).has(entity_id):
-                                        entityType = CollectionNames.GROUPS.value
-                                        permType = "GROUP"
-                                else:
-                                    # Save entity in people collection
-                                    entityType = CollectionNames.PEOPLE.value
-                                    entity_id = str(uuid.uuid4())
-                                    permType = "USER"
-                                    await self.arango_service.save_to_people_collection(
-                                        entity_id, email
-                                    )
+                                new_people.append({"_key": person_key, "email": email})
+                        if new_people:
+                            await self.arango_service.batch_upsert_nodes(
+                                new_people, collection=CollectionNames.PEOPLE.value
+                            )
 
+                        permission_records = []
+                        record_keys = [message_record["_key"]]
+                        if attachments:
+                            record_keys.extend(
+                                attachment_record["_key"]
+                                for attachment_record in attachment_records
+                            )
+                        for email in emails:
+                            entityType, entity_id = entities_by_email[email]
+                            permType = (
+                                "GROUP"
+                                if entityType == CollectionNames.GROUPS.value
+                                else "USER"
+                            )
+                            for record_key in record_keys:
                                 permission_records.append(
                                     {
                                         "_to": f"{entityType}/{entity_id}",
-                                        "_from": f"{CollectionNames.RECORDS.value}/{message_record['_key']}",
+                                        "_from": f"{CollectionNames.RECORDS.value}/{record_key}",
                                         "externalPermissionId": None,
                                         "type": permType,
                                         "role": "READER",
-                                        "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                                        "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
-                                        "lastUpdatedTimestampAtSource": get_epoch_timestamp_in_ms(),
+                                        "createdAtTimestamp": current_timestamp,
+                                        "updatedAtTimestamp": current_timestamp,
+                                        "lastUpdatedTimestampAtSource": current_timestamp,
                                     }
                                 )
-                                if attachments:
-                                    for attachment_record in attachment_records:
-                                        permission_records.append(
-                                            {
-                                                "_to": f"{entityType}/{entity_id}",
-                                                "_from": f"{CollectionNames.RECORDS.value}/{attachment_record['_key']}",
-                                                "externalPermissionId": None,
-                                                "type": permType,
-                                                "role": "READER",
-                                                "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                                                "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
-                                                "lastUpdatedTimestampAtSource": get_epoch_timestamp_in_ms(),
-                                            }
-                                        )
 
                         if permission_records:
                             await self.arango_service.batch_create_edges(
@@ -358,40 +404,21 @@ class GmailChangeHandler:
                             )
                         continue
 
+                    source_timestamp = int(
+                        message.get("internalDate", current_timestamp)
+                    )
                     message_event = {
-                        "orgId": org_id,
+                        **message_template,
                         "recordId": message_record["_key"],
                         "recordName": headers.get("Subject", "No Subject"),
-                        "recordType": RecordTypes.MAIL.value,
-                        "recordVersion": 0,
-                        "eventType": EventTypes.NEW_RECORD.value,
                         "body": message_data.get("body", ""),
-                        "signedUrlRoute": f"{connector_endpoint}/api/v1/{org_id}/{user_id}/gmail/record/{message_record['_key']}/signedUrl",
-                        "connectorName": Connectors.GOOGLE_MAIL.value,
-                        "origin": OriginTypes.CONNECTOR.value,
-                        "mimeType": "text/gmail_content",
-                        "createdAtSourceTimestamp": int(
-                            message.get(
-                                "internalDate",
-                                get_epoch_timestamp_in_ms(),
-                            )
-                        ),
-                        "modifiedAtSourceTimestamp": int(
-                            message.get(
-                                "internalDate",
-                                get_epoch_timestamp_in_ms(),
-                            )
-                        ),
+                        "signedUrlRoute": f"{signed_url_prefix}{message_record['_key']}/signedUrl",
+                        "createdAtSourceTimestamp": source_timestamp,
+                        "modifiedAtSourceTimestamp": source_timestamp,
                     }
 
-                    # SEND KAFKA EVENT FOR INDEXING
-                    await self.arango_service.kafka_service.send_event_to_kafka(
-                        message_event
-                    )
-                    self.logger.info(
-                        "📨 Sent Kafka reindexing event for record %s",
-                        record["_key"],
-                    )
+                    # Queue the indexing event, sent once for the whole change
+                    new_record_events.append(message_event)
 
                     if attachments:
                         for attachment in attachment_records:
@@ -402,31 +429,27 @@ class GmailChangeHandler:
                                 else attachment.get("recordName").split(".")[-1]
                             )
                             attachment_event = {
-                                "orgId": org_id,
+                                **attachment_template,
                                 "recordId": attachment_key,
                                 "recordName": attachment.get(
                                     "recordName", "Unnamed Attachment"
                                 ),
-                                "recordType": RecordTypes.ATTACHMENT.value,
-                                "recordVersion": 0,
-                                "eventType": EventTypes.NEW_RECORD.value,
-                                "signedUrlRoute": f"{connector_endpoint}/api/v1/{org_id}/{user_id}/gmail/record/{attachment_key}/signedUrl",
-                                "connectorName": Connectors.GOOGLE_MAIL.value,
+                                "signedUrlRoute": f"{signed_url_prefix}{attachment_key}/signedUrl",
                                 "extension": extension,
-                                "origin": OriginTypes.CONNECTOR.value,
                                 "mimeType": attachment.get(
                                     "mimeType", "application/octet-stream"
                                 ),
-                                "createdAtSourceTimestamp": get_epoch_timestamp_in_ms(),
-                                "modifiedAtSourceTimestamp": get_epoch_timestamp_in_ms(),
                             }
-                            await self.arango_service.kafka_service.send_event_to_kafka(
-                                attachment_event
-                            )
-                            self.logger.info(
-                                "📨 Sent Kafka Indexing event for attachment %s",
-                                attachment_key,
-                            )
+                            new_record_events.append(attachment_event)
+
+                if new_record_events:
+                    if await self.arango_service.kafka_service.send_events_to_kafka(
+                        new_record_events
+                    ):
+                        self.logger.info(
+                            "📨 Sent %d Kafka indexing events",
+                            len(new_record_events),
+                        )
 
                 # Handle message deletions
                 messages_to_delete = []
@@ -448,40 +471,48 @@ class GmailChangeHandler:
                             seen_message_ids.add(message_id)
                             messages_to_delete.append(message)
 
+                # Stored messages and their attachment records, in one query
+                stored_messages = {}
+                if messages_to_delete:
+                    stored_messages = {
+                        stored["record"]["externalRecordId"]: stored
+                        for stored in self.arango_service.db.aql.execute(
+                            f"""
+                            FOR doc IN {CollectionNames.RECORDS.value}
+                                FILTER doc.externalRecordId IN @message_ids
+                                LET attachments = (
+                                    FOR r IN {CollectionNames.RECORD_RELATIONS.value}
+                                        FILTER r._from == doc._id
+                                        AND r.relationType == @relation_type
+                                        RETURN DOCUMENT(r._to)
+                                )
+                                RETURN {{ record: doc, attachments: attachments }}
+                            """,
+                            bind_vars={
+                                "message_ids": [
+                                    message.get("id") for message in messages_to_delete
+                                ],
+                                "relation_type": RecordRelations.ATTACHMENT.value,
+                            },
+                        )
+                    }
+
                 for message in messages_to_delete:
                     message_id = message.get("id")
                     if not message_id:
                         continue
                     try:
                         # Check if message exists before attempting deletion
-                        existing_message = next(
-                            self.arango_service.db.aql.execute(
-                                f"FOR doc IN {CollectionNames.RECORDS.value} FILTER doc.externalRecordId == @message_id RETURN doc",
-                                bind_vars={"message_id": message_id},
-                            ),
-                            None,
-                        )
-
-                        if not existing_message:
+                        stored_message = stored_messages.get(message_id)
+                        if not stored_message:
                             self.logger.debug(
                                 "⚠️ Message %s not found in ArangoDB, skipping deletion",
                                 message_id,
                             )
                             continue
 
-                        # Get associated attachment records
-                        attachment_records = list(self.arango_service.db.aql.execute(
-                            """
-                            FOR r IN recordRelations
-                                FILTER r._from == @message_id
-                                AND r.relationType == @relation_type
-                                RETURN DOCUMENT(r._to)
-                            """,
-                            bind_vars={
-                                "message_id": f'records/{existing_message["_key"]}',
-                                "relation_type": RecordRelations.ATTACHMENT.value
-                            }
-                        ))
+                        existing_message = stored_message["record"]
+                        attachment_records = stored_message["attachments"]
 
                         txn = self.arango_service.db.begin_transaction(
                             read=[
@@ -556,7 +587,7 @@ class GmailChangeHandler:
                                     "recordName": attachment.get("recordName", "Unnamed Attachment"),
                                     "recordType": RecordTypes.ATTACHMENT.value,
                                     "recordVersion": 0,
-                                    "signedUrlRoute": f"{connector_endpoint}/api/v1/{org_id}/{user_id}/gmail/record/{attachment['_key']}/signedUrl",
+                                    "signedUrlRoute": f"{signed_url_prefix}{attachment['_key']}/signedUrl",
                                     "eventType": EventTypes.DELETE_RECORD.value,
                                     "connectorName": Connectors.GOOGLE_MAIL.value,
                                     "origin": OriginTypes.CONNECTOR.value,
@@ -582,7 +613,7 @@ class GmailChangeHandler:
                                 "recordName": existing_message.get("recordName", "No Subject"),
                                 "recordType": RecordTypes.MAIL.value,
                                 "recordVersion": 0,
-                                "signedUrlRoute": f"{connector_endpoint}/api/v1/{org_id}/{user_id}/gmail/record/{existing_message['_key']}/signedUrl",
+                                "signedUrlRoute": f"{signed_url_prefix}{existing_message['_key']}/signedUrl",
                                 "eventType": EventTypes.DELETE_RECORD.value,
                                 "connectorName": Connectors.GOOGLE_MAIL.value,
                                 "origin": OriginTypes.CONNECTOR.value,
@@ -4,7 +4,6 @@ from abc import ABC, abstractmethod
 from typing import Dict, Optional
 
 from app.config.configuration_service import ConfigurationService
-from app.config.utils.named_constants.arangodb_constants import CollectionNames
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
 
@@ -35,7 +34,7 @@ class AbstractGmailWebhookHandler(ABC):
                 message_dict = message
 
             self.logger.debug(
-                f"{self.handler_type} webhook: Parsed message - {json.dumps(message_dict, indent=2)}"
+                "%s webhook: Parsed message - %s", self.handler_type, message_dict
             )
             return message_dict
         except json.JSONDecodeError as e:
@@ -182,7 +181,7 @@ class IndividualGmailWebhookHandler(AbstractGmailWebhookHandler):
             self.logger.debug(
                 "%s webhook: Notification details - %s",
                 self.handler_type,
-                json.dumps(message_data, indent=2),
+                message_data,
             )
 
             async with self.processing_lock:
@@ -216,25 +215,12 @@ class IndividualGmailWebhookHandler(AbstractGmailWebhookHandler):
                         changes["historyId"], channel_history["expiration"], email_address
                     )
 
-                user_id = await self.arango_service.get_entity_id_by_email(
+                # Get the user and its org_id from the belongsTo relation
+                user, org_id = await self.arango_service.get_user_and_org_id_by_email(
                     email_address
                 )
 
-                # Get org_id from belongsTo relation for this user
-                query = f"""
-                FOR edge IN belongsTo
-                    FILTER edge._from == 'users/{user_id}'
-                    AND edge.entityType == 'ORGANIZATION'
-                    RETURN PARSE_IDENTIFIER(edge._to).key
-                """
-                cursor = self.arango_service.db.aql.execute(query)
-                org_id = next(cursor, None)
-
                 if changes and isinstance(changes, dict) and changes.get("history"):
-                    user = await self.arango_service.get_document(
-                        user_id, CollectionNames.USERS.value
-                    )
-
                     self.logger.info(
                         "%s webhook: Found %s changes to process",
                         self.handler_type,
@@ -304,7 +290,7 @@ class EnterpriseGmailWebhookHandler(AbstractGmailWebhookHandler):
             self.logger.debug(
                 "%s webhook: Notification details - %s",
                 self.handler_type,
-                json.dumps(message_data, indent=2),
+                message_data,
             )
 
             async with self.processing_lock:
@@ -357,18 +343,10 @@ class EnterpriseGmailWebhookHandler(AbstractGmailWebhookHandler):
                         changes["historyId"], channel_history["expiration"], email_address
                     )
 
-                user_id = await self.arango_service.get_entity_id_by_email(
+                # Get the user and its org_id from the belongsTo relation
+                user, org_id = await self.arango_service.get_user_and_org_id_by_email(
                     email_address
                 )
-                # Get org_id from belongsTo relation for this user
-                query = f"""
-                FOR edge IN belongsTo
-                    FILTER edge._from == 'users/{user_id}'
-                    AND edge.entityType == 'ORGANIZATION'
-                    RETURN PARSE_IDENTIFIER(edge._to).key
-                """
-                cursor = self.arango_service.db.aql.execute(query)
-                org_id = next(cursor, None)
 
                 if changes and isinstance(changes, dict) and changes.get("history"):
                     self.logger.info(
@@ -376,10 +354,6 @@ class EnterpriseGmailWebhookHandler(AbstractGmailWebhookHandler):
                         self.handler_type,
                         len(changes),
                     )
-                    user = await self.arango_service.get_document(
-                        user_id, CollectionNames.USERS.value
-                    )
-
                     await self.change_handler.process_changes(
                         user_service, changes, org_id, user
                     )
@@ -5,7 +5,8 @@ import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from itertools import islice
+from typing import Dict, List, Optional
 
 from app.config.configuration_service import (
     ConfigurationService,
@@ -44,6 +45,11 @@ class DriveSyncProgress:
 class BaseDriveSyncService(ABC):
     """Abstract base class for sync services"""
 
+    # Drives of a user that are synced at the same time during initial sync
+    MAX_CONCURRENT_DRIVES = 4
+    # Indexing events of a drive accumulated before they are sent to Kafka
+    INDEX_EVENTS_FLUSH_SIZE = 500
+
     def __init__(
         self,
         logger,
@@ -65,7 +71,8 @@ class BaseDriveSyncService(ABC):
         self._current_batch = None
         self._pause_event = asyncio.Event()
         self._pause_event.set()
-        self._stop_requested = False
+        # Set once a stop is requested; checked in the sync loops without awaiting
+        self._stop_event = asyncio.Event()
 
         # Locks
         self._sync_lock = asyncio.Lock()
@@ -99,36 +106,22 @@ class BaseDriveSyncService(ABC):
             try:
                 self.logger.info("🔄 Initializing drive workers...")
 
-                # Clear existing workers
-                self.drive_workers.clear()
-
-                # Initialize root drive worker
-                self.logger.info("🏠 Setting up root drive worker...")
-                self.drive_workers["root"] = DriveWorker(
-                    "root", user_service, self.arango_service
-                )
-                self.logger.info("✅ Root drive worker initialized")
-
                 # Initialize shared drive workers
                 self.logger.info("🌐 Fetching shared drives...")
-                drives = await user_service.list_shared_drives()
-                if drives:
-                    self.logger.info(f"📦 Found {len(drives)} shared drives")
-                    for drive in drives:
-                        drive_id = drive["id"]
-                        drive_name = drive.get("name", "Unknown")
-                        self.logger.info(
-                            "🔄 Initializing worker for drive: %s (%s)",
-                            drive_name,
-                            drive_id,
-                        )
+                drives = await user_service.list_shared_drives() or []
+                self.logger.info("📦 Found %d shared drives", len(drives))
+                for drive in drives:
+                    self.logger.debug(
+                        "🔄 Initializing worker for drive: %s (%s)",
+                        drive.get("name", "Unknown"),
+                        drive["id"],
+                    )
 
-                        self.drive_workers[drive_id] = DriveWorker(
-                            drive_id, user_service, self.arango_service
-                        )
-                        self.logger.info(
-                            "✅ Worker initialized for drive: %s", drive_name
-                        )
+                # Replace existing workers with the root and shared drive workers
+                self.drive_workers = {
+                    drive_id: DriveWorker(drive_id, user_service, self.arango_service)
+                    for drive_id in ["root", *(drive["id"] for drive in drives)]
+                }
 
                 total_workers = len(self.drive_workers)
                 self.logger.info(
@@ -157,11 +150,12 @@ class BaseDriveSyncService(ABC):
         async with self._transition_lock:
             try:
                 users = await self.arango_service.get_users(org_id=org_id)
+                sync_states = await self.arango_service.get_users_sync_states(
+                    [user["email"] for user in users], Connectors.GOOGLE_DRIVE.value
+                )
                 for user in users:
-                    # Check current state using get_user_sync_state
-                    sync_state = await self.arango_service.get_user_sync_state(
-                        user["email"], Connectors.GOOGLE_DRIVE.value
-                    )
+                    # Check current state of the user
+                    sync_state = sync_states.get(user["email"])
                     current_state = (
                         sync_state.get("syncState") if sync_state else ProgressStatus.NOT_STARTED.value
                     )
@@ -183,9 +177,8 @@ class BaseDriveSyncService(ABC):
                             pass
 
                 # Start fresh sync
-                self._sync_task = asyncio.create_task(
-                    self.perform_initial_sync(org_id, action="start")
-                )
+                self._stop_event.clear()
+                self._start_sync_task(org_id, action="start")
 
                 self.logger.info("✅ Sync service started")
                 return True
@@ -198,36 +191,20 @@ class BaseDriveSyncService(ABC):
         self.logger.info("⏸️ Pausing sync service")
         async with self._transition_lock:
             try:
-                users = await self.arango_service.get_users(org_id=org_id)
-                for user in users:
-                    # Check current state using get_user_sync_state
-                    sync_state = await self.arango_service.get_user_sync_state(
-                        user["email"], Connectors.GOOGLE_DRIVE.value
-                    )
-                    current_state = (
-                        sync_state.get("syncState") if sync_state else ProgressStatus.NOT_STARTED.value
-                    )
+                # Stop every coroutine of the running sync before marking
+                # the users paused, so none of them overwrites the state
+                self._stop_event.set()
 
-                    if current_state != ProgressStatus.IN_PROGRESS.value:
-                        self.logger.warning("💥 Sync service is not running")
-                        continue
-
-                    self._stop_requested = True
-
-                    # Update user state
-                    await self.arango_service.update_user_sync_state(
-                        user["email"],
-                        ProgressStatus.PAUSED.value,
-                        service_type=Connectors.GOOGLE_DRIVE.value,
-                    )
+                # Cancel current sync task
+                if self._sync_task and not self._sync_task.done():
+                    self._sync_task.cancel()
+                    try:
+                        await self._sync_task
+                    except asyncio.CancelledError:
+                        pass
 
-                    # Cancel current sync task
-                    if self._sync_task and not self._sync_task.done():
-                        self._sync_task.cancel()
-                        try:
-                            await self._sync_task
-                        except asyncio.CancelledError:
-                            pass
+                if not await self._pause_running_syncs(org_id):
+                    self.logger.warning("💥 Sync service is not running")
 
                 self.logger.info("✅ Sync service paused")
                 return True
@@ -241,11 +218,12 @@ class BaseDriveSyncService(ABC):
         async with self._transition_lock:
             try:
                 users = await self.arango_service.get_users(org_id=org_id)
+                sync_states = await self.arango_service.get_users_sync_states(
+                    [user["email"] for user in users], Connectors.GOOGLE_DRIVE.value
+                )
                 for current_user in users:
-                    # Check current state using get_user_sync_state
-                    sync_state = await self.arango_service.get_user_sync_state(
-                        current_user["email"], Connectors.GOOGLE_DRIVE.value
-                    )
+                    # Check current state of the user
+                    sync_state = sync_states.get(current_user["email"])
                     if not sync_state:
                         self.logger.warning("⚠️ No sync state found, starting fresh")
                         return await self.start(org_id)
@@ -260,12 +238,10 @@ class BaseDriveSyncService(ABC):
                         return False
 
                     self._pause_event.set()
-                    self._stop_requested = False
+                    self._stop_event.clear()
 
                 # Start sync with resume state
-                self._sync_task = asyncio.create_task(
-                    self.perform_initial_sync(org_id, action="resume")
-                )
+                self._start_sync_task(org_id, action="resume")
 
                 self.logger.info("✅ Sync service resumed")
                 return True
@@ -274,38 +250,94 @@ class BaseDriveSyncService(ABC):
                 self.logger.error("❌ Failed to resume sync service: %s", str(e))
                 return False
 
-    async def _should_stop(self, org_id) -> bool:
-        """Check if operation should stop"""
-        if self._stop_requested:
-            users = await self.arango_service.get_users(org_id=org_id)
-            for user in users:
-                current_state = await self.arango_service.get_user_sync_state(
-                    user["email"], Connectors.GOOGLE_DRIVE.value
-                )
-                if current_state:
-                    current_state = current_state.get("syncState")
-                    if current_state == ProgressStatus.IN_PROGRESS.value:
-                        await self.arango_service.update_user_sync_state(
-                            user["email"],
-                            ProgressStatus.PAUSED.value,
-                            service_type=Connectors.GOOGLE_DRIVE.value,
-                        )
-                        self.logger.info("✅ Drive sync state updated before stopping")
-                        return True
-            return False
-        return False
+    def _start_sync_task(self, org_id, action: str) -> None:
+        """Run perform_initial_sync in the background as the current sync task"""
+        self._sync_task = asyncio.create_task(
+            self.perform_initial_sync(org_id, action=action)
+        )
+        self._sync_task.add_done_callback(self._on_sync_done)
+
+    def _on_sync_done(self, task: asyncio.Task) -> None:
+        """Drop the reference to a finished sync task and report its failure"""
+        if self._sync_task is task:
+            self._sync_task = None
+        if not task.cancelled() and task.exception():
+            self.logger.error("❌ Sync task failed: %s", str(task.exception()))
+
+    def request_stop(self) -> None:
+        """Ask the running sync to stop at its next checkpoint"""
+        self._stop_event.set()
+
+    async def _pause_running_syncs(self, org_id) -> List[str]:
+        """Mark every running Drive sync of the org as paused
+
+        Returns:
+            Emails of the users whose sync was paused
+        """
+        users = await self.arango_service.get_users(org_id=org_id)
+        paused_emails = await self.arango_service.pause_running_user_syncs(
+            [user["email"] for user in users], Connectors.GOOGLE_DRIVE.value
+        )
+        if paused_emails:
+            self.logger.info("✅ Drive sync state updated before stopping")
+        return paused_emails
 
     @abstractmethod
     async def resync_drive(self, org_id, user):
         """Resync a user's Google Drive"""
         pass
 
-    async def process_drive_data(self, drive_info, user):
+    async def _sync_user_changes(self, org_id, user, user_service) -> bool:
+        """Apply the Drive changes of a user since the stored page token"""
+        self.logger.info(f"Resyncing drive for user {user['email']}")
+        page_token = await self.arango_service.get_page_token_db(
+            user_email=user["email"]
+        )
+
+        if not page_token:
+            self.logger.warning(f"No page token found for user {user['email']}")
+            return True
+
+        changes, new_token = await user_service.get_changes(
+            page_token=page_token["token"]
+        )
+        user_id = user["userId"]
+
+        if changes:
+            self.logger.warning(f"Changes found for user {user['email']}")
+            for change in changes:
+                try:
+                    await self.change_handler.process_change(
+                        change, user_service, org_id, user_id
+                    )
+                except Exception as e:
+                    self.logger.error(f"Error processing change: {str(e)}")
+                    continue
+        else:
+            self.logger.info("ℹ️ No changes found for user %s", user["email"])
+
+        if new_token and new_token != page_token["token"]:
+            await self.arango_service.store_page_token(
+                channel_id=page_token["channelId"],
+                resource_id=page_token["resourceId"],
+                user_email=user["email"],
+                token=new_token,
+                expiration=page_token["expiration"],
+            )
+            self.logger.info(f"🚀 Updated token for user {user['email']}")
+
+        return True
+
+    async def process_drive_data(self, drive_info, user, transaction=None):
         """Process drive data including drive document, file record, record and permissions
 
+        The drive is stored with its sync state set to IN_PROGRESS, in the same
+        query as its record and relationships.
+
         Args:
             drive_info (dict): Complete drive metadata from get_drive_info
             user (dict): Current user information
+            transaction: Optional ArangoDB transaction to write in
 
         Returns:
             bool: True if processing successful, False otherwise
@@ -315,96 +347,412 @@ class BaseDriveSyncService(ABC):
                 "🚀 Processing drive data for drive %s", drive_info["drive"]["id"]
             )
 
-            # Check if drive already exists
-            existing_drive = self.arango_service.db.aql.execute(
-                f"FOR doc IN {CollectionNames.RECORDS.value} FILTER doc.externalRecordId == @drive_id RETURN doc",
-                bind_vars={"drive_id": drive_info["drive"]["id"]},
+            # Store the drive, reusing the key of an already stored drive,
+            # together with its record and relationships in one query
+            timestamp = get_epoch_timestamp_in_ms()
+            drive_info["drive"]["sync_state"] = ProgressStatus.IN_PROGRESS.value
+            drive_info["drive"]["last_sync_update"] = timestamp
+            drive_key = await self.arango_service.upsert_drive(
+                drive_info["drive"],
+                drive_info["record"],
+                user["email"],
+                {
+                    "role": (
+                        "WRITER"
+                        if drive_info["drive"]["access_level"] == "writer"
+                        else "READER"
+                    ),
+                    "type": "USER",
+                    "externalPermissionId": None,
+                    "createdAtTimestamp": timestamp,
+                    "updatedAtTimestamp": timestamp,
+                    "lastUpdatedTimestampAtSource": timestamp,
+                },
+                transaction=transaction,
+            )
+            if not drive_key:
+                raise Exception("Failed to store drive data")
+            drive_info["drive"]["_key"] = drive_key
+            drive_info["record"]["_key"] = drive_key
+
+            self.logger.info(
+                "✅ Successfully processed drive data for drive %s",
+                drive_info["drive"]["id"],
             )
-            existing = next(existing_drive, None)
+            return True
+
+        except Exception as e:
+            self.logger.error("❌ Failed to process drive data: %s", str(e))
+            return False
+
+    async def _drive_file_batches(self, user_service, drive_id, user_email, batch_size):
+        """Yield (index, batch) for the files of a drive as they are listed
+
+        Files shared with the user are appended after the drive listing, and
+        only when the drive itself has files.
+        """
+        index = 0
+        pending_files = []
+        async for files in user_service.iter_files_in_folder(drive_id):
+            pending_files.extend(files)
+            if len(pending_files) < batch_size:
+                continue
+            # Cut the full batches in one pass and carry the remainder over
+            # to the next page
+            remaining = iter(pending_files)
+            for _ in range(len(pending_files) // batch_size):
+                yield index, list(islice(remaining, batch_size))
+                index += batch_size
+            pending_files = list(remaining)
+
+        if not index and not pending_files:
+            return
+
+        # Get shared files and add them to processing queue
+        shared_files = await user_service.get_shared_with_me_files(user_email)
+        if shared_files:
+            self.logger.info("Found %d shared files to process", len(shared_files))
+            pending_files.extend(shared_files)
+
+        remaining = iter(pending_files)
+        batch = list(islice(remaining, batch_size))
+        while batch:
+            yield index, batch
+            index += batch_size
+            batch = list(islice(remaining, batch_size))
+
+    async def _fetched_file_batches(self, user_service, drive_id, user_email, batch_size=50):
+        """Yield (index, batch, regular_batch_metadata) for each file batch
+
+        Metadata and permissions of the regular (not shared) files of the next
+        batch are fetched from Drive while the caller writes the one just
+        yielded, so API latency overlaps with the database writes.
+        """
+        batches = self._drive_file_batches(
+            user_service, drive_id, user_email, batch_size
+        )
 
-            if existing:
-                self.logger.debug(
-                    "Drive %s already exists in ArangoDB", drive_info["drive"]["id"]
+        async def next_batch():
+            try:
+                return await batches.__anext__()
+            except StopAsyncIteration:
+                return None
+
+        def fetch(batch):
+            regular_files = [f for f in batch if not f.get("isSharedWithMe", False)]
+            if not regular_files:
+                return None
+            return asyncio.create_task(
+                user_service.batch_fetch_metadata_and_permissions(
+                    [f["id"] for f in regular_files], files=regular_files
                 )
-                drive_info["drive"]["_key"] = existing["_key"]
-                drive_info["record"]["_key"] = existing["_key"]
+            )
 
-            # Save drive in drives collection
-            await self.arango_service.batch_upsert_nodes(
-                [drive_info["drive"]], collection=CollectionNames.DRIVES.value
+        current = await next_batch()
+        pending = fetch(current[1]) if current else None
+        try:
+            while current:
+                i, batch = current
+                # The next listing page is requested while this batch's
+                # metadata is still being fetched
+                following = await next_batch()
+                regular_batch_metadata = await pending if pending else []
+                current = following
+                pending = fetch(current[1]) if current else None
+                yield i, batch, regular_batch_metadata
+        finally:
+            if pending and not pending.done():
+                pending.cancel()
+            await batches.aclose()
+
+    async def _sync_drive(self, org_id, user, user_service, drive_id) -> bool:
+        """Sync the records of one drive of a user
+
+        Returns:
+            False if the sync was stopped, True otherwise
+        """
+        # Get drive details with complete metadata
+        drive_info = await user_service.get_drive_info(drive_id, org_id)
+        if not drive_info:
+            self.logger.warning(
+                "❌ Failed to get drive info for drive %s", drive_id
             )
+            return True
+
+        drive_id = drive_info.get("drive").get("id")
 
-            # Save drive as record
-            await self.arango_service.batch_upsert_nodes(
-                [drive_info["record"]], collection=CollectionNames.RECORDS.value
+        # Check drive state first
+        drive_state = await self.arango_service.get_drive_sync_state(
+            drive_id
+        )
+        if drive_state == ProgressStatus.COMPLETED.value:
+            self.logger.info(
+                "Drive %s is already completed, skipping", drive_id
             )
+            return True
 
-            await self.arango_service.batch_create_edges(
-                [
-                    {
-                        "_from": f"{CollectionNames.RECORDS.value}/{drive_info['record']['_key']}",
-                        "_to": f"{CollectionNames.DRIVES.value}/{drive_info['drive']['_key']}",
-                    }
-                ],
-                collection=CollectionNames.IS_OF_TYPE.value,
+        if self._stop_event.is_set():
+            self.logger.info(
+                "Sync stopped during drive %s processing", drive_id
+            )
+            await self.arango_service.update_drive_sync_state(
+                drive_id, ProgressStatus.PAUSED.value, fire_and_forget=True
             )
+            return False
 
-            # Get user ID for relationships
-            user_id = await self.arango_service.get_entity_id_by_email(user["email"])
-            self.logger.info("user_id: %s", user_id)
+        try:
+            # Process drive data
+            if not await self.process_drive_data(drive_info, user):
+                self.logger.error(
+                    "❌ Failed to process drive data for drive %s",
+                    drive_id,
+                )
+                return True
 
-            # Create user-drive relationship
-            user_drive_relation = {
-                "_from": f"{CollectionNames.USERS.value}/{user_id}",
-                "_to": f"{CollectionNames.DRIVES.value}/{drive_info['drive']['_key']}",
-                "access_level": drive_info["drive"]["access_level"],
+            # The connector endpoint is the same for every file of the drive
+            endpoints = await self.config_service.get_config(
+                config_node_constants.ENDPOINTS.value
+            )
+            connector_endpoint = endpoints.get("connectors").get(
+                "endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value
+            )
+            signed_url_prefix = (
+                f"{connector_endpoint}/api/v1/{org_id}/{user['userId']}/drive/record/"
+            )
+            base_event = {
+                "orgId": org_id,
+                "recordVersion": 0,  # Initial version for new files
+                "eventType": EventTypes.NEW_RECORD.value,
+                "connectorName": Connectors.GOOGLE_DRIVE.value,
+                "origin": OriginTypes.CONNECTOR.value,
             }
-            self.logger.info("user_drive_relation: %s", user_drive_relation)
 
-            await self.arango_service.batch_create_edges(
-                [user_drive_relation],
-                collection=CollectionNames.USER_DRIVE_RELATION.value,
+            # Indexing events are sent once enough of them accumulated, and
+            # whatever is left when the drive loop ends since their records
+            # are already stored
+            index_events = []
+            file_batches = self._fetched_file_batches(
+                user_service, drive_id, user["email"]
             )
+            try:
+                # Process files in batches while the drive is still being listed
+                async for i, batch, regular_batch_metadata in file_batches:
+                    if self._stop_event.is_set():
+                        self.logger.info(
+                            "Sync stopped during batch processing at index %s",
+                            i,
+                        )
+                        await self.arango_service.update_drive_sync_state(
+                            drive_id, ProgressStatus.PAUSED.value, fire_and_forget=True
+                        )
+                        return False
 
-            # Create user-record relationship with permissions
-            user_record_relation = {
-                "_to": f"{CollectionNames.USERS.value}/{user_id}",
-                "_from": f"{CollectionNames.RECORDS.value}/{drive_info['record']['_key']}",
-                "role": (
-                    "WRITER"
-                    if drive_info["drive"]["access_level"] == "writer"
-                    else "READER"
-                ),
-                "type": "USER",
-                "externalPermissionId": None,
-                "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
-                "lastUpdatedTimestampAtSource": get_epoch_timestamp_in_ms(),
-            }
+                    # Separate shared and regular files
+                    shared_batch_metadata = [
+                        f for f in batch if f.get("isSharedWithMe", False)
+                    ]
+                    regular_file_ids = [
+                        f["id"] for f in batch if not f.get("isSharedWithMe", False)
+                    ]
 
-            await self.arango_service.batch_create_edges(
-                [user_record_relation], collection=CollectionNames.PERMISSIONS.value
-            )
+                    # Combine metadata from both shared and regular files
+                    batch_metadata = shared_batch_metadata + regular_batch_metadata
 
-            self.logger.info(
-                "✅ Successfully processed drive data for drive %s",
-                drive_info["drive"]["id"],
+                    if not await self.process_batch(batch_metadata, org_id):
+                        continue
+
+                    # Load the stored record and file of every regular file at once
+                    stored_documents = await self.arango_service.get_records_and_files_by_external_record_ids(
+                        regular_file_ids
+                    )
+
+                    # Process each file in the batch - ONLY FOR REGULAR FILES
+                    metadata_by_id = {
+                        meta["id"]: meta for meta in regular_batch_metadata if meta
+                    }
+                    for file_id in regular_file_ids:
+                        file_metadata = metadata_by_id.get(file_id)
+                        if file_metadata:
+                            file_id = file_metadata.get("id")
+
+                            stored = stored_documents.get(file_id)
+                            if not stored:
+                                self.logger.warning(
+                                    "⚠️ No stored record found for file %s", file_id
+                                )
+                                continue
+                            record = stored["record"]
+                            file = stored["file"] or {}
+                            file_key = record["_key"]
+
+                            index_event = {
+                                **base_event,
+                                "recordId": file_key,
+                                "recordName": record.get("recordName"),
+                                "recordType": record.get("recordType"),
+                                "signedUrlRoute": signed_url_prefix
+                                + file_key
+                                + "/signedUrl",
+                                "createdAtSourceTimestamp": record.get(
+                                    "sourceCreatedAtTimestamp"
+                                ),
+                                "modifiedAtSourceTimestamp": record.get(
+                                    "sourceLastModifiedTimestamp"
+                                ),
+                                "extension": file.get("extension"),
+                                "mimeType": file.get("mimeType"),
+                            }
+
+                            index_events.append(index_event)
+
+                    if len(index_events) >= self.INDEX_EVENTS_FLUSH_SIZE:
+                        await self._send_index_events(index_events)
+            finally:
+                # Closing the batches on an early return cancels the prefetch
+                # of the next one instead of leaving it to garbage collection
+                await file_batches.aclose()
+                await self._send_index_events(index_events)
+
+            # Update drive status after completion
+            await self.arango_service.update_drive_sync_state(
+                drive_id, "COMPLETED"
             )
-            return True
 
         except Exception as e:
-            self.logger.error("❌ Failed to process drive data: %s", str(e))
-            return False
+            self.logger.error(
+                f"❌ Failed to process drive {drive_id}: {str(e)}"
+            )
+        return True
+
+    async def _send_index_events(self, index_events) -> None:
+        """Send the accumulated indexing events with a single flush and clear them"""
+        if not index_events:
+            return
+        await self.kafka_service.send_events_to_kafka(index_events)
+        self.logger.info("📨 Sent %d Kafka Indexing events", len(index_events))
+        index_events.clear()
+
+    async def _sync_drives(self, org_id, user, user_service, drive_ids=None) -> bool:
+        """Sync the drives of a user, a bounded number of drives at a time
+
+        Args:
+            drive_ids: Drives to sync, defaults to the current drive workers
+
+        Returns:
+            False if the sync was stopped, True otherwise
+        """
+        if drive_ids is None:
+            drive_ids = list(self.drive_workers)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DRIVES)
+
+        async def sync_drive(drive_id):
+            async with semaphore:
+                return await self._sync_drive(org_id, user, user_service, drive_id)
+
+        results = await asyncio.gather(
+            *(sync_drive(drive_id) for drive_id in drive_ids),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return all(results)
 
     async def process_batch(self, metadata_list, org_id):
         """Process a single batch with atomic operations"""
         batch_start_time = datetime.now(timezone.utc)
 
         try:
-            if await self._should_stop(org_id):
+            if self._stop_event.is_set():
                 return False
 
+            # Build the documents of every file before taking the lock, they
+            # only depend on the batch metadata. Every record of the batch
+            # shares the same sync timestamp
+            current_timestamp = get_epoch_timestamp_in_ms()
+
+            prepared = []
+            for metadata in metadata_list:
+                if not metadata:
+                    self.logger.warning("❌ No metadata found for file")
+                    continue
+
+                metadata_get = metadata.get
+                file_id = metadata_get("id")
+                if not file_id:
+                    self.logger.warning("❌ No file ID found for file")
+                    continue
+
+                # Prepare File, Record and File Metadata
+                file = {
+                    "_key": str(uuid.uuid4()),
+                    "orgId": org_id,
+                    "name": str(metadata_get("name")),
+                    "isFile": metadata_get("mimeType", "")
+                    != MimeTypes.GOOGLE_DRIVE_FOLDER.value,
+                    "extension": metadata_get("fileExtension"),
+                    "mimeType": metadata_get("mimeType"),
+                    "sizeInBytes": int(metadata_get("size", 0)),
+                    "webUrl": metadata_get("webViewLink"),
+                    "etag": metadata_get("etag"),
+                    "ctag": metadata_get("ctag"),
+                    "quickXorHash": metadata_get("quickXorHash"),
+                    "crc32Hash": metadata_get("crc32Hash"),
+                    "md5Checksum": metadata_get("md5Checksum"),
+                    "sha1Hash": metadata_get("sha1Checksum"),
+                    "sha256Hash": metadata_get("sha256Checksum"),
+                    "path": metadata_get("path"),
+                }
+
+                self.logger.debug("Metadata: %s", metadata)
+
+                # Determine indexing and extraction status based on whether file is shared
+                is_shared = metadata_get("isSharedWithMe", False)
+                shared_status = ProgressStatus.AUTO_INDEX_OFF.value if is_shared else ProgressStatus.NOT_STARTED.value
+
+                record = {
+                    "_key": f'{file["_key"]}',
+                    "orgId": org_id,
+                    "recordName": f'{file["name"]}',
+                    "recordType": RecordTypes.FILE.value,
+                    "version": 0,
+                    "externalRecordId": str(file_id),
+                    "externalRevisionId": metadata_get("headRevisionId"),
+                    "createdAtTimestamp": current_timestamp,
+                    "updatedAtTimestamp": current_timestamp,
+                    "sourceCreatedAtTimestamp": parse_timestamp(
+                        metadata_get("createdTime")
+                    ),
+                    "sourceLastModifiedTimestamp": parse_timestamp(
+                        metadata_get("modifiedTime")
+                    ),
+                    "origin": OriginTypes.CONNECTOR.value,
+                    "connectorName": Connectors.GOOGLE_DRIVE.value,
+                    "virtualRecordId": None,
+                    "isArchived": False,
+                    "isDeleted": False,
+                    "isLatestVersion": True,
+                    "isDirty": False,
+                    "lastSyncTimestamp": current_timestamp,
+                    "indexingStatus": shared_status,
+                    "extractionStatus": shared_status,
+                    "lastIndexTimestamp": None,
+                    "lastExtractionTimestamp": None,
+                    "reason": None,
+                }
+
+                is_of_type_record = {
+                    "_from": f"{CollectionNames.RECORDS.value}/{record['_key']}",
+                    "_to": f"{CollectionNames.FILES.value}/{file['_key']}",
+                    "createdAtTimestamp": current_timestamp,
+                    "updatedAtTimestamp": current_timestamp,
+                }
+
+                prepared.append((file_id, file, record, is_of_type_record))
+
             async with self._sync_lock:
+                if self._stop_event.is_set():
+                    return False
 
                 # Prepare nodes and edges for batch processing
                 files = []
@@ -413,96 +761,23 @@ class BaseDriveSyncService(ABC):
                 recordRelations = []
                 existing_files = []
 
-                for metadata in metadata_list:
-                    if not metadata:
-                        self.logger.warning("❌ No metadata found for file")
-                        continue
-
-                    file_id = metadata.get("id")
-                    if not file_id:
-                        self.logger.warning("❌ No file ID found for file")
-                        continue
-
-                    # Check if file already exists in ArangoDB
-                    existing_file = self.arango_service.db.aql.execute(
-                        f"FOR doc IN {CollectionNames.RECORDS.value} FILTER doc.externalRecordId == @file_id RETURN doc",
-                        bind_vars={"file_id": file_id},
+                # Look up which files of the batch are already stored in one query
+                existing_record_keys = (
+                    await self.arango_service.get_keys_by_external_record_ids(
+                        [file_id for file_id, *_ in prepared]
                     )
-                    existing = next(existing_file, None)
+                )
 
-                    if existing:
+                for file_id, file, record, is_of_type_record in prepared:
+                    # Check if file already exists in ArangoDB
+                    if file_id in existing_record_keys:
                         self.logger.debug("File %s already exists in ArangoDB", file_id)
                         existing_files.append(file_id)
+                        continue
 
-                    else:
-                        # Prepare File, Record and File Metadata
-                        file = {
-                            "_key": str(uuid.uuid4()),
-                            "orgId": org_id,
-                            "name": str(metadata.get("name")),
-                            "isFile": metadata.get("mimeType", "")
-                            != MimeTypes.GOOGLE_DRIVE_FOLDER.value,
-                            "extension": metadata.get("fileExtension", None),
-                            "mimeType": metadata.get("mimeType", None),
-                            "sizeInBytes": int(metadata.get("size", 0)),
-                            "webUrl": metadata.get("webViewLink", None),
-                            "etag": metadata.get("etag", None),
-                            "ctag": metadata.get("ctag", None),
-                            "quickXorHash": metadata.get("quickXorHash", None),
-                            "crc32Hash": metadata.get("crc32Hash", None),
-                            "md5Checksum": metadata.get("md5Checksum", None),
-                            "sha1Hash": metadata.get("sha1Checksum", None),
-                            "sha256Hash": metadata.get("sha256Checksum", None),
-                            "path": metadata.get("path", None),
-                        }
-
-                        self.logger.debug("Metadata: %s", metadata)
-
-                        # Determine indexing and extraction status based on whether file is shared
-                        is_shared = metadata.get("isSharedWithMe", False)
-                        shared_status = ProgressStatus.AUTO_INDEX_OFF.value if is_shared else ProgressStatus.NOT_STARTED.value
-
-                        record = {
-                            "_key": f'{file["_key"]}',
-                            "orgId": org_id,
-                            "recordName": f'{file["name"]}',
-                            "recordType": RecordTypes.FILE.value,
-                            "version": 0,
-                            "externalRecordId": str(file_id),
-                            "externalRevisionId": metadata.get("headRevisionId", None),
-                            "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                            "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
-                            "sourceCreatedAtTimestamp": int(
-                                parse_timestamp(metadata.get("createdTime"))
-                            ),
-                            "sourceLastModifiedTimestamp": int(
-                                parse_timestamp(metadata.get("modifiedTime"))
-                            ),
-                            "origin": OriginTypes.CONNECTOR.value,
-                            "connectorName": Connectors.GOOGLE_DRIVE.value,
-                            "virtualRecordId": None,
-                            "isArchived": False,
-                            "isDeleted": False,
-                            "isLatestVersion": True,
-                            "isDirty": False,
-                            "lastSyncTimestamp": get_epoch_timestamp_in_ms(),
-                            "indexingStatus": shared_status,
-                            "extractionStatus": shared_status,
-                            "lastIndexTimestamp": None,
-                            "lastExtractionTimestamp": None,
-                            "reason": None,
-                        }
-
-                        is_of_type_record = {
-                            "_from": f"{CollectionNames.RECORDS.value}/{record['_key']}",
-                            "_to": f"{CollectionNames.FILES.value}/{file['_key']}",
-                            "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                            "updatedAtTimestamp": get_epoch_timestamp_in_ms(),
-                        }
-
-                        files.append(file)
-                        records.append(record)
-                        is_of_type_records.append(is_of_type_record)
+                    files.append(file)
+                    records.append(record)
+                    is_of_type_records.append(is_of_type_record)
 
                 # Batch process all collected data
                 if files or records or recordRelations:
@@ -534,96 +809,70 @@ class BaseDriveSyncService(ABC):
                                 CollectionNames.BELONGS_TO.value,
                             ],
                         )
-                        # Process files with revision checking
-                        if files:
-                            if not await self.arango_service.batch_upsert_nodes(
-                                files,
-                                collection=CollectionNames.FILES.value,
-                                transaction=txn,
-                            ):
-                                raise Exception(
-                                    "Failed to batch upsert files with existing revision"
-                                )
-
-                        # Process records and relations
-                        if records:
-                            if not await self.arango_service.batch_upsert_nodes(
-                                records,
-                                collection=CollectionNames.RECORDS.value,
-                                transaction=txn,
-                            ):
-                                raise Exception("Failed to batch upsert records")
+                        # Keys of the records created for this batch
+                        record_keys = {
+                            record["externalRecordId"]: record["_key"]
+                            for record in records
+                        }
 
-                        if is_of_type_records:
-                            if not await self.arango_service.batch_create_edges(
-                                is_of_type_records,
-                                collection=CollectionNames.IS_OF_TYPE.value,
+                        # Prepare edge data if parent exists, looking up the keys
+                        # of the other files and parents of the batch in one query
+                        # (a set, as Drive can list the same parent twice)
+                        parent_pairs = {
+                            (metadata.get("id"), parent_id)
+                            for metadata in metadata_list
+                            if metadata
+                            for parent_id in metadata.get("parents", [])
+                        }
+                        if parent_pairs:
+                            self.logger.debug(
+                                "Resolving %d parent relations", len(parent_pairs)
+                            )
+                            relation_keys = await self.arango_service.get_keys_by_external_record_ids(
+                                list(
+                                    {external_id for pair in parent_pairs for external_id in pair}
+                                    - record_keys.keys()
+                                ),
                                 transaction=txn,
-                            ):
-                                raise Exception(
-                                    "Failed to batch create is_of_type relations"
-                                )
-
-                        db = txn if txn else self.arango_service.db
-                        # Prepare edge data if parent exists
-                        for metadata in metadata_list:
-                            file_id = metadata.get("id")
-                            if "parents" in metadata:
-                                self.logger.info(
-                                    "parents in metadata: %s", metadata["parents"]
-                                )
-                                for parent_id in metadata["parents"]:
-                                    self.logger.info("parent_id: %s", parent_id)
-                                    parent_cursor = db.aql.execute(
-                                        f"FOR doc IN {CollectionNames.RECORDS.value} FILTER doc.externalRecordId == @parent_id RETURN doc._key",
-                                        bind_vars={"parent_id": parent_id},
-                                    )
-                                    file_cursor = db.aql.execute(
-                                        f"FOR doc IN {CollectionNames.RECORDS.value} FILTER doc.externalRecordId == @file_id RETURN doc._key",
-                                        bind_vars={"file_id": file_id},
+                            )
+                            relation_keys.update(record_keys)
+                            for file_id, parent_id in parent_pairs:
+                                parent_key = relation_keys.get(parent_id)
+                                file_key = relation_keys.get(file_id)
+                                if parent_key and file_key:
+                                    recordRelations.append(
+                                        {
+                                            "_from": f"{CollectionNames.RECORDS.value}/{parent_key}",
+                                            "_to": f"{CollectionNames.RECORDS.value}/{file_key}",
+                                            "relationType": RecordRelations.PARENT_CHILD.value,
+                                        }
                                     )
-                                    parent_key = next(parent_cursor, None)
-                                    file_key = next(file_cursor, None)
-                                    self.logger.info("parent_key: %s", parent_key)
-                                    self.logger.info("file_key: %s", file_key)
-
-                                    if parent_key and file_key:
-                                        recordRelations.append(
-                                            {
-                                                "_from": f"{CollectionNames.RECORDS.value}/{parent_key}",
-                                                "_to": f"{CollectionNames.RECORDS.value}/{file_key}",
-                                                "relationType": RecordRelations.PARENT_CHILD.value,
-                                            }
-                                        )
-
-                        if recordRelations:
-                            if not await self.arango_service.batch_create_edges(
-                                recordRelations,
-                                collection=CollectionNames.RECORD_RELATIONS.value,
-                                transaction=txn,
-                            ):
-                                raise Exception("Failed to batch create file relations")
 
-                        # Process permissions
+                        # Write files, records and their relations in one query
+                        if not await self.arango_service.batch_upsert_multi(
+                            {
+                                CollectionNames.FILES.value: files,
+                                CollectionNames.RECORDS.value: records,
+                            },
+                            edges={
+                                CollectionNames.IS_OF_TYPE.value: is_of_type_records,
+                                CollectionNames.RECORD_RELATIONS.value: recordRelations,
+                            },
+                            transaction=txn,
+                        ):
+                            raise Exception(
+                                "Failed to batch upsert files, records and relations"
+                            )
+
+                        # Process permissions, keyed by the records created above
+                        file_permissions = []
                         for metadata in metadata_list:
                             file_id = metadata.get("id")
                             if file_id in existing_files:
                                 continue
                             permissions = metadata.pop("permissions", [])
 
-                            # Get file key from file_id
-                            query = f"""
-                            FOR record IN {CollectionNames.RECORDS.value}
-                            FILTER record.externalRecordId == @file_id
-                            RETURN record._key
-                            """
-
-                            db = txn if txn else self.arango_service.db
-
-                            cursor = db.aql.execute(
-                                query, bind_vars={"file_id": file_id}
-                            )
-                            file_key = next(cursor, None)
+                            file_key = record_keys.get(str(file_id))
 
                             if not file_key:
                                 self.logger.error(
@@ -631,9 +880,12 @@ class BaseDriveSyncService(ABC):
                                 )
                                 return False
                             if permissions:
-                                await self.arango_service.process_file_permissions(
-                                    org_id, file_key, permissions, transaction=txn
-                                )
+                                file_permissions.append((file_key, permissions))
+
+                        if file_permissions:
+                            await self.arango_service.process_new_file_permissions(
+                                org_id, file_permissions, transaction=txn
+                            )
 
                         txn.commit_transaction()
                         txn = None
@@ -674,6 +926,9 @@ class BaseDriveSyncService(ABC):
 class DriveSyncEnterpriseService(BaseDriveSyncService):
     """Sync service for enterprise setup using admin service"""
 
+    # Users set up or synced at the same time during initialize and initial sync
+    MAX_CONCURRENT_USERS = 5
+
     def __init__(
         self,
         logger,
@@ -766,43 +1021,44 @@ class DriveSyncEnterpriseService(BaseDriveSyncService):
             if enterprise_users:
                 self.logger.info("🚀 Found %s users", len(enterprise_users))
 
-                for user in enterprise_users:
-                    # Add sync state to user info
-                    user_id = await self.arango_service.get_entity_id_by_email(
-                        user["email"]
-                    )
-                    if not user_id:
-                        await self.arango_service.batch_upsert_nodes(
-                            [user], collection=CollectionNames.USERS.value
-                        )
-
-            # List and store groups
+            # List groups and store the users and groups that are not stored yet
             groups = await self.drive_admin_service.list_groups(org_id)
             if groups:
                 self.logger.info("🚀 Found %s groups", len(groups))
-                for group in groups:
-                    group_id = await self.arango_service.get_entity_id_by_email(group["email"])
-                    if not group_id:
-                        await self.arango_service.batch_upsert_nodes(
-                            [group], collection=CollectionNames.GROUPS.value
-                        )
+            stored_entities = await self.arango_service.get_entity_ids_by_emails(
+                [entity["email"] for entity in [*enterprise_users, *groups]]
+            )
+            stored_emails = {
+                email
+                for email, (collection, _) in stored_entities.items()
+                if collection != CollectionNames.PEOPLE.value
+            }
+            new_users = [
+                user for user in enterprise_users if user["email"] not in stored_emails
+            ]
+            if new_users:
+                await self.arango_service.batch_upsert_nodes(
+                    new_users, collection=CollectionNames.USERS.value
+                )
+            new_groups = [
+                group for group in groups if group["email"] not in stored_emails
+            ]
+            if new_groups:
+                await self.arango_service.batch_upsert_nodes(
+                    new_groups, collection=CollectionNames.GROUPS.value
+                )
 
             # Create relationships between users and groups in belongsTo collection
             belongs_to_group_relations = []
+            members_by_group = await self.drive_admin_service.batch_list_group_members(
+                [group["email"] for group in groups]
+            )
+            users_by_email = {user["email"]: user for user in enterprise_users}
             for group in groups:
                 try:
-                    group_members = await self.drive_admin_service.list_group_members(
-                        group["email"]
-                    )
+                    group_members = members_by_group.get(group["email"], [])
                     for member in group_members:
-                        matching_user = next(
-                            (
-                                user
-                                for user in enterprise_users
-                                if user["email"] == member["email"]
-                            ),
-                            None,
-                        )
+                        matching_user = users_by_email.get(member["email"])
                         if matching_user:
                             # Check if the relationship already exists
                             existing_relation = (
@@ -867,368 +1123,231 @@ class DriveSyncEnterpriseService(BaseDriveSyncService):
             # Initialize Celery
             await self.celery_app.setup_app()
 
-            # Check sync states and update if needed
+            # Check sync states and set up the changes watch of each user,
+            # a bounded number of users at a time
             active_users = await self.arango_service.get_users(org_id, active=True)
-            for user in active_users:
-                # Check if user exists in enterprise users
-                is_enterprise_user = False
-                for enterprise_user in enterprise_users:
-                    if enterprise_user["email"] == user["email"]:
-                        is_enterprise_user = True
-                        break
-
-                if not is_enterprise_user:
-                    self.logger.warning(f"User {user['email']} not found in enterprise users")
-                    continue
-
-                self.logger.info(f"Found enterprise user {user['email']}, continuing with sync")
-
-                sync_state = await self.arango_service.get_user_sync_state(
-                    user["email"], Connectors.GOOGLE_DRIVE.value
-                )
-                current_state = (
-                    sync_state.get("syncState") if sync_state else ProgressStatus.NOT_STARTED.value
+            paused_emails = await self.arango_service.pause_running_user_syncs(
+                [user["email"] for user in active_users if user["email"] in users_by_email],
+                Connectors.GOOGLE_DRIVE.value,
+            )
+            for email in paused_emails:
+                self.logger.warning(
+                    "Sync was RUNNING for user %s, paused it", email
                 )
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_USERS)
 
-                if current_state == ProgressStatus.IN_PROGRESS.value:
-                    self.logger.warning(
-                        f"Sync is currently RUNNING for user {user['email']}. Pausing it."
-                    )
-                    await self.arango_service.update_user_sync_state(
-                        user["email"],
-                        ProgressStatus.PAUSED.value,
-                        service_type=Connectors.GOOGLE_DRIVE.value,
-                    )
-
-                try:
-                    self.logger.info(
-                        "🚀 Setting up changes watch for user %s", user["email"]
-                    )
-                    channel_data = await self.setup_changes_watch(user["email"])
-                    if not channel_data:
-                        self.logger.error(
-                            "Token not created for user: %s", user["email"]
-                        )
-                        continue
-                    else:
-                        await self.arango_service.store_page_token(
-                            channel_data["channelId"],
-                            channel_data["resourceId"],
-                            user["email"],
-                            channel_data["token"],
-                            channel_data["expiration"],
-                        )
+            async def setup_user(user):
+                async with semaphore:
+                    return await self._setup_user_watch(user, users_by_email)
 
-                    self.logger.info(
-                        "✅ Changes watch set up successfully for user: %s",
-                        user["email"],
-                    )
-
-                except Exception as e:
+            results = await asyncio.gather(
+                *(setup_user(user) for user in active_users), return_exceptions=True
+            )
+            page_tokens = []
+            for user, result in zip(active_users, results):
+                if isinstance(result, Exception):
                     self.logger.error(
                         "❌ Error setting up changes watch for user %s: %s",
                         user["email"],
-                        str(e),
+                        str(result),
                     )
-                    return False
+                elif result:
+                    page_tokens.append(result)
+
+            # Store the page tokens of all watched users at once
+            if page_tokens:
+                await self.arango_service.batch_store_page_tokens(page_tokens)
 
             self.logger.info("✅ Drive Sync service initialized successfully")
             return True
 
         except Exception as e:
             self.logger.error("❌ Failed to initialize enterprise sync: %s", str(e))
-            return False
-
-    async def perform_initial_sync(self, org_id, action: str = "start") -> bool:
-        """First phase: Build complete drive structure using batch operations"""
-        try:
-            if await self._should_stop(org_id):
-                self.logger.info("Sync stopped before starting")
-                return False
-
-            users = await self.arango_service.get_users(org_id)
-
-            for user in users:
-                enterprise_users = await self.drive_admin_service.list_enterprise_users(org_id)
-
-                # Check if user exists in enterprise users
-                is_enterprise_user = False
-                for enterprise_user in enterprise_users:
-                    if enterprise_user["email"] == user["email"]:
-                        is_enterprise_user = True
-                        break
-
-                if not is_enterprise_user:
-                    self.logger.warning(f"User {user['email']} not found in enterprise users")
-                    continue
-
-                self.logger.info(f"Found enterprise user {user['email']}, continuing with sync")
-
-                sync_state = await self.arango_service.get_user_sync_state(
-                    user["email"], Connectors.GOOGLE_DRIVE.value
-                )
-                if sync_state is None:
-                    apps = await self.arango_service.get_org_apps(org_id)
-                    for app in apps:
-                        if app["name"] == Connectors.GOOGLE_DRIVE.value:
-                            app_key = app["_key"]
-                            break
-                    # Create edge between user and app
-                    app_edge_data = {
-                        "_from": f"{CollectionNames.USERS.value}/{user['_key']}",
-                        "_to": f"{CollectionNames.APPS.value}/{app_key}",
-                        "syncState": ProgressStatus.NOT_STARTED.value,
-                        "lastSyncUpdate": get_epoch_timestamp_in_ms(),
-                    }
-                    await self.arango_service.batch_create_edges(
-                        [app_edge_data],
-                        CollectionNames.USER_APP_RELATION.value,
-                    )
-                    sync_state = app_edge_data
-
-                current_state = sync_state.get("syncState")
-                if current_state == ProgressStatus.COMPLETED.value:
-                    self.logger.info(
-                        "💥 Drive sync is already completed for user %s", user["email"]
-                    )
-
-                    try:
-                        if not await self.resync_drive(org_id, user):
-                            self.logger.error(
-                                f"Failed to resync drive for user {user['email']}"
-                            )
-                            continue
-                    except Exception as e:
-                        self.logger.error(
-                            f"Error processing user {user['email']}: {str(e)}"
-                        )
-                        continue
-
-                    continue
-
-                # Update user sync state to RUNNING
-                await self.arango_service.update_user_sync_state(
-                    user["email"],
-                    ProgressStatus.IN_PROGRESS.value,
-                    service_type=Connectors.GOOGLE_DRIVE.value,
-                )
-
-                if await self._should_stop(org_id):
-                    self.logger.info(
-                        "Sync stopped during user %s processing", user["email"]
-                    )
-                    await self.arango_service.update_user_sync_state(
-                        user["email"],
-                        ProgressStatus.PAUSED.value,
-                        service_type=Connectors.GOOGLE_DRIVE.value,
-                    )
-                    return False
-
-                # Validate user access and get fresh token
-                user_service = await self.drive_admin_service.create_drive_user_service(
-                    user["email"]
-                )
-                if not user_service:
-                    self.logger.warning(
-                        "❌ Failed to create user service for user: %s", user["email"]
-                    )
-                    continue
-
-                # Initialize workers and get drive list
-                await self.initialize_workers(user_service)
-
-                # Process each drive
-                for drive_id, worker in self.drive_workers.items():
-
-                    # Get drive details with complete metadata
-                    drive_info = await user_service.get_drive_info(drive_id, org_id)
-                    if not drive_info:
-                        self.logger.warning(
-                            "❌ Failed to get drive info for drive %s", drive_id
-                        )
-                        continue
-
-                    drive_id = drive_info.get("drive").get("id")
-
-                    # Check drive state first
-                    drive_state = await self.arango_service.get_drive_sync_state(
-                        drive_id
-                    )
-                    if drive_state == ProgressStatus.COMPLETED.value:
-                        self.logger.info(
-                            "Drive %s is already completed, skipping", drive_id
-                        )
-                        continue
-
-                    if await self._should_stop(org_id):
-                        self.logger.info(
-                            "Sync stopped during drive %s processing", drive_id
-                        )
-                        await self.arango_service.update_drive_sync_state(
-                            drive_id, ProgressStatus.PAUSED.value
-                        )
-                        return False
-
-                    try:
-                        # Process drive data
-                        if not await self.process_drive_data(drive_info, user):
-                            self.logger.error(
-                                "❌ Failed to process drive data for drive %s",
-                                drive_id,
-                            )
-                            continue
-
-                        # Update drive state to RUNNING
-                        await self.arango_service.update_drive_sync_state(
-                            drive_id, ProgressStatus.IN_PROGRESS.value
-                        )
+            return False
 
-                        # Get file list
-                        files = await user_service.list_files_in_folder(drive_id)
-                        if not files:
-                            continue
+    async def _setup_user_watch(self, user, users_by_email) -> Optional[Dict]:
+        """Set up the changes watch of an enterprise user
 
-                        # Get shared files and add them to processing queue
-                        shared_files = await user_service.get_shared_with_me_files(user["email"])
-                        if shared_files:
-                            self.logger.info("Found %d shared files to process", len(shared_files))
-                            files.extend(shared_files)
+        Returns:
+            The page token document to store for the user, None if the changes
+            watch could not be set up
+        """
+        # Check if user exists in enterprise users
+        if user["email"] not in users_by_email:
+            self.logger.warning(f"User {user['email']} not found in enterprise users")
+            return None
 
-                        # Process files in batches
-                        batch_size = 50
+        self.logger.info(f"Found enterprise user {user['email']}, continuing with sync")
 
-                        for i in range(0, len(files), batch_size):
-                            if await self._should_stop(org_id):
-                                self.logger.info(
-                                    "Sync stopped during batch processing at index %s",
-                                    i,
-                                )
-                                await self.arango_service.update_drive_sync_state(
-                                    drive_id, ProgressStatus.PAUSED.value
-                                )
-                                return False
+        self.logger.info("🚀 Setting up changes watch for user %s", user["email"])
+        channel_data = await self.setup_changes_watch(user["email"])
+        if not channel_data:
+            self.logger.error("Token not created for user: %s", user["email"])
+            return None
 
-                            batch = files[i : i + batch_size]
-
-                            # Separate shared and regular files
-                            shared_batch_metadata = [
-                                f for f in batch if f.get("isSharedWithMe", False)
-                            ]
-                            regular_file_ids = [
-                                f["id"] for f in batch if not f.get("isSharedWithMe", False)
-                            ]
-
-                            # Get metadata for regular files
-                            regular_batch_metadata = []
-                            if regular_file_ids:
-                                regular_batch_metadata = await user_service.batch_fetch_metadata_and_permissions(
-                                    regular_file_ids, files=[f for f in batch if not f.get("isSharedWithMe", False)]
-                                )
+        self.logger.info(
+            "✅ Changes watch set up successfully for user: %s", user["email"]
+        )
+        return {
+            "channelId": channel_data["channelId"],
+            "resourceId": channel_data["resourceId"],
+            "userEmail": user["email"],
+            "token": channel_data["token"],
+            "expiration": channel_data["expiration"],
+        }
 
-                            # Combine metadata from both shared and regular files
-                            batch_metadata = shared_batch_metadata + regular_batch_metadata
+    async def perform_initial_sync(self, org_id, action: str = "start") -> bool:
+        """First phase: Build complete drive structure using batch operations"""
+        try:
+            if self._stop_event.is_set():
+                self.logger.info("Sync stopped before starting")
+                return False
 
-                            if not await self.process_batch(batch_metadata, org_id):
-                                continue
+            users = await self.arango_service.get_users(org_id)
+            enterprise_users = await self.drive_admin_service.list_enterprise_users(org_id)
+            enterprise_emails = {enterprise_user["email"] for enterprise_user in enterprise_users}
 
-                            # Process each file in the batch - ONLY FOR REGULAR FILES
-                            for file_id in regular_file_ids:  # Changed from batch_file_ids to regular_file_ids
-                                file_metadata = next(
-                                    (
-                                        meta
-                                        for meta in regular_batch_metadata  # Changed from batch_metadata
-                                        if meta["id"] == file_id
-                                    ),
-                                    None,
-                                )
-                                if file_metadata:
-                                    file_id = file_metadata.get("id")
+            for user in users:
+                if user["email"] not in enterprise_emails:
+                    self.logger.warning(f"User {user['email']} not found in enterprise users")
+            users = [user for user in users if user["email"] in enterprise_emails]
 
-                                    file_key = await self.arango_service.get_key_by_external_file_id(
-                                        file_id
-                                    )
-                                    record = await self.arango_service.get_document(
-                                        file_key, CollectionNames.RECORDS.value
-                                    )
-                                    file = await self.arango_service.get_document(
-                                        file_key, CollectionNames.FILES.value
-                                    )
+            # Sync a bounded number of users at a time, each of them syncing
+            # a bounded number of drives
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_USERS)
 
-                                    user_id = user["userId"]
+            async def sync_user(user):
+                async with semaphore:
+                    return await self._initial_sync_user(org_id, user)
 
-                                    endpoints = await self.config_service.get_config(
-                                        config_node_constants.ENDPOINTS.value
-                                    )
-                                    connector_endpoint = endpoints.get(
-                                        "connectors"
-                                    ).get("endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value)
-
-                                    record_version = 0  # Initial version for new files
-                                    extension = file.get("extension")
-                                    mime_type = file.get("mimeType")
-                                    index_event = {
-                                        "orgId": org_id,
-                                        "recordId": file_key,
-                                        "recordName": record.get("recordName"),
-                                        "recordVersion": record_version,
-                                        "recordType": record.get("recordType"),
-                                        "eventType": EventTypes.NEW_RECORD.value,
-                                        "signedUrlRoute": f"{connector_endpoint}/api/v1/{org_id}/{user_id}/drive/record/{file_key}/signedUrl",
-                                        "connectorName": Connectors.GOOGLE_DRIVE.value,
-                                        "origin": OriginTypes.CONNECTOR.value,
-                                        "createdAtSourceTimestamp": int(
-                                            parse_timestamp(
-                                                file_metadata.get("createdTime")
-                                            )
-                                        ),
-                                        "modifiedAtSourceTimestamp": int(
-                                            parse_timestamp(
-                                                file_metadata.get("modifiedTime")
-                                            )
-                                        ),
-                                        "extension": extension,
-                                        "mimeType": mime_type,
-                                    }
-
-                                    await self.kafka_service.send_event_to_kafka(
-                                        index_event
-                                    )
-                                    self.logger.info(
-                                        "📨 Sent Kafka Indexing event for file %s: %s",
-                                        file_id,
-                                        index_event,
-                                    )
+            results = await asyncio.gather(
+                *(sync_user(user) for user in users), return_exceptions=True
+            )
 
-                        # Update drive status after completion
-                        await self.arango_service.update_drive_sync_state(
-                            drive_id, "COMPLETED"
-                        )
+            if self._stop_event.is_set():
+                # Every user coroutine has returned, mark the users still
+                # running as paused in one write
+                await self._pause_running_syncs(org_id)
 
-                    except Exception as e:
-                        self.logger.error(
-                            f"❌ Failed to process drive {drive_id}: {str(e)}"
-                        )
-                        continue
+            completed = True
+            for user, result in zip(users, results):
+                if isinstance(result, Exception):
+                    # Update user state to FAILED
+                    await self.arango_service.update_user_sync_state(
+                        user["email"], ProgressStatus.FAILED.value, service_type=Connectors.GOOGLE_DRIVE.value
+                    )
+                    self.logger.error(
+                        "❌ Initial sync failed for user %s: %s", user["email"], str(result)
+                    )
+                    completed = False
+                elif result is False:
+                    completed = False
 
-                # Update user state to COMPLETED
-                await self.arango_service.update_user_sync_state(
-                    user["email"],
-                    ProgressStatus.COMPLETED.value,
-                    service_type=Connectors.GOOGLE_DRIVE.value,
-                )
+            if not completed:
+                return False
 
             self.is_completed = True
             return True
 
         except Exception as e:
-            # Update user state to FAILED if we have a current user
-            if "user" in locals():
-                await self.arango_service.update_user_sync_state(
-                    user["email"], ProgressStatus.FAILED.value, service_type=Connectors.GOOGLE_DRIVE.value
-                )
             self.logger.error(f"❌ Initial sync failed: {str(e)}")
             return False
 
+    async def _initial_sync_user(self, org_id, user) -> bool:
+        """Initial sync of the drives of one enterprise user
+
+        Returns:
+            False if the sync was stopped, True otherwise
+        """
+        self.logger.info(f"Found enterprise user {user['email']}, continuing with sync")
+
+        sync_state = await self.arango_service.get_user_sync_state(
+            user["email"], Connectors.GOOGLE_DRIVE.value
+        )
+        if sync_state is None:
+            apps = await self.arango_service.get_org_apps(org_id)
+            for app in apps:
+                if app["name"] == Connectors.GOOGLE_DRIVE.value:
+                    app_key = app["_key"]
+                    break
+            # Create edge between user and app
+            app_edge_data = {
+                "_from": f"{CollectionNames.USERS.value}/{user['_key']}",
+                "_to": f"{CollectionNames.APPS.value}/{app_key}",
+                "syncState": ProgressStatus.NOT_STARTED.value,
+                "lastSyncUpdate": get_epoch_timestamp_in_ms(),
+            }
+            await self.arango_service.batch_create_edges(
+                [app_edge_data],
+                CollectionNames.USER_APP_RELATION.value,
+            )
+            sync_state = app_edge_data
+
+        current_state = sync_state.get("syncState")
+        if current_state == ProgressStatus.COMPLETED.value:
+            self.logger.info(
+                "💥 Drive sync is already completed for user %s", user["email"]
+            )
+
+            try:
+                if not await self.resync_drive(org_id, user):
+                    self.logger.error(
+                        f"Failed to resync drive for user {user['email']}"
+                    )
+            except Exception as e:
+                self.logger.error(
+                    f"Error processing user {user['email']}: {str(e)}"
+                )
+            return True
+
+        # Update user sync state to RUNNING
+        await self.arango_service.update_user_sync_state(
+            user["email"],
+            ProgressStatus.IN_PROGRESS.value,
+            service_type=Connectors.GOOGLE_DRIVE.value,
+        )
+
+        if self._stop_event.is_set():
+            self.logger.info(
+                "Sync stopped during user %s processing", user["email"]
+            )
+            await self.arango_service.update_user_sync_state(
+                user["email"],
+                ProgressStatus.PAUSED.value,
+                service_type=Connectors.GOOGLE_DRIVE.value,
+            )
+            return False
+
+        # Validate user access and get fresh token
+        user_service = await self.drive_admin_service.create_drive_user_service(
+            user["email"]
+        )
+        if not user_service:
+            self.logger.warning(
+                "❌ Failed to create user service for user: %s", user["email"]
+            )
+            return True
+
+        # Initialize workers and take this user's drive list before another
+        # user replaces the workers
+        await self.initialize_workers(user_service)
+        drive_ids = list(self.drive_workers)
+
+        # Process each drive. A stop requested while the last drives finished
+        # leaves the user running, it is paused with the others
+        if not await self._sync_drives(org_id, user, user_service, drive_ids):
+            return False
+        if self._stop_event.is_set():
+            return False
+
+        # Update user state to COMPLETED
+        await self.arango_service.update_user_sync_state(
+            user["email"],
+            ProgressStatus.COMPLETED.value,
+            service_type=Connectors.GOOGLE_DRIVE.value,
+        )
+        return True
+
     async def sync_specific_user(self, user_email: str) -> bool:
         """Synchronize a specific user's drive content"""
         try:
@@ -1249,26 +1368,22 @@ class DriveSyncEnterpriseService(BaseDriveSyncService):
             user = await self.arango_service.get_document(
                 user_id, CollectionNames.USERS.value
             )
-            org_id = user["orgId"]
+            if not user:
+                self.logger.warning("User does not exist!")
+                return False
 
+            org_id = user.get("orgId")
             if not org_id:
                 self.logger.warning(f"No organization found for user {user_email}")
                 return False
 
-            if not user:
-                self.logger.warning("User does not exist!")
-                return False
-
             enterprise_users = await self.drive_admin_service.list_enterprise_users(org_id)
 
             # Check if user exists in enterprise users
-            is_enterprise_user = False
-            for enterprise_user in enterprise_users:
-                if enterprise_user["email"] == user_email:
-                    is_enterprise_user = True
-                    break
-
-            if not is_enterprise_user:
+            if not any(
+                enterprise_user["email"] == user_email
+                for enterprise_user in enterprise_users
+            ):
                 self.logger.warning(f"User {user_email} not found in enterprise users")
                 return False
 
@@ -1310,181 +1425,11 @@ class DriveSyncEnterpriseService(BaseDriveSyncService):
             await self.initialize_workers(user_service)
 
             # Process each drive
-            for drive_id, worker in self.drive_workers.items():
-
-                # Get drive details
-                drive_info = await user_service.get_drive_info(drive_id, org_id)
-                if not drive_info:
-                    self.logger.warning(
-                        "❌ Failed to get drive info for drive %s", drive_id
-                    )
-                    continue
-
-                drive_id = drive_info.get("drive").get("id")
-
-                if await self._should_stop(org_id):
-                    self.logger.info(
-                        "Sync stopped during drive %s processing", drive_id
-                    )
-                    await self.arango_service.update_drive_sync_state(
-                        drive_id, ProgressStatus.PAUSED.value
-                    )
-                    await self.arango_service.update_user_sync_state(
-                        user_email, ProgressStatus.PAUSED.value, service_type=Connectors.GOOGLE_DRIVE.value
-                    )
-                    return False
-
-                # Check drive state first
-                drive_state = await self.arango_service.get_drive_sync_state(drive_id)
-                if drive_state == ProgressStatus.COMPLETED.value:
-                    self.logger.info(
-                        "Drive %s is already completed, skipping", drive_id
-                    )
-                    continue
-
-                try:
-                    # Process drive data
-                    if not await self.process_drive_data(drive_info, user):
-                        self.logger.error(
-                            "❌ Failed to process drive data for drive %s", drive_id
-                        )
-                        continue
-
-                    # Update drive state to RUNNING
-                    await self.arango_service.update_drive_sync_state(
-                        drive_id, ProgressStatus.IN_PROGRESS.value
-                    )
-
-                    # Get file list
-                    files = await user_service.list_files_in_folder(drive_id)
-                    if not files:
-                        continue
-
-                    # Get shared files and add them to processing queue
-                    shared_files = await user_service.get_shared_with_me_files(user["email"])
-                    if shared_files:
-                        self.logger.info("Found %d shared files to process", len(shared_files))
-                        files.extend(shared_files)
-
-                    # Process files in batches
-                    batch_size = 50
-
-                    for i in range(0, len(files), batch_size):
-                        if await self._should_stop(org_id):
-                            self.logger.info(
-                                "Sync stopped during batch processing at index %s", i
-                            )
-                            await self.arango_service.update_drive_sync_state(
-                                drive_id, ProgressStatus.PAUSED.value
-                            )
-                            await self.arango_service.update_user_sync_state(
-                                user_email,
-                                ProgressStatus.PAUSED.value,
-                                service_type=Connectors.GOOGLE_DRIVE.value,
-                            )
-                            return False
-
-                        batch = files[i : i + batch_size]
-
-                        # Separate shared and regular files
-                        shared_batch_metadata = [
-                            f for f in batch if f.get("isSharedWithMe", False)
-                        ]
-                        regular_file_ids = [
-                            f["id"] for f in batch if not f.get("isSharedWithMe", False)
-                        ]
-
-                        # Get metadata for regular files
-                        regular_batch_metadata = []
-                        if regular_file_ids:
-                            regular_batch_metadata = await user_service.batch_fetch_metadata_and_permissions(
-                                regular_file_ids, files=[f for f in batch if not f.get("isSharedWithMe", False)]
-                            )
-
-                        # Combine metadata from both shared and regular files
-                        batch_metadata = shared_batch_metadata + regular_batch_metadata
-
-                        if not await self.process_batch(batch_metadata, org_id):
-                            continue
-
-                        # Process each file in the batch - ONLY FOR REGULAR FILES
-                        for file_id in regular_file_ids:
-                            file_metadata = next(
-                                (
-                                    meta
-                                    for meta in regular_batch_metadata
-                                    if meta["id"] == file_id
-                                ),
-                                None,
-                            )
-                            if file_metadata:
-                                file_id = file_metadata.get("id")
-
-                                file_key = await self.arango_service.get_key_by_external_file_id(
-                                    file_id
-                                )
-                                record = await self.arango_service.get_document(
-                                    file_key, CollectionNames.RECORDS.value
-                                )
-                                file = await self.arango_service.get_document(
-                                    file_key, CollectionNames.FILES.value
-                                )
-
-                                record_version = 0  # Initial version for new files
-                                extension = file.get("extension")
-                                mime_type = file.get("mimeType")
-                                user_id = user["userId"]
-
-                                endpoints = await self.config_service.get_config(
-                                    config_node_constants.ENDPOINTS.value
-                                )
-                                connector_endpoint = endpoints.get("connectors").get(
-                                    "endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value
-                                )
-
-                                index_event = {
-                                    "orgId": org_id,
-                                    "recordId": file_key,
-                                    "recordName": record.get("recordName"),
-                                    "recordVersion": record_version,
-                                    "recordType": record.get("recordType"),
-                                    "eventType": EventTypes.NEW_RECORD.value,
-                                    "signedUrlRoute": f"{connector_endpoint}/api/v1/{org_id}/{user_id}/drive/record/{file_key}/signedUrl",
-                                    "connectorName": Connectors.GOOGLE_DRIVE.value,
-                                    "origin": OriginTypes.CONNECTOR.value,
-                                    "createdAtSourceTimestamp": int(
-                                        parse_timestamp(
-                                            file_metadata.get("createdTime")
-                                        )
-                                    ),
-                                    "modifiedAtSourceTimestamp": int(
-                                        parse_timestamp(
-                                            file_metadata.get("modifiedTime")
-                                        )
-                                    ),
-                                    "extension": extension,
-                                    "mimeType": mime_type,
-                                }
-
-                                await self.kafka_service.send_event_to_kafka(
-                                    index_event
-                                )
-                                self.logger.info(
-                                    "📨 Sent Kafka Indexing event for file %s: %s",
-                                    file_id,
-                                    index_event,
-                                )
-
-                    # Update drive status after completion
-                    await self.arango_service.update_drive_sync_state(
-                        drive_id, "COMPLETED"
-                    )
-
-                except Exception as e:
-                    self.logger.error(
-                        f"❌ Failed to process drive {drive_id}: {str(e)}"
-                    )
-                    continue
+            if not await self._sync_drives(org_id, user, user_service):
+                await self.arango_service.update_user_sync_state(
+                    user_email, ProgressStatus.PAUSED.value, service_type=Connectors.GOOGLE_DRIVE.value
+                )
+                return False
 
             # Update user state to COMPLETED
             await self.arango_service.update_user_sync_state(
@@ -1521,44 +1466,7 @@ class DriveSyncEnterpriseService(BaseDriveSyncService):
             user_service = await self.drive_admin_service.create_drive_user_service(
                 user["email"]
             )
-            self.logger.info(f"Resyncing drive for user {user['email']}")
-            page_token = await self.arango_service.get_page_token_db(
-                user_email=user["email"]
-            )
-
-            if not page_token:
-                self.logger.warning(f"No page token found for user {user['email']}")
-                return True
-
-            changes, new_token = await user_service.get_changes(
-                page_token=page_token["token"]
-            )
-            user_id = user["userId"]
-
-            if changes:
-                self.logger.warning(f"Changes found for user {user['email']}")
-                for change in changes:
-                    try:
-                        await self.change_handler.process_change(
-                            change, user_service, org_id, user_id
-                        )
-                    except Exception as e:
-                        self.logger.error(f"Error processing change: {str(e)}")
-                        continue
-            else:
-                self.logger.info("ℹ️ No changes found for user %s", user["email"])
-
-            if new_token and new_token != page_token["token"]:
-                await self.arango_service.store_page_token(
-                    channel_id=page_token["channelId"],
-                    resource_id=page_token["resourceId"],
-                    user_email=user["email"],
-                    token=new_token,
-                    expiration=page_token["expiration"],
-                )
-                self.logger.info(f"🚀 Updated token for user {user['email']}")
-
-            return True
+            return await self._sync_user_changes(org_id, user, user_service)
 
         except Exception as e:
             self.logger.error(
@@ -1606,7 +1514,7 @@ class DriveSyncEnterpriseService(BaseDriveSyncService):
             )
             connector_endpoint = endpoints.get("connectors").get("endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value)
 
-            count = 0
+            reindex_events = []
 
             failed_records_with_users = list(failed_records_with_users)
             if len(failed_records_with_users) == 0:
@@ -1648,18 +1556,23 @@ class DriveSyncEnterpriseService(BaseDriveSyncService):
                             event = base_event.copy()
                             event["signedUrlRoute"] = f"{connector_endpoint}/api/v1/{org_id}/{user['userId']}/drive/record/{record['_key']}/signedUrl"
 
-                            await self.kafka_service.send_event_to_kafka(event)
-                            count += 1
-                            self.logger.debug(f"✅ Sent reindex event for record {record['_key']} with user {user['email']}")
+                            reindex_events.append(event)
+                            self.logger.debug(f"✅ Prepared reindex event for record {record['_key']} with user {user['email']}")
 
                         except Exception as e:
-                            self.logger.error(f"❌ Error sending event for user {user['email']}: {str(e)}")
+                            self.logger.error(f"❌ Error preparing event for user {user['email']}: {str(e)}")
                             continue
 
                 except Exception as e:
                     self.logger.error(f"❌ Error processing record {record['_key']}: {str(e)}")
                     continue
 
+            # Send all reindex events with a single flush
+            count = 0
+            if reindex_events and await self.kafka_service.send_events_to_kafka(
+                reindex_events
+            ):
+                count = len(reindex_events)
             self.logger.info(f"✅ Successfully sent reindex events for {count} records")
             return True
 
@@ -1835,7 +1748,7 @@ class DriveSyncIndividualService(BaseDriveSyncService):
     async def perform_initial_sync(self, org_id, action: str = "start") -> bool:
         """First phase: Build complete drive structure using batch operations"""
         try:
-            if await self._should_stop(org_id):
+            if self._stop_event.is_set():
                 self.logger.info("Sync stopped before starting")
                 return False
 
@@ -1891,7 +1804,7 @@ class DriveSyncIndividualService(BaseDriveSyncService):
                 user["email"], ProgressStatus.IN_PROGRESS.value, service_type=Connectors.GOOGLE_DRIVE.value
             )
 
-            if await self._should_stop(org_id):
+            if self._stop_event.is_set():
                 self.logger.info(
                     "Sync stopped during user %s processing", user["email"]
                 )
@@ -1906,173 +1819,9 @@ class DriveSyncIndividualService(BaseDriveSyncService):
             await self.initialize_workers(user_service)
 
             # Process each drive
-            for drive_id, worker in self.drive_workers.items():
-
-                # Get drive details
-                drive_info = await user_service.get_drive_info(drive_id, org_id)
-                if not drive_info:
-                    self.logger.warning(
-                        "❌ Failed to get drive info for drive %s", drive_id
-                    )
-                    continue
-
-                drive_id = drive_info.get("drive").get("id")
-
-                if await self._should_stop(org_id):
-                    self.logger.info(
-                        "Sync stopped during drive %s processing", drive_id
-                    )
-                    await self.arango_service.update_drive_sync_state(
-                        drive_id, ProgressStatus.PAUSED.value
-                    )
-                    return False
-
-                # Check drive state first
-                drive_state = await self.arango_service.get_drive_sync_state(drive_id)
-                if drive_state == ProgressStatus.COMPLETED.value:
-                    self.logger.info(
-                        "Drive %s is already completed, skipping", drive_id
-                    )
-                    continue
-
-                try:
-                    # Process drive data
-                    if not await self.process_drive_data(drive_info, user):
-                        self.logger.error(
-                            "❌ Failed to process drive data for drive %s", drive_id
-                        )
-                        continue
-
-                    # Update drive state to RUNNING
-                    await self.arango_service.update_drive_sync_state(
-                        drive_id, ProgressStatus.IN_PROGRESS.value
-                    )
-
-                    # Get file list
-                    files = await user_service.list_files_in_folder(drive_id)
-                    if not files:
-                        continue
-
-                    # Get shared files and add them to processing queue
-                    shared_files = await user_service.get_shared_with_me_files(user["email"])
-                    if shared_files:
-                        self.logger.info("Found %d shared files to process", len(shared_files))
-                        files.extend(shared_files)
-
-                    # Process files in batches
-                    batch_size = 50
-
-                    for i in range(0, len(files), batch_size):
-                        if await self._should_stop(org_id):
-                            self.logger.info(
-                                "Sync stopped during batch processing at index %s", i
-                            )
-                            await self.arango_service.update_drive_sync_state(
-                                drive_id, ProgressStatus.PAUSED.value
-                            )
-                            return False
-
-                        batch = files[i : i + batch_size]
-
-                        # Separate shared and regular files
-                        shared_batch_metadata = [
-                            f for f in batch if f.get("isSharedWithMe", False)
-                        ]
-                        regular_file_ids = [
-                            f["id"] for f in batch if not f.get("isSharedWithMe", False)
-                        ]
-
-                        # Get metadata for regular files
-                        regular_batch_metadata = []
-                        if regular_file_ids:
-                            regular_batch_metadata = await user_service.batch_fetch_metadata_and_permissions(
-                                regular_file_ids, files=[f for f in batch if not f.get("isSharedWithMe", False)]
-                            )
-
-                        # Combine metadata from both shared and regular files
-                        batch_metadata = shared_batch_metadata + regular_batch_metadata
-
-                        if not await self.process_batch(batch_metadata, org_id):
-                            continue
-
-                        # Process each file in the batch - ONLY FOR REGULAR FILES
-                        for file_id in regular_file_ids:
-                            file_metadata = next(
-                                (
-                                    meta
-                                    for meta in regular_batch_metadata
-                                    if meta["id"] == file_id
-                                ),
-                                None,
-                            )
-                            if file_metadata:
-                                file_id = file_metadata.get("id")
-
-                                file_key = await self.arango_service.get_key_by_external_file_id(
-                                    file_id
-                                )
-                                record = await self.arango_service.get_document(
-                                    file_key, CollectionNames.RECORDS.value
-                                )
-                                file = await self.arango_service.get_document(
-                                    file_key, CollectionNames.FILES.value
-                                )
-
-                                record_version = 0  # Initial version for new files
-                                extension = file.get("extension")
-                                mime_type = file.get("mimeType")
-                                user_id = user["userId"]
-
-                                endpoints = await self.config_service.get_config(
-                                    config_node_constants.ENDPOINTS.value
-                                )
-                                connector_endpoint = endpoints.get("connectors").get(
-                                    "endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value
-                                )
-
-                                index_event = {
-                                    "orgId": org_id,
-                                    "recordId": file_key,
-                                    "recordName": record.get("recordName"),
-                                    "recordVersion": record_version,
-                                    "recordType": record.get("recordType"),
-                                    "eventType": EventTypes.NEW_RECORD.value,
-                                    "signedUrlRoute": f"{connector_endpoint}/api/v1/{org_id}/{user_id}/drive/record/{file_key}/signedUrl",
-                                    "connectorName": Connectors.GOOGLE_DRIVE.value,
-                                    "origin": OriginTypes.CONNECTOR.value,
-                                    "createdAtSourceTimestamp": int(
-                                        parse_timestamp(
-                                            file_metadata.get("createdTime")
-                                        )
-                                    ),
-                                    "modifiedAtSourceTimestamp": int(
-                                        parse_timestamp(
-                                            file_metadata.get("modifiedTime")
-                                        )
-                                    ),
-                                    "extension": extension,
-                                    "mimeType": mime_type,
-                                }
-
-                                await self.kafka_service.send_event_to_kafka(
-                                    index_event
-                                )
-                                self.logger.info(
-                                    "📨 Sent Kafka Indexing event for file %s: %s",
-                                    file_id,
-                                    index_event,
-                                )
-
-                    # Update drive status after completion
-                    await self.arango_service.update_drive_sync_state(
-                        drive_id, "COMPLETED"
-                    )
-
-                except Exception as e:
-                    self.logger.error(
-                        f"❌ Failed to process drive {drive_id}: {str(e)}"
-                    )
-                    continue
+            if not await self._sync_drives(org_id, user, user_service):
+                await self._pause_running_syncs(org_id)
+                return False
 
             # Update user state to COMPLETED
             await self.arango_service.update_user_sync_state(
@@ -2094,44 +1843,7 @@ class DriveSyncIndividualService(BaseDriveSyncService):
     async def resync_drive(self, org_id, user):
         try:
             user_service = self.drive_user_service
-            self.logger.info(f"Resyncing drive for user {user['email']}")
-            page_token = await self.arango_service.get_page_token_db(
-                user_email=user["email"]
-            )
-
-            if not page_token:
-                self.logger.warning(f"No page token found for user {user['email']}")
-                return True
-
-            changes, new_token = await user_service.get_changes(
-                page_token=page_token["token"]
-            )
-            user_id = user["userId"]
-
-            if changes:
-                self.logger.warning(f"Changes found for user {user['email']}")
-                for change in changes:
-                    try:
-                        await self.change_handler.process_change(
-                            change, user_service, org_id, user_id
-                        )
-                    except Exception as e:
-                        self.logger.error(f"Error processing change: {str(e)}")
-                        continue
-            else:
-                self.logger.info("ℹ️ No changes found for user %s", user["email"])
-
-            if new_token and new_token != page_token["token"]:
-                await self.arango_service.store_page_token(
-                    channel_id=page_token["channelId"],
-                    resource_id=page_token["resourceId"],
-                    user_email=user["email"],
-                    token=new_token,
-                    expiration=page_token["expiration"],
-                )
-                self.logger.info(f"🚀 Updated token for user {user['email']}")
-
-            return True
+            return await self._sync_user_changes(org_id, user, user_service)
 
         except Exception as e:
             self.logger.error(
@@ -2172,7 +1884,7 @@ class DriveSyncIndividualService(BaseDriveSyncService):
 
             user_id = user[0]["userId"]
 
-            count = 0
+            reindex_events = []
             failed_records = list(failed_records)
             if len(failed_records) == 0:
                 self.logger.info("⚠️ NO FAILED RECORDS")
@@ -2205,15 +1917,19 @@ class DriveSyncIndividualService(BaseDriveSyncService):
                         "mimeType": file.get("mimeType")
                     }
 
-                    # Send event to Kafka
-                    await self.kafka_service.send_event_to_kafka(event)
-                    count += 1
-                    self.logger.debug(f"✅ Sent reindex event for record {record['_key']}")
+                    reindex_events.append(event)
+                    self.logger.debug(f"✅ Prepared reindex event for record {record['_key']}")
 
                 except Exception as e:
                     self.logger.error(f"❌ Error processing record {record['_key']}: {str(e)}")
                     continue
 
+            # Send all reindex events with a single flush
+            count = 0
+            if reindex_events and await self.kafka_service.send_events_to_kafka(
+                reindex_events
+            ):
+                count = len(reindex_events)
             self.logger.info(f"✅ Successfully sent reindex events for {count} failed records")
             return True
 
@@ -1,11 +1,12 @@
 # pylint: disable=E1101, W0718
-import asyncio
 import uuid
+from collections import deque
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 import google.oauth2.credentials
+from aiolimiter import AsyncLimiter
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import BatchHttpRequest
@@ -22,6 +23,8 @@ from app.config.utils.named_constants.arangodb_constants import (
     OriginTypes,
     RecordTypes,
 )
+from app.connectors.google.helpers.discovery import build_service
+from app.connectors.google.helpers.request_execution import execute_in_thread
 from app.connectors.google.scopes import GOOGLE_CONNECTOR_INDIVIDUAL_SCOPES
 from app.connectors.utils.decorators import exponential_backoff, token_refresh
 from app.connectors.utils.rate_limiter import GoogleAPIRateLimiter
@@ -38,6 +41,10 @@ from app.utils.time_conversion import get_epoch_timestamp_in_ms
 class DriveUserService:
     """DriveService class for interacting with Google Drive API"""
 
+    # Drive enforces a per-user quota on top of the project quota shared
+    # through the rate limiter, so each user service is also capped on its own
+    MAX_REQUESTS_PER_SECOND = 10
+
     def __init__(
         self,
         logger,
@@ -62,6 +69,7 @@ class DriveUserService:
         # Rate limiters
         self.rate_limiter = rate_limiter
         self.google_limiter = self.rate_limiter.google_limiter
+        self.user_limiter = AsyncLimiter(self.MAX_REQUESTS_PER_SECOND, 1)
         self.google_token_handler = google_token_handler
         self.token_expiry = None
         self.org_id = None
@@ -177,9 +185,7 @@ class DriveUserService:
             self.org_id = org_id
             self.user_id = user_id
 
-            self.service = build(
-                "drive", "v3", credentials=self.credentials, cache_discovery=False
-            )
+            self.service = build_service("drive", "v3", self.credentials)
             self.logger.debug("Self Drive Service: %s", self.service)
             return True
 
@@ -243,19 +249,50 @@ class DriveUserService:
 
     @exponential_backoff()
     @token_refresh
-    async def list_files_in_folder(
+    async def _list_folder_page(
+        self, folder_id: str, page_token: Optional[str] = None
+    ) -> Dict:
+        """Fetch one page of the direct children of a folder"""
+        try:
+            return await self._execute_request(
+                self.service.files().list(
+                    q=f"'{folder_id}' in parents and trashed=false",
+                    spaces="drive",
+                    fields="nextPageToken, files(id, name, mimeType, size, webViewLink, md5Checksum, sha1Checksum, sha256Checksum, headRevisionId, parents, createdTime, modifiedTime, trashed, trashedTime, fileExtension)",
+                    pageToken=page_token,
+                    pageSize=1000,
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True,
+                )
+            )
+        except HttpError as e:
+            if e.resp.status == 403:
+                raise DrivePermissionError(
+                    "Permission denied for folder: " + str(e),
+                    details={"folder_id": folder_id, "error": str(e)},
+                )
+            raise DriveOperationError(
+                "Failed to list files: " + str(e),
+                details={"folder_id": folder_id, "error": str(e)},
+            )
+
+    async def iter_files_in_folder(
         self, folder_id: str, include_subfolders: bool = True
-    ) -> List[Dict]:
-        """List all files in a folder and optionally its subfolders using BFS"""
+    ) -> AsyncIterator[List[Dict]]:
+        """Yield the files of a folder and optionally its subfolders page by page
+
+        Folders are walked breadth first and every listing page is yielded as
+        soon as it is fetched, so callers can start processing before the whole
+        tree has been listed.
+        """
         try:
             self.logger.info("🚀 Listing files in folder %s", folder_id)
-            all_files = []
-            folders_to_process = [(folder_id, "/")]
+            total_files = 0
+            folders_to_process = deque([(folder_id, "/")])
             processed_folders = set()
-            folder_paths = {folder_id: "/"}
 
             while folders_to_process:
-                current_folder, current_path = folders_to_process.pop(0)
+                current_folder, current_path = folders_to_process.popleft()
 
                 if current_folder in processed_folders:
                     continue
@@ -264,51 +301,29 @@ class DriveUserService:
                 page_token = None
 
                 while True:
-                    try:
-                        async with self.google_limiter:
-                            response = (
-                                self.service.files()
-                                .list(
-                                    q=f"'{current_folder}' in parents and trashed=false",
-                                    spaces="drive",
-                                    fields="nextPageToken, files(id, name, mimeType, size, webViewLink, md5Checksum, sha1Checksum, sha256Checksum, headRevisionId, parents, createdTime, modifiedTime, trashed, trashedTime, fileExtension)",
-                                    pageToken=page_token,
-                                    pageSize=1000,
-                                    supportsAllDrives=True,
-                                    includeItemsFromAllDrives=True,
-                                )
-                                .execute()
-                            )
-                    except HttpError as e:
-                        if e.resp.status == 403:
-                            raise DrivePermissionError(
-                                "Permission denied for folder: " + str(e),
-                                details={"folder_id": current_folder, "error": str(e)},
-                            )
-                        raise DriveOperationError(
-                            "Failed to list files: " + str(e),
-                            details={"folder_id": current_folder, "error": str(e)},
-                        )
+                    response = await self._list_folder_page(current_folder, page_token)
 
                     files = response.get("files", [])
                     for file in files:
                         file_path = f"{current_path}{file['name']}"
-                        if file["mimeType"] == MimeTypes.GOOGLE_DRIVE_FOLDER.value:
-                            folder_path = f"{file_path}/"
-                            folder_paths[file["id"]] = folder_path
-                            if include_subfolders:
-                                folders_to_process.append((file["id"], folder_path))
+                        if (
+                            include_subfolders
+                            and file["mimeType"] == MimeTypes.GOOGLE_DRIVE_FOLDER.value
+                        ):
+                            folders_to_process.append((file["id"], f"{file_path}/"))
                         file["path"] = file_path
 
-                    all_files.extend(files)
+                    if files:
+                        total_files += len(files)
+                        yield files
+
                     page_token = response.get("nextPageToken")
                     if not page_token:
                         break
 
             self.logger.info(
-                "✅ Found %s files in folder %s", len(all_files), folder_id
+                "✅ Found %s files in folder %s", total_files, folder_id
             )
-            return all_files
 
         except (DrivePermissionError, DriveOperationError):
             raise
@@ -318,6 +333,15 @@ class DriveUserService:
                 details={"folder_id": folder_id, "error": str(e)},
             )
 
+    async def list_files_in_folder(
+        self, folder_id: str, include_subfolders: bool = True
+    ) -> List[Dict]:
+        """List all files in a folder and optionally its subfolders using BFS"""
+        all_files = []
+        async for files in self.iter_files_in_folder(folder_id, include_subfolders):
+            all_files.extend(files)
+        return all_files
+
     @exponential_backoff()
     @token_refresh
     async def list_shared_drives(self) -> List[Dict]:
@@ -518,18 +542,15 @@ class DriveUserService:
 
             while next_token:
                 try:
-                    async with self.google_limiter:
-                        response = (
-                            self.service.changes()
-                            .list(
-                                pageToken=next_token,
-                                spaces="drive",
-                                includeItemsFromAllDrives=True,
-                                supportsAllDrives=True,
-                                fields="changes/*, nextPageToken, newStartPageToken",
-                            )
-                            .execute()
+                    response = await self._execute_request(
+                        self.service.changes().list(
+                            pageToken=next_token,
+                            spaces="drive",
+                            includeItemsFromAllDrives=True,
+                            supportsAllDrives=True,
+                            fields="changes/*, nextPageToken, newStartPageToken",
                         )
+                    )
                 except HttpError as e:
                     if e.resp.status == 404:  # Invalid page token
                         self.logger.error("❌ Invalid page token %s", page_token)
@@ -616,6 +637,26 @@ class DriveUserService:
                 details={"error": str(e)},
             )
 
+    async def _execute_request(self, request):
+        """Execute a Drive API request under the shared and per-user limiters
+
+        Rate limit answers (429, or 403 with a rate limit reason) raise the
+        shared adaptive backoff delay; the retries themselves are left to the
+        exponential_backoff decorator of the calling method.
+        """
+        await self.rate_limiter.wait_for_backoff()
+        async with self.google_limiter, self.user_limiter:
+            try:
+                response = await execute_in_thread(request)
+            except HttpError as e:
+                if e.resp.status == 429 or (
+                    e.resp.status == 403 and "rate limit exceeded" in str(e).lower()
+                ):
+                    self.rate_limiter.record_rate_limited()
+                raise
+        self.rate_limiter.record_success()
+        return response
+
     def create_batch_request(self) -> BatchHttpRequest:
         """Create a new batch request"""
         return self.service.new_batch_http_request()
@@ -716,8 +757,7 @@ class DriveUserService:
                 )
 
             try:
-                async with self.google_limiter:
-                    await asyncio.to_thread(basic_batch.execute)
+                await self._execute_request(basic_batch)
             except Exception as e:
                 raise DriveOperationError(
                     "Failed to execute batch request: " + str(e),
@@ -750,7 +790,7 @@ class DriveUserService:
                         else:
                             result["headRevisionId"] = ""
 
-                        self.logger.info(
+                        self.logger.debug(
                             "✅ Fetched head revision ID for file: %s", file_id
                         )
                     except HttpError as e:
@@ -803,10 +843,8 @@ class DriveUserService:
         try:
             if drive_id == "root":
                 try:
-                    response = (
-                        self.service.files()
-                        .get(fileId="root", supportsAllDrives=True)
-                        .execute()
+                    response = await self._execute_request(
+                        self.service.files().get(fileId="root", supportsAllDrives=True)
                     )
                 except HttpError as e:
                     if e.resp.status == 403:
@@ -852,12 +890,10 @@ class DriveUserService:
                 }
             else:
                 try:
-                    response = (
-                        self.service.drives()
-                        .get(
+                    response = await self._execute_request(
+                        self.service.drives().get(
                             driveId=drive_id, fields="id,name,capabilities,createdTime"
                         )
-                        .execute()
                     )
                 except HttpError as e:
                     if e.resp.status == 403:
@@ -926,18 +962,15 @@ class DriveUserService:
                 return []
 
             try:
-                async with self.google_limiter:
-                    response = (
-                        self.service.files()
-                        .list(
-                            q="sharedWithMe=true",
-                            spaces="drive",
-                            fields="files(*)",
-                            supportsAllDrives=True,
-                            includeItemsFromAllDrives=True,
-                        )
-                        .execute()
+                response = await self._execute_request(
+                    self.service.files().list(
+                        q="sharedWithMe=true",
+                        spaces="drive",
+                        fields="files(*)",
+                        supportsAllDrives=True,
+                        includeItemsFromAllDrives=True,
                     )
+                )
             except HttpError as e:
                 if e.resp.status == 403:
                     raise DrivePermissionError(
@@ -305,7 +305,7 @@ class DriveChangeHandler:
             )
             existing_permissions = existing_permissions if existing_permissions else []
 
-            self.logger.info("🚀 Existing permissions: %s", existing_permissions)
+            self.logger.debug("🚀 Existing permissions: %s", existing_permissions)
 
             # Compare basic metadata first
             latest_revision_id = updated_file.get("headRevisionId")
@@ -440,7 +440,7 @@ class DriveChangeHandler:
             existing_permissions = await self.arango_service.get_file_permissions(
                 existing_file["_key"], transaction=transaction
             )
-            self.logger.info("🚀 Existing permissions: %s", existing_permissions)
+            self.logger.debug("🚀 Existing permissions: %s", existing_permissions)
 
             # Remove permissions that no longer exist
             if existing_permissions:
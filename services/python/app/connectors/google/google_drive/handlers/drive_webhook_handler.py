@@ -276,22 +276,10 @@ class EnterpriseDriveWebhookHandler(AbstractDriveWebhookHandler):
                     page_token=page_token["token"]
                 )
 
-                user_id = await self.arango_service.get_entity_id_by_email(
+                # Get the user and its org_id from the belongsTo relation
+                user, org_id = await self.arango_service.get_user_and_org_id_by_email(
                     page_token["userEmail"]
                 )
-                # Get org_id from belongsTo relation for this user
-                query = f"""
-                FOR edge IN belongsTo
-                    FILTER edge._from == 'users/{user_id}'
-                    AND edge.entityType == 'ORGANIZATION'
-                    RETURN PARSE_IDENTIFIER(edge._to).key
-                """
-                cursor = self.arango_service.db.aql.execute(query)
-                org_id = next(cursor, None)
-
-                user = await self.arango_service.get_document(
-                    user_id, CollectionNames.USERS.value
-                )
                 user_id = user.get("userId")
 
                 if changes:
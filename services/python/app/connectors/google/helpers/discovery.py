@@ -0,0 +1,22 @@
+from functools import lru_cache
+
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+
+
+@lru_cache(maxsize=None)
+def get_discovery_document(service_name: str, version: str) -> str:
+    """Load the discovery document bundled with googleapiclient once per process"""
+    document = get_static_doc(service_name, version)
+    if document is None:
+        raise ValueError(
+            f"No bundled discovery document for {service_name} {version}"
+        )
+    return document
+
+
+def build_service(service_name: str, version: str, credentials):
+    """Build a Google API client from the memoized discovery document"""
+    return build_from_document(
+        get_discovery_document(service_name, version), credentials=credentials
+    )
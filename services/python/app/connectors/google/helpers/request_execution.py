@@ -0,0 +1,45 @@
+import asyncio
+import threading
+import weakref
+
+import google_auth_httplib2
+from googleapiclient.http import BatchHttpRequest, build_http
+
+_local = threading.local()
+
+
+def _thread_http(credentials):
+    """Return an authorized HTTP client owned by the current thread"""
+    https = getattr(_local, "https", None)
+    if https is None:
+        https = _local.https = weakref.WeakKeyDictionary()
+    http = https.get(credentials)
+    if http is None:
+        http = https[credentials] = google_auth_httplib2.AuthorizedHttp(
+            credentials, http=build_http()
+        )
+    return http
+
+
+def _credentials(request):
+    """Credentials of a request, or of the first request in a batch"""
+    if isinstance(request, BatchHttpRequest):
+        request = next(iter(request._requests.values()), None)
+    return getattr(getattr(request, "http", None), "credentials", None)
+
+
+def _execute(request):
+    credentials = _credentials(request)
+    if credentials is None:
+        return request.execute()
+    return request.execute(http=_thread_http(credentials))
+
+
+async def execute_in_thread(request):
+    """Execute a googleapiclient request or batch in a worker thread
+
+    httplib2 connections are not thread safe, so each worker thread executes
+    requests on its own authorized connection rather than on the one the
+    service was built with.
+    """
+    return await asyncio.to_thread(_execute, request)
@@ -1,10 +1,17 @@
 # src/workers/rate_limiter.py
+import asyncio
+
 from aiolimiter import AsyncLimiter
 
 
 class GoogleAPIRateLimiter:
     """Rate limiter for Google Drive API"""
 
+    # Adaptive backoff (AIMD) applied on top of the fixed rate limit
+    MIN_BACKOFF_DELAY = 0.5  # seconds, first delay after a 429
+    MAX_BACKOFF_DELAY = 30.0  # seconds
+    SUCCESSES_BEFORE_DECREASE = 10
+
     def __init__(self, max_rate: int = 6000):
         """
         Initialize rate limiter with Google's default quota
@@ -17,9 +24,39 @@ class GoogleAPIRateLimiter:
         # Converting max_rate to per-second rate
         self.google_limiter = AsyncLimiter(max_rate / 100, 1)  # requests per second
 
+        # Delay shared by every consumer of this limiter. It doubles whenever
+        # Google answers 429 and halves after a run of successful calls, so a
+        # quota burst seen by one service slows down all concurrent callers.
+        self.current_delay = 0.0
+        self._consecutive_successes = 0
+
     async def __aenter__(self):
         await self.google_limiter.acquire()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         pass
+
+    async def wait_for_backoff(self):
+        """Sleep for the current adaptive backoff delay, if any"""
+        if self.current_delay:
+            await asyncio.sleep(self.current_delay)
+
+    def record_success(self):
+        """Decrease the backoff delay after enough consecutive successes"""
+        if not self.current_delay:
+            return
+        self._consecutive_successes += 1
+        if self._consecutive_successes >= self.SUCCESSES_BEFORE_DECREASE:
+            self._consecutive_successes = 0
+            self.current_delay /= 2
+            if self.current_delay < self.MIN_BACKOFF_DELAY:
+                self.current_delay = 0.0
+
+    def record_rate_limited(self):
+        """Increase the backoff delay after a 429 response"""
+        self._consecutive_successes = 0
+        self.current_delay = min(
+            max(self.current_delay * 2, self.MIN_BACKOFF_DELAY),
+            self.MAX_BACKOFF_DELAY,
+        )
@@ -1,7 +1,9 @@
 import asyncio
 import hashlib
 import json
+from collections import OrderedDict
 from io import BytesIO
+from typing import Optional, Tuple
 from uuid import uuid4
 
 import aiohttp
@@ -18,11 +20,85 @@ from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
 
 class EventProcessor:
+    # extension -> (processor method, binary keyword, optional wrapper)
+    EXTENSION_HANDLERS = {
+        ExtensionTypes.PDF.value: ("process_pdf_document", "pdf_binary", None),
+        ExtensionTypes.DOCX.value: ("process_docx_document", "docx_binary", BytesIO),
+        ExtensionTypes.DOC.value: ("process_doc_document", "doc_binary", None),
+        ExtensionTypes.XLSX.value: ("process_excel_document", "excel_binary", None),
+        ExtensionTypes.XLS.value: ("process_xls_document", "xls_binary", None),
+        ExtensionTypes.CSV.value: ("process_csv_document", "csv_binary", None),
+        ExtensionTypes.HTML.value: ("process_html_document", "html_content", None),
+        ExtensionTypes.PPTX.value: ("process_pptx_document", "pptx_binary", None),
+        ExtensionTypes.PPT.value: ("process_ppt_document", "ppt_binary", None),
+        ExtensionTypes.MD.value: ("process_md_document", "md_binary", None),
+        ExtensionTypes.MDX.value: ("process_mdx_document", "mdx_content", None),
+        ExtensionTypes.TXT.value: ("process_txt_document", "txt_binary", None),
+    }
+
+    # Google Workspace mime type -> (processor method, label for logs)
+    GOOGLE_MIME_HANDLERS = {
+        MimeTypes.GOOGLE_SLIDES.value: ("process_google_slides", "Google Slides"),
+        MimeTypes.GOOGLE_DOCS.value: ("process_google_docs", "Google Docs"),
+        MimeTypes.GOOGLE_SHEETS.value: ("process_google_sheets", "Google Sheets"),
+    }
+
+    # Recent downloads kept in memory so a replayed event for the same
+    # record revision skips the network
+    DOWNLOAD_CACHE_MAX_BYTES = 256 * 1024 * 1024
+    DOWNLOAD_CACHE_MAX_FILE_BYTES = 32 * 1024 * 1024
+
     def __init__(self, logger, processor, arango_service):
         self.logger = logger
         self.logger.info("🚀 Initializing EventProcessor")
         self.processor = processor
         self.arango_service = arango_service
+        # Shared by every download so connections to the storage service are
+        # kept alive between events; created on first use inside the loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._downloads: "OrderedDict[Tuple, bytes]" = OrderedDict()
+        self._downloads_size = 0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session used for signed URL downloads"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=200,
+                    limit_per_host=50,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                )
+            )
+        return self._session
+
+    def _get_cached_download(self, key: Optional[Tuple]) -> Optional[bytes]:
+        """Return the cached content of a record revision, if any"""
+        if key is None:
+            return None
+        content = self._downloads.get(key)
+        if content is not None:
+            self._downloads.move_to_end(key)
+        return content
+
+    def _cache_download(self, key: Optional[Tuple], content: bytes) -> None:
+        """Cache downloaded content, evicting the oldest entries over the limit"""
+        if key is None or len(content) > self.DOWNLOAD_CACHE_MAX_FILE_BYTES:
+            return
+        previous = self._downloads.pop(key, None)
+        if previous is not None:
+            self._downloads_size -= len(previous)
+        self._downloads[key] = content
+        self._downloads_size += len(content)
+        while self._downloads_size > self.DOWNLOAD_CACHE_MAX_BYTES:
+            _, evicted = self._downloads.popitem(last=False)
+            self._downloads_size -= len(evicted)
+
+    async def close(self) -> None:
+        """Close the HTTP session used for signed URL downloads"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def _download_from_signed_url(
         self, signed_url: str, record_id: str, doc: dict
@@ -52,51 +128,60 @@ class EventProcessor:
             delay = base_delay * (2**attempt)  # Exponential backoff
             file_buffer = BytesIO()
             try:
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    try:
-                        async with session.get(signed_url) as response:
-                            if response.status != 200:
-                                raise aiohttp.ClientError(
-                                    f"Failed to download file: {response.status}"
-                                )
-
-                            content_length = response.headers.get("Content-Length")
-                            if content_length:
-                                self.logger.info(
-                                    f"Expected file size: {int(content_length) / (1024*1024):.2f} MB"
-                                )
-
-                            last_logged_size = 0
-                            total_size = 0
-                            log_interval = chunk_size
-
-                            self.logger.info("Starting chunked download...")
-                            try:
-                                async for chunk in response.content.iter_chunked(
-                                    chunk_size
-                                ):
-                                    file_buffer.write(chunk)
-                                    total_size += len(chunk)
-                                    if total_size - last_logged_size >= log_interval:
-                                        self.logger.debug(
-                                            f"Total size so far: {total_size / (1024*1024):.2f} MB"
-                                        )
-                                        last_logged_size = total_size
-                            except IOError as io_err:
-                                raise aiohttp.ClientError(
-                                    f"IO error during chunk download: {str(io_err)}"
-                                )
+                session = self._get_session()
+                try:
+                    async with session.get(signed_url, timeout=timeout) as response:
+                        if response.status != 200:
+                            raise aiohttp.ClientError(
+                                f"Failed to download file: {response.status}"
+                            )
 
-                            file_content = file_buffer.getvalue()
+                        content_length = response.headers.get("Content-Length")
+                        if content_length:
                             self.logger.info(
-                                f"✅ Download complete. Total size: {total_size / (1024*1024):.2f} MB"
+                                f"Expected file size: {int(content_length) / (1024*1024):.2f} MB"
                             )
-                            return file_content
+                            # Size the buffer once up front so it is not
+                            # reallocated and copied as the chunks arrive
+                            if int(content_length) > 0:
+                                file_buffer.seek(int(content_length) - 1)
+                                file_buffer.write(b"\0")
+                                file_buffer.seek(0)
+
+                        last_logged_size = 0
+                        total_size = 0
+                        log_interval = chunk_size
+
+                        self.logger.info("Starting chunked download...")
+                        try:
+                            async for chunk in response.content.iter_chunked(
+                                chunk_size
+                            ):
+                                file_buffer.write(chunk)
+                                total_size += len(chunk)
+                                if total_size - last_logged_size >= log_interval:
+                                    self.logger.debug(
+                                        "Total size so far: %.2f MB",
+                                        total_size / (1024 * 1024),
+                                    )
+                                    last_logged_size = total_size
+                        except IOError as io_err:
+                            raise aiohttp.ClientError(
+                                f"IO error during chunk download: {str(io_err)}"
+                            )
+
+                        # Drop any preallocated tail the body did not fill
+                        file_buffer.truncate(total_size)
+                        file_content = file_buffer.getvalue()
+                        self.logger.info(
+                            f"✅ Download complete. Total size: {total_size / (1024*1024):.2f} MB"
+                        )
+                        return file_content
 
-                    except aiohttp.ServerDisconnectedError as sde:
-                        raise aiohttp.ClientError(f"Server disconnected: {str(sde)}")
-                    except aiohttp.ClientConnectorError as cce:
-                        raise aiohttp.ClientError(f"Connection error: {str(cce)}")
+                except aiohttp.ServerDisconnectedError as sde:
+                    raise aiohttp.ClientError(f"Server disconnected: {str(sde)}")
+                except aiohttp.ClientConnectorError as cce:
+                    raise aiohttp.ClientError(f"Connection error: {str(cce)}")
 
             except (aiohttp.ClientError, asyncio.TimeoutError, IOError) as e:
                 error_type = type(e).__name__
@@ -208,13 +293,28 @@ class EventProcessor:
 
             if signed_url:
                 self.logger.debug("Signed URL received")
-                file_content = await self._download_from_signed_url(
-                    signed_url, record_id, doc
+                # Versions are not bumped on every change, so the source
+                # modification time identifies the revision
+                modified_at = event_data.get("modifiedAtSourceTimestamp")
+                cache_key = (
+                    (record_id, record_version, modified_at)
+                    if modified_at is not None
+                    else None
                 )
+                file_content = self._get_cached_download(cache_key)
+                if file_content is not None:
+                    self.logger.info(
+                        "♻️ Using cached download for record %s", record_id
+                    )
+                else:
+                    file_content = await self._download_from_signed_url(
+                        signed_url, record_id, doc
+                    )
+                    self._cache_download(cache_key, file_content)
             else:
                 file_content = event_data.get("buffer")
 
-            self.logger.debug(f"file_content type: {type(file_content)}")
+            self.logger.debug("file_content type: %s", type(file_content))
 
             record_type = doc.get("recordType")
             if record_type == RecordTypes.FILE.value:
@@ -287,186 +387,39 @@ class EventProcessor:
                     self.logger.error(f"❌ Error in file processing: {repr(e)}")
                     raise
 
-            if mime_type == MimeTypes.GOOGLE_SLIDES.value:
-                self.logger.info("🚀 Processing Google Slides")
-                # Decode JSON content if it's streamed data
-                if isinstance(file_content, bytes):
-                    try:
-                        file_content = json.loads(file_content.decode("utf-8"))
-                    except json.JSONDecodeError as e:
-                        self.logger.error(
-                            f"Failed to decode Google Slides content: {str(e)}"
-                        )
-                        raise
-                result = await self.processor.process_google_slides(
-                    record_id, record_version, org_id, file_content, virtual_record_id
-                )
-                return result
-
-            if mime_type == MimeTypes.GOOGLE_DOCS.value:
-                self.logger.info("🚀 Processing Google Docs")
-                # Decode JSON content if it's streamed data
-                if isinstance(file_content, bytes):
-                    try:
-                        file_content = json.loads(file_content.decode("utf-8"))
-                    except json.JSONDecodeError as e:
-                        self.logger.error(
-                            f"Failed to decode Google Docs content: {str(e)}"
-                        )
-                        raise
-                result = await self.processor.process_google_docs(
-                    record_id, record_version, org_id, file_content, virtual_record_id
-                )
-                return result
-
-            if mime_type == MimeTypes.GOOGLE_SHEETS.value:
-                self.logger.info("🚀 Processing Google Sheets")
+            google_handler = self.GOOGLE_MIME_HANDLERS.get(mime_type)
+            if google_handler is not None:
+                method_name, label = google_handler
+                self.logger.info("🚀 Processing %s", label)
                 # Decode JSON content if it's streamed data
                 if isinstance(file_content, bytes):
                     try:
                         file_content = json.loads(file_content.decode("utf-8"))
                     except json.JSONDecodeError as e:
                         self.logger.error(
-                            f"Failed to decode Google Sheets content: {str(e)}"
+                            f"Failed to decode {label} content: {str(e)}"
                         )
                         raise
-                result = await self.processor.process_google_sheets(
+                result = await getattr(self.processor, method_name)(
                     record_id, record_version, org_id, file_content, virtual_record_id
                 )
                 return result
 
-            if extension == ExtensionTypes.PDF.value:
-                result = await self.processor.process_pdf_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    pdf_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.DOCX.value:
-                result = await self.processor.process_docx_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    docx_binary=BytesIO(file_content),
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.DOC.value:
-                result = await self.processor.process_doc_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    doc_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-            elif extension == ExtensionTypes.XLSX.value:
-                result = await self.processor.process_excel_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    excel_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-            elif extension == ExtensionTypes.XLS.value:
-                result = await self.processor.process_xls_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    xls_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-            elif extension == ExtensionTypes.CSV.value:
-                result = await self.processor.process_csv_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    csv_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.HTML.value:
-                result = await self.processor.process_html_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    html_content=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.PPTX.value:
-                result = await self.processor.process_pptx_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    pptx_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.PPT.value:
-                result = await self.processor.process_ppt_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    ppt_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.MD.value:
-                result = await self.processor.process_md_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    md_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.MDX.value:
-                result = await self.processor.process_mdx_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    mdx_content=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.TXT.value:
-                result = await self.processor.process_txt_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    txt_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            else:
+            handler = self.EXTENSION_HANDLERS.get(extension)
+            if handler is None:
                 raise Exception(f"Unsupported file extension: {extension}")
 
+            method_name, binary_arg, wrap = handler
+            result = await getattr(self.processor, method_name)(
+                recordName=f"Record-{record_id}",
+                recordId=record_id,
+                version=record_version,
+                source=connector,
+                orgId=org_id,
+                virtual_record_id=virtual_record_id,
+                **{binary_arg: wrap(file_content) if wrap else file_content},
+            )
+
             self.logger.info(
                 f"✅ Successfully processed document for record {record_id}"
             )
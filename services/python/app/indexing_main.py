@@ -48,6 +48,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await consume_task
     except asyncio.CancelledError:
         logger.info("Kafka consumer task cancelled")
+    event_processor = await container.event_processor()
+    await event_processor.close()
 
 
 app = FastAPI(
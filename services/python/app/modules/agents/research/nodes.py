@@ -7,7 +7,7 @@ from app.config.utils.named_constants.arangodb_constants import (
     CollectionNames,
 )
 from app.modules.agents.research.chat_state import ChatState
-from app.modules.qna.prompt_templates import qna_prompt
+from app.modules.qna.prompt_templates import render_qna_prompt
 from app.modules.reranker.reranker import RerankerService
 from app.modules.retrieval.retrieval_arango import ArangoService
 from app.modules.retrieval.retrieval_service import RetrievalService
@@ -232,13 +232,8 @@ def prepare_prompt_node(
                     "Please provide accurate and relevant information based on the available context."
                 )
 
-        from jinja2 import Template
-        template = Template(qna_prompt)
-        rendered_prompt = template.render(
-            user_data=user_data,
-            query=state["query"],
-            rephrased_queries=[],  # This keeps all query results for reference
-            chunks=state["final_results"],
+        rendered_prompt = render_qna_prompt(
+            user_data, state["query"], state["final_results"]
         )
 
         # Add conversation history to the messages
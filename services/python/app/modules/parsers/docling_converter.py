@@ -0,0 +1,13 @@
+from functools import lru_cache
+
+from docling.document_converter import DocumentConverter
+
+
+@lru_cache(maxsize=None)
+def get_document_converter() -> DocumentConverter:
+    """Return the Docling converter shared by all parsers
+
+    The converter initializes a pipeline per input format on first use and
+    keeps it, so sharing one instance loads each pipeline only once.
+    """
+    return DocumentConverter()
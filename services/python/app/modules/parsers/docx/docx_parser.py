@@ -1,5 +1,6 @@
 from docling.datamodel.base_models import DocumentStream
-from docling.document_converter import DocumentConverter
+
+from app.modules.parsers.docling_converter import get_document_converter
 
 
 class DocxParser:
@@ -11,7 +12,7 @@ class DocxParser:
         # Create a DocumentStream directly from the bytes
         source = DocumentStream(name="content.docx", stream=file_binary)
 
-        converter = DocumentConverter()
+        converter = get_document_converter()
         doc = converter.convert(source)
 
         return doc.document
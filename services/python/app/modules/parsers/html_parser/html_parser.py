@@ -1,12 +1,13 @@
 from io import BytesIO
 
 from docling.datamodel.base_models import DocumentStream
-from docling.document_converter import DocumentConverter
+
+from app.modules.parsers.docling_converter import get_document_converter
 
 
 class HTMLParser:
     def __init__(self):
-        self.converter = DocumentConverter()
+        self.converter = get_document_converter()
 
     def parse_string(self, html_content: str):
         """
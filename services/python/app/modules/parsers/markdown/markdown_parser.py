@@ -2,12 +2,13 @@ from io import BytesIO
 
 import markdown
 from docling.datamodel.base_models import DocumentStream
-from docling.document_converter import DocumentConverter
+
+from app.modules.parsers.docling_converter import get_document_converter
 
 
 class MarkdownParser:
     def __init__(self):
-        self.converter = DocumentConverter()
+        self.converter = get_document_converter()
 
     def parse_string(self, md_content: str):
         """
@@ -22,13 +23,10 @@ class MarkdownParser:
         Raises:
             ValueError: If parsing fails
         """
-        # Convert string to bytes
-
         html = markdown.markdown(md_content, extensions=["md_in_html"])
-        md_bytes = html.encode("utf-8")
 
-        # Create a BytesIO object from the bytes
-        stream = BytesIO(md_bytes)
+        # Wrap the encoded bytes directly; BytesIO shares an immutable buffer
+        stream = BytesIO(html.encode("utf-8"))
 
         # Create a DocumentStream
         source = DocumentStream(name="content.md", stream=stream)
@@ -1,3 +1,5 @@
+from jinja2 import Template
+
 qna_prompt = """
     You are an expert AI assistant within an enterprise who can answer any question person in the company has based on companies Knowledge sources and user information.
     Records could be from multiple connector apps like a Slack message record, Mail record, Google Drive File record, etc
@@ -74,3 +76,16 @@ qna_prompt = """
         "Your entire response/output is going to consist of a single JSON, and you will NOT wrap it within JSON md markers"
 
         """
+
+# Compiled once; Template(source) re-parses the source on every construction
+qna_template = Template(qna_prompt)
+
+
+def render_qna_prompt(user_data: str, query: str, chunks: list) -> str:
+    """Render the QnA prompt for a query and its retrieved chunks"""
+    return qna_template.render(
+        user_data=user_data,
+        query=query,
+        rephrased_queries=[],  # This keeps all query results for reference
+        chunks=chunks,
+    )
@@ -205,7 +205,7 @@ class RetrievalService:
                       model=config['configuration']['model'],
                       api_key=config['configuration']['apiKey'],
                     )
-                    print("cohere embedding model config created")
+                    self.logger.debug("cohere embedding model config created")
             try:
                 if not embedding_model:
                     self.logger.info(
@@ -31,13 +31,25 @@ async def initialize_container(container: AppContainer) -> bool:
         logger.info("Connecting to ArangoDB")
         arango_service = await container.arango_service()
         if arango_service:
-            arango_connected = await arango_service.connect()
-            if not arango_connected:
+            # The resource factory already connected, only retry if it failed
+            if arango_service.db is None and not await arango_service.connect():
                 raise Exception("Failed to connect to ArangoDB")
             logger.info("✅ Connected to ArangoDB")
         else:
             raise Exception("Failed to connect to ArangoDB")
 
+        # Create the retrieval service (and its Qdrant config) now rather than
+        # on the first query
+        logger.info("Initializing retrieval service")
+        await container.retrieval_service()
+        logger.info("✅ Retrieval service initialized")
+
+        # Load and warm up the reranker model before serving queries,
+        # off the event loop since loading blocks
+        logger.info("Loading reranker model")
+        await asyncio.to_thread(container.reranker_service)
+        logger.info("✅ Reranker model loaded")
+
         # Initialize Kafka consumer
         logger.info("Initializing llm config handler")
         llm_config_handler = await container.llm_config_handler()
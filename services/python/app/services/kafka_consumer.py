@@ -1,10 +1,11 @@
 import asyncio
-import json
+from collections import deque
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Set
+from typing import Deque, Dict, List, Set, Tuple
 
 import aiohttp
-from confluent_kafka import Consumer, KafkaError
+import orjson
+from confluent_kafka import Consumer, KafkaError, TopicPartition
 from jose import jwt
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -25,6 +26,7 @@ from app.exceptions.indexing_exceptions import IndexingError
 # Concurrency control settings
 MAX_CONCURRENT_TASKS = 5  # Maximum number of messages to process concurrently
 RATE_LIMIT_PER_SECOND = 2  # Maximum number of new tasks to start per second
+MAX_QUEUED_MESSAGES = 10  # Messages waiting for a free worker before polling blocks
 
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=15))
@@ -70,9 +72,18 @@ class KafkaConsumerManager:
         self.running = False
         self.event_processor = event_processor
         self.config_service = config_service
-        # Concurrency control
-        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_TASKS)
-        self.active_tasks: Set[asyncio.Task] = set()
+        # Concurrency control: a fixed pool of workers takes messages from a
+        # bounded queue, so polling stops while every worker is busy
+        self.message_queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUED_MESSAGES)
+        self.workers: List[asyncio.Task] = []
+        # Messages fetched and not yet processed; a poll only fetches as many
+        # as the workers and the queue can take
+        self.pending_count = 0
+        self.capacity_freed = asyncio.Event()
+        # Offsets are committed once processed, in fetch order per partition:
+        # fetched offsets not yet committed, and the processed ones among them
+        self.uncommitted_offsets: Dict[Tuple[str, int], Deque[int]] = {}
+        self.done_offsets: Dict[Tuple[str, int], Set[int]] = {}
         self.rate_limiter = RateLimiter(RATE_LIMIT_PER_SECOND)
 
         # Message tracking
@@ -95,7 +106,8 @@ class KafkaConsumerManager:
                     "bootstrap.servers": ",".join(brokers),
                     "group.id": "record_consumer_group",
                     "auto.offset.reset": "earliest",
-                    "enable.auto.commit": True,
+                    # Offsets are committed after their message is processed
+                    "enable.auto.commit": False,
                     "isolation.level": "read_committed",
                     "enable.partition.eof": False,
                     "max.poll.interval.ms": 900000,
@@ -117,7 +129,7 @@ class KafkaConsumerManager:
             raise
 
     async def process_message_wrapper(self, message):
-        """Wrapper to handle async task cleanup and semaphore release"""
+        """Wrapper to log the outcome of processing a message"""
         # Extract message identifiers for logging
         topic = message.topic()
         partition = message.partition()
@@ -134,9 +146,6 @@ class KafkaConsumerManager:
         except Exception as e:
             self.logger.error(f"Error in process_message_wrapper for {message_id}: {e}")
             return False
-        finally:
-            # Release the semaphore to allow a new task to start
-            self.semaphore.release()
 
     async def _process_message(self, message):
         start_time = datetime.now()
@@ -154,20 +163,17 @@ class KafkaConsumerManager:
                 self.logger.info(f"Message {message_id} already processed, skipping")
                 return True
 
-            # Message parsing
+            # Message parsing; orjson reads the raw bytes without decoding
+            # them to a str first
             try:
                 message_value = message.value()
-                if isinstance(message_value, bytes):
-                    message_value = message_value.decode("utf-8")
-                    self.logger.debug(f"Decoded message {message_id} from bytes")
-
-                data = json.loads(message_value)
+                data = orjson.loads(message_value)
                 if isinstance(data, str):
-                    data = json.loads(data)
+                    data = orjson.loads(data)
                     self.logger.debug(
-                        f"Handled double-encoded JSON for message {message_id}"
+                        "Handled double-encoded JSON for message %s", message_id
                     )
-            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            except orjson.JSONDecodeError as e:
                 self.logger.error(
                     f"Failed to parse message {message_id}: {str(e)}\n"
                     f"Raw value: {message_value[:1000]}..."
@@ -371,34 +377,63 @@ class KafkaConsumerManager:
             self.processed_messages[topic_partition] = []
         self.processed_messages[topic_partition].append(offset)
 
-    def cleanup_completed_tasks(self):
-        """Remove completed tasks from the active tasks set"""
-        done_tasks = {task for task in self.active_tasks if task.done()}
-        self.active_tasks -= done_tasks
+    def _track_offset(self, message):
+        """Remember a fetched message until its offset can be committed"""
+        partition = (message.topic(), message.partition())
+        self.uncommitted_offsets.setdefault(partition, deque()).append(
+            message.offset()
+        )
+
+    def _commit_processed(self, message):
+        """Commit the offsets processed so far in the message's partition
+
+        Workers finish out of order; the committed offset only moves past
+        messages whose earlier messages in the partition are processed too.
+        """
+        partition = (message.topic(), message.partition())
+        uncommitted = self.uncommitted_offsets.get(partition)
+        if not uncommitted:
+            return
+        done = self.done_offsets.setdefault(partition, set())
+        done.add(message.offset())
+
+        last_offset = None
+        while uncommitted and uncommitted[0] in done:
+            last_offset = uncommitted.popleft()
+            done.discard(last_offset)
+        if last_offset is None:
+            return
+
+        try:
+            self.consumer.commit(
+                offsets=[TopicPartition(partition[0], partition[1], last_offset + 1)],
+                asynchronous=True,
+            )
+        except Exception as e:
+            # A later commit of the partition covers this offset
+            self.logger.warning(f"Failed to commit offset {last_offset}: {e}")
 
-        # Check for exceptions in completed tasks
-        for task in done_tasks:
-            if task.exception():
-                self.logger.error(f"Task completed with exception: {task.exception()}")
+    async def _worker(self):
+        """Process queued messages one at a time until cancelled"""
+        while True:
+            message = await self.message_queue.get()
+            try:
+                await self.process_message_wrapper(message)
+            finally:
+                self.message_queue.task_done()
+                self._commit_processed(message)
+                self.pending_count -= 1
+                self.capacity_freed.set()
 
     async def start_processing_task(self, message):
-        """Start a new task for processing a message with semaphore control"""
+        """Queue a message for the workers, waiting while the queue is full"""
         # Wait for the rate limiter
         await self.rate_limiter.wait()
 
-        # Wait for a semaphore slot to become available
-        await self.semaphore.acquire()
-
-        # Create and start a new task
-        task = asyncio.create_task(self.process_message_wrapper(message))
-        self.active_tasks.add(task)
+        await self.message_queue.put(message)
 
-        # Clean up completed tasks
-        self.cleanup_completed_tasks()
-
-        # Log current task count
         self.logger.debug(
-            f"Active tasks: {len(self.active_tasks)}/{MAX_CONCURRENT_TASKS}"
+            "Queued messages: %d/%d", self.message_queue.qsize(), MAX_QUEUED_MESSAGES
         )
 
     async def consume_messages(self):
@@ -407,41 +442,60 @@ class KafkaConsumerManager:
         processed_count = 0
         error_count = 0
 
+        self.workers = [
+            asyncio.create_task(self._worker()) for _ in range(MAX_CONCURRENT_TASKS)
+        ]
+
         try:
             self.logger.info("Starting Kafka consumer loop")
             while self.running:
                 try:
-                    message = self.consumer.poll(0.1)
+                    # Fetch no more than the workers and the queue can take,
+                    # so nothing sits fetched but unprocessed beyond that
+                    free_capacity = (
+                        MAX_CONCURRENT_TASKS + MAX_QUEUED_MESSAGES - self.pending_count
+                    )
+                    if free_capacity <= 0:
+                        self.capacity_freed.clear()
+                        await self.capacity_freed.wait()
+                        continue
+
+                    messages = self.consumer.consume(
+                        num_messages=free_capacity, timeout=0.1
+                    )
 
-                    if message is None:
+                    if not messages:
                         await asyncio.sleep(0.1)
                         continue
 
-                    if message.error():
-                        if message.error().code() == KafkaError._PARTITION_EOF:
-                            self.logger.debug("Reached end of partition")
-                            continue
-                        else:
-                            error_count += 1
-                            self.logger.error(
-                                f"Kafka error: {message.error()}, "
-                                f"Code: {message.error().code()}"
+                    for message in messages:
+                        if message.error():
+                            if message.error().code() == KafkaError._PARTITION_EOF:
+                                self.logger.debug("Reached end of partition")
+                                continue
+                            else:
+                                error_count += 1
+                                self.logger.error(
+                                    f"Kafka error: {message.error()}, "
+                                    f"Code: {message.error().code()}"
+                                )
+                                continue
+
+                        self.pending_count += 1
+                        self._track_offset(message)
+                        await self.start_processing_task(message)
+                        processed_count += 1
+
+                        # Log statistics periodically
+                        if processed_count % 100 == 0:
+                            runtime = (datetime.now() - start_time).total_seconds()
+                            self.logger.info(
+                                f"Processing statistics: "
+                                f"Messages: {processed_count}, "
+                                f"Errors: {error_count}, "
+                                f"Runtime: {runtime:.2f}s, "
+                                f"Rate: {processed_count/runtime:.2f} msg/s"
                             )
-                            continue
-
-                    await self.start_processing_task(message)
-                    processed_count += 1
-
-                    # Log statistics periodically
-                    if processed_count % 100 == 0:
-                        runtime = (datetime.now() - start_time).total_seconds()
-                        self.logger.info(
-                            f"Processing statistics: "
-                            f"Messages: {processed_count}, "
-                            f"Errors: {error_count}, "
-                            f"Runtime: {runtime:.2f}s, "
-                            f"Rate: {processed_count/runtime:.2f} msg/s"
-                        )
 
                 except asyncio.CancelledError:
                     self.logger.info("Kafka consumer task cancelled")
@@ -467,11 +521,16 @@ class KafkaConsumerManager:
                 f"Average rate: {processed_count/runtime:.2f} msg/s"
             )
 
-            if self.active_tasks:
+            if self.message_queue.qsize():
                 self.logger.info(
-                    f"Waiting for {len(self.active_tasks)} active tasks to complete..."
+                    f"Waiting for {self.message_queue.qsize()} queued messages to complete..."
                 )
-                await asyncio.gather(*self.active_tasks, return_exceptions=True)
+            # Let the workers finish queued and in-flight messages, then stop them
+            await self.message_queue.join()
+            for worker in self.workers:
+                worker.cancel()
+            await asyncio.gather(*self.workers, return_exceptions=True)
+            self.workers = []
 
             if self.consumer:
                 self.consumer.close()
@@ -5,7 +5,9 @@ src/api/setup.py
 import os
 
 import aiohttp
+import orjson
 from arango import ArangoClient
+from arango.http import DefaultHTTPClient
 from confluent_kafka import Consumer, KafkaError
 from dependency_injector import containers, providers
 from qdrant_client import QdrantClient
@@ -440,7 +442,17 @@ class AppContainer(containers.DeclarativeContainer):
             config_node_constants.ARANGODB.value
         )
         hosts = arangodb_config["url"]
-        return ArangoClient(hosts=hosts)
+        return ArangoClient(
+            hosts=hosts,
+            # Sync services run Arango queries from worker threads for several
+            # users at once, so keep more pooled keep-alive connections than
+            # the default of 10 rather than opening and discarding extra ones
+            http_client=DefaultHTTPClient(pool_connections=10, pool_maxsize=50),
+            # Sync batches send large documents and bind variables, so encode
+            # and decode them with orjson instead of the standard json module
+            serializer=lambda data: orjson.dumps(data).decode(),
+            deserializer=orjson.loads,
+        )
 
     async def _create_redis_client(config_service):
         """Async method to initialize RedisClient."""
@@ -712,6 +724,15 @@ async def health_check(container):
         await health_check_etcd(container)
         logger.info("✅ etcd health check completed")
 
+        # Fetch the configs of the remaining checks concurrently, the checks
+        # then read them from the config cache
+        await container.config_service().get_configs(
+            config_node_constants.ARANGODB.value,
+            config_node_constants.KAFKA.value,
+            config_node_constants.REDIS.value,
+            config_node_constants.QDRANT.value,
+        )
+
         await health_check_arango(container)
         logger.info("✅ ArangoDB health check completed")
 
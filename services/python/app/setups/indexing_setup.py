@@ -5,6 +5,7 @@ app/setup.py
 import os
 
 import aiohttp
+import orjson
 from arango import ArangoClient
 from confluent_kafka import Consumer, KafkaError
 from dependency_injector import containers, providers
@@ -65,7 +66,13 @@ class AppContainer(containers.DeclarativeContainer):
     async def _create_arango_client(config_service):
         """Async factory method to initialize ArangoClient."""
         hosts = await AppContainer._fetch_arango_host(config_service)
-        return ArangoClient(hosts=hosts)
+        # Encode and decode request and response bodies with orjson instead of
+        # the standard json module
+        return ArangoClient(
+            hosts=hosts,
+            serializer=lambda data: orjson.dumps(data).decode(),
+            deserializer=orjson.loads,
+        )
 
     arango_client = providers.Resource(
         _create_arango_client, config_service=config_service
@@ -423,6 +430,15 @@ async def health_check(container):
         await health_check_etcd(container)
         logger.info("✅ etcd health check completed")
 
+        # Fetch the configs of the remaining checks concurrently, the checks
+        # then read them from the config cache
+        await container.config_service().get_configs(
+            config_node_constants.ARANGODB.value,
+            config_node_constants.KAFKA.value,
+            config_node_constants.REDIS.value,
+            config_node_constants.QDRANT.value,
+        )
+
         await health_check_arango(container)
         logger.info("✅ ArangoDB health check completed")
 
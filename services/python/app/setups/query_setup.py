@@ -1,3 +1,4 @@
+import orjson
 from arango import ArangoClient
 from dependency_injector import containers, providers
 
@@ -31,7 +32,13 @@ class AppContainer(containers.DeclarativeContainer):
     async def _create_arango_client(config_service):
         """Async factory method to initialize ArangoClient."""
         hosts = await AppContainer._fetch_arango_host(config_service)
-        return ArangoClient(hosts=hosts)
+        # Encode and decode request and response bodies with orjson instead of
+        # the standard json module
+        return ArangoClient(
+            hosts=hosts,
+            serializer=lambda data: orjson.dumps(data).decode(),
+            deserializer=orjson.loads,
+        )
 
     arango_client = providers.Resource(
         _create_arango_client, config_service=config_service
@@ -0,0 +1,40 @@
+import logging
+import unittest
+from unittest.mock import MagicMock
+
+from app.connectors.google.core.arango_service import ArangoService
+
+
+def make_arango_service(query_results):
+    """ArangoService with a mocked database, skipping the client setup"""
+    service = ArangoService.__new__(ArangoService)
+    service.logger = logging.getLogger(__name__)
+    service._sync_states = {}
+    service.db = MagicMock()
+    service.db.aql.execute.side_effect = lambda *args, **kwargs: iter(query_results)
+    return service
+
+
+class TestSyncStateCache(unittest.IsolatedAsyncioTestCase):
+    async def test_drive_state_is_cached_as_string(self):
+        service = make_arango_service(["COMPLETED"])
+
+        self.assertEqual(await service.get_drive_sync_state("drive-1"), "COMPLETED")
+        self.assertEqual(await service.get_drive_sync_state("drive-1"), "COMPLETED")
+        service.db.aql.execute.assert_called_once()
+
+    async def test_cached_dict_state_is_copied(self):
+        service = make_arango_service([])
+        key = ("user", "user@example.com", "drive")
+        service._cache_sync_state(key, {"syncState": "IN_PROGRESS"})
+
+        state = service._get_cached_sync_state(key)
+        state["syncState"] = "PAUSED"
+
+        self.assertEqual(
+            service._get_cached_sync_state(key), {"syncState": "IN_PROGRESS"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,14 @@
-import json
-from dataclasses import dataclass
+import re
+import traceback
 from typing import Any, Dict, List
 
+import orjson
 
-@dataclass
-class ChatDocCitation:
-    content: str
-    metadata: Dict[str, Any]
-    chunkindex: int
+# Matches inline citation markers like [1] or [1, 2] in the answer text
+CITATION_PATTERN = re.compile(r"\[([0-9,\s]+)\]")
+
+# Maximum number of characters of the LLM output echoed back on errors
+MAX_RAW_RESPONSE_LENGTH = 4096
 
 
 def fix_json_string(json_str):
@@ -94,8 +95,8 @@ def process_citations(llm_response, documents: List[Dict[str, Any]]) -> Dict[str
                 cleaned_content = fix_json_string(cleaned_content)
 
                 # Try to parse the cleaned content
-                response_data = json.loads(cleaned_content)
-            except json.JSONDecodeError as e:
+                response_data = orjson.loads(cleaned_content)
+            except orjson.JSONDecodeError as e:
                 # If regular parsing fails, try a more lenient approach
                 try:
                     # Sometimes response might be malformed with extra characters
@@ -107,16 +108,16 @@ def process_citations(llm_response, documents: List[Dict[str, Any]]) -> Dict[str
                         potential_json = cleaned_content[start_idx : end_idx + 1]
                         # Apply our fix again on the extracted JSON
                         potential_json = fix_json_string(potential_json)
-                        response_data = json.loads(potential_json)
+                        response_data = orjson.loads(potential_json)
                     else:
                         return {
                             "error": f"Failed to parse LLM response: {str(e)}",
-                            "raw_response": response_content,
+                            "raw_response": response_content[:MAX_RAW_RESPONSE_LENGTH],
                         }
                 except Exception as nested_e:
                     return {
                         "error": f"Failed to parse LLM response: {str(e)}, Nested error: {str(nested_e)}",
-                        "raw_response": response_content,
+                        "raw_response": response_content[:MAX_RAW_RESPONSE_LENGTH],
                     }
         else:
             response_data = response_content
@@ -176,9 +177,7 @@ def process_citations(llm_response, documents: List[Dict[str, Any]]) -> Dict[str
         ):
             answer_text = response_data["answer"]
             # Look for citation patterns like [1] or [1, 2] in the answer
-            import re
-
-            citation_matches = re.findall(r"\[([0-9,\s]+)\]", answer_text)
+            citation_matches = CITATION_PATTERN.findall(answer_text)
             if citation_matches:
                 # Use the first match as our chunk indexes
                 chunk_indexes = citation_matches[0]
@@ -222,47 +221,35 @@ def process_citations(llm_response, documents: List[Dict[str, Any]]) -> Dict[str
                 except (ValueError, TypeError):
                     continue
 
-        # Get citations from referenced documents
-        citations = []
-        for idx in doc_indexes:
-            try:
-                doc = documents[idx]
-
-                # Safely access content and metadata
-                content = doc.get("content", "")
-                metadata = doc.get("metadata", {})
-
-                citation = ChatDocCitation(
-                    content=content, metadata=metadata, chunkindex=idx + 1
-                )
-                citations.append(citation)
-            except (IndexError, KeyError):
-                continue
-
         # Create a result object (either use existing or create new)
         if isinstance(response_data, dict):
             result = response_data.copy()
         else:
             result = {"answer": str(response_data)}
 
-        # Add citations to response
-        result["citations"] = [
-            {
-                "content": cit.content,
-                "chunkIndex": cit.chunkindex,
-                "metadata": cit.metadata,
-                "citationType": "vectordb|document",
-            }
-            for cit in citations
-        ]
+        # Add citations from referenced documents; doc_indexes are already
+        # bounds-checked above, so gather them directly into the response
+        citations = []
+        for idx in doc_indexes:
+            doc = documents[idx]
+            citations.append(
+                {
+                    "content": doc.get("content", ""),
+                    "chunkIndex": idx + 1,
+                    "metadata": doc.get("metadata", {}),
+                    "citationType": "vectordb|document",
+                }
+            )
+        result["citations"] = citations
 
         return result
 
     except Exception as e:
-        import traceback
-
+        # Return only a truncated copy of the content rather than the LLM
+        # response object, which callers would otherwise try to serialize
+        raw_response = getattr(llm_response, "content", llm_response)
         return {
             "error": f"Citation processing failed: {str(e)}",
             "traceback": traceback.format_exc(),
-            "raw_response": llm_response,
+            "raw_response": str(raw_response)[:MAX_RAW_RESPONSE_LENGTH],
         }
@@ -1,20 +1,24 @@
 from datetime import datetime, timezone
+from functools import lru_cache
 
 
 def get_epoch_timestamp_in_ms():
     now = datetime.now(timezone.utc).timestamp()
     return int(now * 1000)
 
+@lru_cache(maxsize=4096)
 def parse_timestamp(timestamp_str: str) -> int:
-    # Remove the 'Z' and add '+00:00' for UTC
-    if timestamp_str.endswith("Z") or timestamp_str.endswith("z"):
+    # Source timestamps repeat a lot (created == modified for new files),
+    # so parsed values are memoized
+    if timestamp_str[-1:] in ("Z", "z"):
+        # Remove the 'Z' and add '+00:00' for UTC
         timestamp_str = timestamp_str[:-1] + "+00:00"
 
     dt = datetime.fromisoformat(timestamp_str)
     timestamp = int(dt.timestamp())
 
     # Check if timestamp is already in milliseconds (13 digits)
-    if len(str(timestamp)) >= 13:
+    if timestamp >= 10**12:
         return timestamp
 
     # Convert seconds to milliseconds